@@ -24,6 +24,7 @@ target_metadata = Base.metadata
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 from rfhub2.config import SQLALCHEMY_DB_URI
+from rfhub2.db.session import tune_sqlite_connections
 
 
 def run_migrations_offline():
@@ -61,6 +62,7 @@ def run_migrations_online():
     connectable = engine_from_config(
         configuration, prefix="sqlalchemy.", poolclass=pool.NullPool
     )
+    tune_sqlite_connections(connectable)
 
     with connectable.connect() as connection:
         context.configure(connection=connection, target_metadata=target_metadata)
@@ -0,0 +1,40 @@
+"""Add keyword statistics rollup table
+
+Revision ID: 3f9c6d2a8b71
+Revises: 7a1e2bd4c9f3
+Create Date: 2026-10-18 14:05:12.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3f9c6d2a8b71"
+down_revision = "7a1e2bd4c9f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "keywordstatisticsrollup",
+        sa.Column("collection", sa.Text(), nullable=False),
+        sa.Column("keyword", sa.Text(), nullable=False),
+        sa.Column("times_used", sa.Integer(), nullable=True),
+        sa.Column("total_elapsed", sa.Integer(), nullable=True),
+        sa.Column("min_elapsed", sa.Integer(), nullable=True),
+        sa.Column("max_elapsed", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("collection", "keyword"),
+    )
+    op.execute(
+        "INSERT INTO keywordstatisticsrollup "
+        "(collection, keyword, times_used, total_elapsed, min_elapsed, max_elapsed) "
+        "SELECT collection, keyword, SUM(times_used), SUM(total_elapsed), "
+        "MIN(min_elapsed), MAX(max_elapsed) "
+        "FROM keywordstatistics GROUP BY collection, keyword"
+    )
+
+
+def downgrade():
+    op.drop_table("keywordstatisticsrollup")
@@ -0,0 +1,103 @@
+"""Add full-text index of keyword name and documentation
+
+Revision ID: 5b8e41c07d2a
+Revises: 3f9c6d2a8b71
+Create Date: 2026-10-18 15:22:47.904113
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "5b8e41c07d2a"
+down_revision = "3f9c6d2a8b71"
+branch_labels = None
+depends_on = None
+
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE keyword_fts USING fts5(
+        name, doc, content='keyword', content_rowid='id', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER keyword_fts_insert AFTER INSERT ON keyword BEGIN
+        INSERT INTO keyword_fts(rowid, name, doc) VALUES (new.id, new.name, new.doc);
+    END
+    """,
+    """
+    CREATE TRIGGER keyword_fts_delete AFTER DELETE ON keyword BEGIN
+        INSERT INTO keyword_fts(keyword_fts, rowid, name, doc)
+        VALUES ('delete', old.id, old.name, old.doc);
+    END
+    """,
+    """
+    CREATE TRIGGER keyword_fts_update AFTER UPDATE OF name, doc ON keyword BEGIN
+        INSERT INTO keyword_fts(keyword_fts, rowid, name, doc)
+        VALUES ('delete', old.id, old.name, old.doc);
+        INSERT INTO keyword_fts(rowid, name, doc) VALUES (new.id, new.name, new.doc);
+    END
+    """,
+    "INSERT INTO keyword_fts(keyword_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER keyword_fts_update",
+    "DROP TRIGGER keyword_fts_delete",
+    "DROP TRIGGER keyword_fts_insert",
+    "DROP TABLE keyword_fts",
+]
+
+# generated columns require PostgreSQL 12, so the vector is maintained by trigger instead
+POSTGRES_UPGRADE = [
+    "ALTER TABLE keyword ADD COLUMN search_vector tsvector",
+    """
+    CREATE FUNCTION keyword_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        new.search_vector :=
+            setweight(to_tsvector('simple', coalesce(new.name, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(new.doc, '')), 'B');
+        RETURN new;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER keyword_search_vector_update
+    BEFORE INSERT OR UPDATE OF name, doc ON keyword
+    FOR EACH ROW EXECUTE PROCEDURE keyword_search_vector_update()
+    """,
+    """
+    UPDATE keyword SET search_vector =
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(doc, '')), 'B')
+    """,
+    "CREATE INDEX ix_keyword_search_vector ON keyword USING GIN (search_vector)",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX ix_keyword_search_vector",
+    "DROP TRIGGER keyword_search_vector_update ON keyword",
+    "DROP FUNCTION keyword_search_vector_update()",
+    "ALTER TABLE keyword DROP COLUMN search_vector",
+]
+
+
+def execute_for_dialect(sqlite_statements, postgres_statements):
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        statements = sqlite_statements
+    elif dialect == "postgresql":
+        statements = postgres_statements
+    else:
+        statements = []
+    for statement in statements:
+        op.execute(statement)
+
+
+def upgrade():
+    execute_for_dialect(SQLITE_UPGRADE, POSTGRES_UPGRADE)
+
+
+def downgrade():
+    execute_for_dialect(SQLITE_DOWNGRADE, POSTGRES_DOWNGRADE)
@@ -0,0 +1,28 @@
+"""Add rendered synopsis and html_doc columns to collection and keyword
+
+Revision ID: 7a1e2bd4c9f3
+Revises: d3ab100869e0
+Create Date: 2026-10-18 10:12:41.503127
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7a1e2bd4c9f3"
+down_revision = "d3ab100869e0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table in ("collection", "keyword"):
+        op.add_column(table, sa.Column("synopsis", sa.Text, nullable=True))
+        op.add_column(table, sa.Column("html_doc", sa.Text, nullable=True))
+
+
+def downgrade():
+    for table in ("collection", "keyword"):
+        op.drop_column(table, "html_doc")
+        op.drop_column(table, "synopsis")
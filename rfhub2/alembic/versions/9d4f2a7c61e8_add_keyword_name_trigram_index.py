@@ -0,0 +1,117 @@
+"""Add trigram index of keyword names
+
+Revision ID: 9d4f2a7c61e8
+Revises: 5b8e41c07d2a
+Create Date: 2026-10-18 16:48:03.217655
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.exc import DBAPIError
+import warnings
+
+
+# revision identifiers, used by Alembic.
+revision = "9d4f2a7c61e8"
+down_revision = "5b8e41c07d2a"
+branch_labels = None
+depends_on = None
+
+
+# trigram tokenizer is available since SQLite 3.34.0
+SQLITE_TRIGRAM_VERSION = (3, 34, 0)
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE keyword_trigram USING fts5(
+        name, content='keyword', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER keyword_trigram_insert AFTER INSERT ON keyword BEGIN
+        INSERT INTO keyword_trigram(rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+    """
+    CREATE TRIGGER keyword_trigram_delete AFTER DELETE ON keyword BEGIN
+        INSERT INTO keyword_trigram(keyword_trigram, rowid, name)
+        VALUES ('delete', old.id, old.name);
+    END
+    """,
+    """
+    CREATE TRIGGER keyword_trigram_update AFTER UPDATE OF name ON keyword BEGIN
+        INSERT INTO keyword_trigram(keyword_trigram, rowid, name)
+        VALUES ('delete', old.id, old.name);
+        INSERT INTO keyword_trigram(rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+    "INSERT INTO keyword_trigram(keyword_trigram) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS keyword_trigram_update",
+    "DROP TRIGGER IF EXISTS keyword_trigram_delete",
+    "DROP TRIGGER IF EXISTS keyword_trigram_insert",
+    "DROP TABLE IF EXISTS keyword_trigram",
+]
+
+POSTGRES_UPGRADE = [
+    "CREATE INDEX ix_keyword_name_trgm ON keyword USING GIN (lower(name) gin_trgm_ops)"
+]
+
+POSTGRES_DOWNGRADE = ["DROP INDEX IF EXISTS ix_keyword_name_trgm"]
+
+
+def sqlite_supports_trigrams(bind) -> bool:
+    version = bind.execute(sa.text("SELECT sqlite_version()")).scalar()
+    return tuple(int(part) for part in version.split(".")) >= SQLITE_TRIGRAM_VERSION
+
+
+def postgres_has_trigrams(bind) -> bool:
+    """
+    Returns True when pg_trgm extension is installed in database or could be created.
+    Creating extension requires superuser or database owner role, so without it
+    the index is skipped and fuzzy search falls back to matching with LIKE.
+    """
+    if bind.execute(
+        sa.text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    ).first():
+        return True
+    reason = "it is not available on the server"
+    if bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).first():
+        savepoint = bind.begin_nested()
+        try:
+            bind.execute(sa.text("CREATE EXTENSION pg_trgm"))
+            savepoint.commit()
+            return True
+        except DBAPIError as e:
+            savepoint.rollback()
+            reason = f"it could not be created: {e.orig}"
+    warnings.warn(
+        f"Trigram index of keyword names is not created, since pg_trgm extension "
+        f"is not installed and {reason}. To use the index, install the extension "
+        f"as superuser and run: {POSTGRES_UPGRADE[0]}"
+    )
+    return False
+
+
+def execute_for_dialect(sqlite_statements, postgres_statements):
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite" and sqlite_supports_trigrams(bind):
+        statements = sqlite_statements
+    elif bind.dialect.name == "postgresql" and postgres_has_trigrams(bind):
+        statements = postgres_statements
+    else:
+        statements = []
+    for statement in statements:
+        op.execute(statement)
+
+
+def upgrade():
+    execute_for_dialect(SQLITE_UPGRADE, POSTGRES_UPGRADE)
+
+
+def downgrade():
+    execute_for_dialect(SQLITE_DOWNGRADE, POSTGRES_DOWNGRADE)
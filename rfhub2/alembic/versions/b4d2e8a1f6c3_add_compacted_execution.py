@@ -0,0 +1,29 @@
+"""Add table of execution times merged by statistics compaction
+
+Revision ID: b4d2e8a1f6c3
+Revises: e1b7c3f05a94
+Create Date: 2026-10-19 10:12:41.503318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b4d2e8a1f6c3"
+down_revision = "e1b7c3f05a94"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "compactedexecution",
+        sa.Column("collection", sa.Text(), nullable=False),
+        sa.Column("execution_time", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("collection", "execution_time"),
+    )
+
+
+def downgrade():
+    op.drop_table("compactedexecution")
@@ -0,0 +1,24 @@
+"""Add content fingerprint column to collection
+
+Revision ID: e1b7c3f05a94
+Revises: 9d4f2a7c61e8
+Create Date: 2026-10-18 21:07:19.384512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e1b7c3f05a94"
+down_revision = "9d4f2a7c61e8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("collection", sa.Column("fingerprint", sa.Text, nullable=True))
+
+
+def downgrade():
+    op.drop_column("collection", "fingerprint")
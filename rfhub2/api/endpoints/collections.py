@@ -3,50 +3,113 @@ from starlette.responses import Response
 from typing import List, Optional
 
 from rfhub2.api.utils.auth import is_authenticated
-from rfhub2.api.utils.db import get_collection_repository
+from rfhub2.api.utils.db import (
+    get_async_collection_repository,
+    get_collection_repository,
+)
 from rfhub2.api.utils.http import or_404
 from rfhub2.api.utils.order import get_ordering
+from rfhub2.api.utils.pagination import get_cursor, paginated
 from rfhub2.db.base import Collection as DBCollection
+from rfhub2.db.repository.async_repository import AsyncRepository
 from rfhub2.db.repository.collection_repository import CollectionRepository
 from rfhub2.db.repository.ordering import OrderingItem
-from rfhub2.model import Collection, CollectionUpdate, CollectionWithStats
+from rfhub2.db.repository.pagination import Cursor
+from rfhub2.model import (
+    Collection,
+    CollectionFingerprint,
+    CollectionsInserted,
+    CollectionsSynced,
+    CollectionSyncItem,
+    CollectionSummary,
+    CollectionUpdate,
+    CollectionUpdateWithKeywords,
+    CollectionWithStats,
+)
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[Collection])
-def get_collections(
-    repository: CollectionRepository = Depends(get_collection_repository),
+async def get_collections(
+    *,
+    repository: AsyncRepository = Depends(get_async_collection_repository),
     skip: int = 0,
     limit: int = 100,
     pattern: str = None,
     libtype: str = None,
     ordering: List[OrderingItem] = Depends(get_ordering),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    response: Response,
 ):
-    return repository.get_all(
-        skip=skip, limit=limit, pattern=pattern, libtype=libtype, ordering=ordering
+    return await paginated(
+        response,
+        repository.get_all(
+            skip=skip,
+            limit=limit,
+            pattern=pattern,
+            libtype=libtype,
+            ordering=ordering,
+            cursor=cursor,
+        ),
     )
 
 
 @router.get("/stats/", response_model=List[CollectionWithStats])
-def get_collections_with_stats(
-    repository: CollectionRepository = Depends(get_collection_repository),
+async def get_collections_with_stats(
+    *,
+    repository: AsyncRepository = Depends(get_async_collection_repository),
     skip: int = 0,
     limit: int = 100,
     pattern: str = None,
     libtype: str = None,
     ordering: List[OrderingItem] = Depends(get_ordering),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    response: Response,
 ):
-    return repository.get_all_with_stats(
-        skip=skip, limit=limit, pattern=pattern, libtype=libtype, ordering=ordering
+    return await paginated(
+        response,
+        repository.get_all_with_stats(
+            skip=skip,
+            limit=limit,
+            pattern=pattern,
+            libtype=libtype,
+            ordering=ordering,
+            cursor=cursor,
+        ),
+    )
+
+
+@router.get("/summary/", response_model=List[CollectionSummary])
+async def get_collection_summaries(
+    *,
+    repository: AsyncRepository = Depends(get_async_collection_repository),
+    skip: int = 0,
+    limit: int = 100,
+    pattern: str = None,
+    libtype: str = None,
+    ordering: List[OrderingItem] = Depends(get_ordering),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    response: Response,
+):
+    return await paginated(
+        response,
+        repository.get_all_summaries(
+            skip=skip,
+            limit=limit,
+            pattern=pattern,
+            libtype=libtype,
+            ordering=ordering,
+            cursor=cursor,
+        ),
     )
 
 
 @router.get("/stats/{id}/", response_model=CollectionWithStats)
-def get_collection_with_stats(
-    *, repository: CollectionRepository = Depends(get_collection_repository), id: int
+async def get_collection_with_stats(
+    *, repository: AsyncRepository = Depends(get_async_collection_repository), id: int
 ):
-    collection: Optional[CollectionWithStats] = repository.get_with_stats(id)
+    collection: Optional[CollectionWithStats] = await repository.get_with_stats(id)
     return or_404(collection)
 
 
@@ -69,6 +132,41 @@ def create_collection(
     return db_collection.to_model()
 
 
+@router.post("/bulk/", response_model=CollectionsInserted, status_code=201)
+def create_collections_with_keywords(
+    *,
+    _: bool = Depends(is_authenticated),
+    repository: CollectionRepository = Depends(get_collection_repository),
+    collections: List[CollectionUpdateWithKeywords],
+):
+    inserted_collections, inserted_keywords = repository.add_many_with_keywords(
+        collections
+    )
+    return CollectionsInserted(
+        collections=inserted_collections, keywords=inserted_keywords
+    )
+
+
+@router.post("/sync/", response_model=CollectionsSynced)
+def sync_collections(
+    *,
+    _: bool = Depends(is_authenticated),
+    repository: CollectionRepository = Depends(get_collection_repository),
+    collections: List[CollectionSyncItem],
+    remove_missing: bool = True,
+):
+    return repository.sync(collections, remove_missing)
+
+
+@router.post("/changed/", response_model=List[CollectionFingerprint])
+def get_changed_collections(
+    *,
+    repository: CollectionRepository = Depends(get_collection_repository),
+    fingerprints: List[CollectionFingerprint],
+):
+    return repository.get_changed(fingerprints)
+
+
 @router.put("/{id}/", response_model=Collection)
 def update_collection(
     *,
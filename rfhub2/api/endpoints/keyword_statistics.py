@@ -1,19 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.exc import IntegrityError
 from starlette.responses import Response
-from typing import List
+from typing import List, Optional
 
 from rfhub2.api.utils.auth import is_authenticated
-from rfhub2.api.utils.db import get_keyword_statistics_repository
+from rfhub2.api.utils.db import (
+    get_async_keyword_statistics_repository,
+    get_keyword_statistics_repository,
+)
 from rfhub2.api.utils.order import get_ordering
+from rfhub2.api.utils.pagination import get_cursor, paginated
 from rfhub2.db.base import KeywordStatistics as DBStatistics
+from rfhub2.db.repository.async_repository import AsyncRepository
 from rfhub2.db.repository.ordering import OrderingItem
+from rfhub2.db.repository.pagination import Cursor
 from rfhub2.db.repository.keyword_statistics_repository import (
     AggregatedKeywordStatistics,
+    CompactedExecutionError,
     KeywordStatisticsFilterParams,
     KeywordStatisticsRepository,
 )
-from rfhub2.model import KeywordStatistics, StatisticsDeleted, StatisticsInserted
+from rfhub2.model import (
+    KeywordStatistics,
+    StatisticsBucket,
+    StatisticsCompacted,
+    StatisticsDeleted,
+    StatisticsInserted,
+)
 
 router = APIRouter()
 
@@ -27,29 +41,34 @@ class DuplicatedStatisticsException(HTTPException):
 
 
 @router.get("/aggregated/", response_model=AggregatedKeywordStatistics)
-def get_aggregated(
+async def get_aggregated(
     *,
-    repository: KeywordStatisticsRepository = Depends(
-        get_keyword_statistics_repository
-    ),
+    repository: AsyncRepository = Depends(get_async_keyword_statistics_repository),
     filter_params: KeywordStatisticsFilterParams = Depends(),
 ):
-    return repository.get_aggregated(filter_params)
+    return await repository.get_aggregated(filter_params)
 
 
 @router.get("/", response_model=List[KeywordStatistics])
-def get_statistics(
+async def get_statistics(
     *,
-    repository: KeywordStatisticsRepository = Depends(
-        get_keyword_statistics_repository
-    ),
+    repository: AsyncRepository = Depends(get_async_keyword_statistics_repository),
     filter_params: KeywordStatisticsFilterParams = Depends(),
     skip: int = 0,
     limit: int = 100,
     ordering: List[OrderingItem] = Depends(get_ordering),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    response: Response,
 ):
-    return repository.get_many(
-        filter_params=filter_params, skip=skip, limit=limit, ordering=ordering
+    return await paginated(
+        response,
+        repository.get_many(
+            filter_params=filter_params,
+            skip=skip,
+            limit=limit,
+            ordering=ordering,
+            cursor=cursor,
+        ),
     )
 
 
@@ -68,10 +87,25 @@ def create_statistics(
     try:
         inserted: int = repository.add_many(db_statistics)
         return StatisticsInserted(inserted=inserted)
-    except IntegrityError:
+    except (IntegrityError, CompactedExecutionError):
         raise DuplicatedStatisticsException()
 
 
+@router.post("/compact/", response_model=StatisticsCompacted)
+def compact_statistics(
+    *,
+    _: bool = Depends(is_authenticated),
+    repository: KeywordStatisticsRepository = Depends(
+        get_keyword_statistics_repository
+    ),
+    older_than_days: int = Query(..., ge=0),
+    bucket: StatisticsBucket = StatisticsBucket.DAY,
+):
+    # execution time is stored without timezone, so cutoff is naive UTC time as well
+    older_than = datetime.utcnow() - timedelta(days=older_than_days)
+    return repository.compact(older_than, bucket)
+
+
 @router.delete("/")
 def delete_statistics(
     *,
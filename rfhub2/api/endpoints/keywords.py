@@ -3,13 +3,22 @@ from starlette.responses import Response
 from typing import List, Optional
 
 from rfhub2.api.utils.auth import is_authenticated
-from rfhub2.api.utils.db import get_collection_repository, get_keyword_repository
+from rfhub2.api.utils.db import (
+    get_async_keyword_repository,
+    get_collection_repository,
+    get_keyword_repository,
+    get_keyword_search_index,
+)
 from rfhub2.api.utils.http import or_404
 from rfhub2.api.utils.order import get_ordering
+from rfhub2.api.utils.pagination import get_cursor, paginated
 from rfhub2.db.base import Collection as DBCollection, Keyword as DBKeyword
+from rfhub2.db.repository.async_repository import AsyncRepository
 from rfhub2.db.repository.collection_repository import CollectionRepository
 from rfhub2.db.repository.keyword_repository import KeywordRepository
 from rfhub2.db.repository.ordering import OrderingItem
+from rfhub2.db.repository.pagination import Cursor
+from rfhub2.db.search_index import KeywordSearchIndex
 from rfhub2.model import Keyword, KeywordCreate, KeywordUpdate, KeywordWithStats
 from rfhub2.ui.search_params import SearchParams
 
@@ -17,59 +26,83 @@ router = APIRouter()
 
 
 @router.get("/", response_model=List[Keyword])
-def get_keywords(
-    repository: KeywordRepository = Depends(get_keyword_repository),
+async def get_keywords(
+    *,
+    repository: AsyncRepository = Depends(get_async_keyword_repository),
     skip: int = 0,
     limit: int = 100,
     pattern: str = None,
     use_doc: bool = True,
     collection_id: Optional[int] = None,
     ordering: List[OrderingItem] = Depends(get_ordering),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    response: Response,
 ):
-    return repository.get_all(
-        skip=skip,
-        limit=limit,
-        pattern=pattern,
-        collection_id=collection_id,
-        use_doc=use_doc,
-        ordering=ordering,
+    return await paginated(
+        response,
+        repository.get_all(
+            skip=skip,
+            limit=limit,
+            pattern=pattern,
+            collection_id=collection_id,
+            use_doc=use_doc,
+            ordering=ordering,
+            cursor=cursor,
+        ),
     )
 
 
 @router.get("/stats/", response_model=List[KeywordWithStats])
-def get_keywords_with_stats(
-    repository: KeywordRepository = Depends(get_keyword_repository),
+async def get_keywords_with_stats(
+    *,
+    repository: AsyncRepository = Depends(get_async_keyword_repository),
     skip: int = 0,
     limit: int = 100,
     pattern: str = None,
     use_doc: bool = True,
     collection_id: Optional[int] = None,
     ordering: List[OrderingItem] = Depends(get_ordering),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    response: Response,
 ):
-    return repository.get_all_with_stats(
-        skip=skip,
-        limit=limit,
-        pattern=pattern,
-        collection_id=collection_id,
-        use_doc=use_doc,
-        ordering=ordering,
+    return await paginated(
+        response,
+        repository.get_all_with_stats(
+            skip=skip,
+            limit=limit,
+            pattern=pattern,
+            collection_id=collection_id,
+            use_doc=use_doc,
+            ordering=ordering,
+            cursor=cursor,
+        ),
     )
 
 
 @router.get("/search/", response_model=List[Keyword])
-def search_keywords(
+async def search_keywords(
     *,
-    repository: KeywordRepository = Depends(get_keyword_repository),
+    repository: AsyncRepository = Depends(get_async_keyword_repository),
+    search_index: Optional[KeywordSearchIndex] = Depends(get_keyword_search_index),
     params: SearchParams = Depends(),
+    fuzzy: bool = False,
     skip: int = 0,
     limit: int = 100,
     ordering: List[OrderingItem] = Depends(get_ordering),
 ):
-    return repository.get_all(
+    if search_index is not None and not ordering and not fuzzy:
+        keywords = search_index.search(
+            params.pattern, params.collection_name, params.use_doc, params.use_tags
+        )
+        if keywords is not None:
+            return keywords[skip : skip + limit]
+    return await repository.get_all(
         pattern=params.pattern,
         collection_name=params.collection_name,
         use_doc=params.use_doc,
         use_tags=params.use_tags,
+        full_text=True,
+        fuzzy=fuzzy,
         skip=skip,
         limit=limit,
         ordering=ordering,
@@ -77,10 +110,10 @@ def search_keywords(
 
 
 @router.get("/stats/{id}/", response_model=KeywordWithStats)
-def get_keyword_with_stats(
-    *, repository: KeywordRepository = Depends(get_keyword_repository), id: int
+async def get_keyword_with_stats(
+    *, repository: AsyncRepository = Depends(get_async_keyword_repository), id: int
 ):
-    keyword: Optional[KeywordWithStats] = repository.get_with_stats(id)
+    keyword: Optional[KeywordWithStats] = await repository.get_with_stats(id)
     return or_404(keyword)
 
 
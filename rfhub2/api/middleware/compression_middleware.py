@@ -0,0 +1,172 @@
+import zlib
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+
+Compressor = Tuple[Callable[[bytes], bytes], Callable[[], bytes]]
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """
+    Returns encodings from Accept-Encoding header with their quality values.
+    """
+    encodings = {}
+    for item in (accept_encoding or "").split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        encodings[name.strip().lower()] = quality
+    return encodings
+
+
+def preferred_encodings(accept_encoding: Optional[str]) -> List[str]:
+    """
+    Returns encodings supported by application and accepted by client,
+    the best compressing one first. Brotli is supported when brotli package is installed.
+    """
+    accepted = accepted_encodings(accept_encoding)
+    supported = ["br", "gzip"] if brotli is not None else ["gzip"]
+    return [
+        encoding
+        for encoding in supported
+        if accepted.get(encoding, accepted.get("*", 0)) > 0
+    ]
+
+
+def create_compressor(
+    encoding: str, gzip_level: int, brotli_quality: int
+) -> Compressor:
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=brotli_quality)
+        return compressor.process, compressor.finish
+    compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress, compressor.flush
+
+
+def weak_etag(etag: str) -> str:
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+def is_weak_etag_requested(etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Checks if client validates weak form of given ETag,
+    which it received with compressed response.
+    """
+    candidates = (candidate.strip() for candidate in (if_none_match or "").split(","))
+    return weak_etag(etag) in candidates
+
+
+class CompressionMiddleware:
+    """
+    Compresses JSON, text and script responses with brotli or gzip,
+    depending on encodings accepted by client.
+    Responses smaller than minimum size, already encoded ones
+    and responses of other media types are sent as they are.
+    ETag of compressed response is made weak, since its bytes differ
+    from the uncompressed representation. Not modified response keeps
+    the form of ETag validated by client, since its size is not known.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request_headers = Headers(scope=scope)
+        encodings = (
+            preferred_encodings(request_headers.get("accept-encoding"))
+            if scope["type"] == "http"
+            else []
+        )
+        if not encodings:
+            await self.app(scope, receive, send)
+            return
+        start: Message = {}
+        compressor: Optional[Compressor] = None
+        started = False
+
+        async def compress(message: Message) -> None:
+            nonlocal compressor, started
+            if message["type"] == "http.response.start":
+                start.update(message, headers=list(message.get("headers", [])))
+                return
+            if message["type"] != "http.response.body" or started and not compressor:
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if not started:
+                started = True
+                headers = MutableHeaders(raw=start["headers"])
+                if (
+                    start["status"] == 304
+                    and "etag" in headers
+                    and is_weak_etag_requested(
+                        headers["etag"], request_headers.get("if-none-match")
+                    )
+                ):
+                    headers["etag"] = weak_etag(headers["etag"])
+                if not self._is_compressible(headers):
+                    await send(start)
+                    await send(message)
+                    return
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body and len(body) < self.minimum_size:
+                    await send(start)
+                    await send(message)
+                    return
+                compressor = create_compressor(
+                    encodings[0], self.gzip_level, self.brotli_quality
+                )
+                headers["content-encoding"] = encodings[0]
+                if "etag" in headers:
+                    headers["etag"] = weak_etag(headers["etag"])
+                if "content-length" in headers:
+                    del headers["content-length"]
+                if not more_body:
+                    body = compressor[0](body) + compressor[1]()
+                    headers["content-length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(start)
+            process, finish = compressor
+            chunk = process(body) + (b"" if more_body else finish())
+            await send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, compress)
+
+    @staticmethod
+    def _is_compressible(headers: MutableHeaders) -> bool:
+        return "content-encoding" not in headers and headers.get(
+            "content-type", ""
+        ).startswith(COMPRESSIBLE_TYPES)
@@ -1,12 +0,0 @@
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-
-from rfhub2.db.session import Session
-
-
-class DbSessionMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
-        request.state.db = Session()
-        response = await call_next(request)
-        request.state.db.close()
-        return response
@@ -0,0 +1,79 @@
+import zlib
+from starlette.datastructures import Headers
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Collection
+
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+class GzipRequestMiddleware:
+    """
+    Decompresses request bodies sent with Content-Encoding: gzip to write endpoints,
+    so that clients can upload large documentation and statistics compressed.
+    Decompression runs before authentication, so decompressed size is limited
+    and request is rejected as soon as the limit is exceeded, protecting application
+    against decompression bombs.
+    Other requests pass through untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_size: int,
+        path_prefix: str = "/api/v1/",
+        methods: Collection[str] = WRITE_METHODS,
+    ) -> None:
+        self.app = app
+        self.max_size = max_size
+        self.path_prefix = path_prefix
+        self.methods = methods
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in self.methods
+            or not scope["path"].startswith(self.path_prefix)
+            or Headers(scope=scope).get("content-encoding", "").lower() != "gzip"
+        ):
+            await self.app(scope, receive, send)
+            return
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks = []
+        size = 0
+        more_body = True
+        try:
+            while more_body:
+                message = await receive()
+                more_body = message.get("more_body", False)
+                chunk = decompressor.decompress(
+                    message.get("body", b""), self.max_size - size + 1
+                )
+                size += len(chunk)
+                if size > self.max_size or decompressor.unconsumed_tail:
+                    response = PlainTextResponse("Request body too large", 413)
+                    await response(scope, receive, send)
+                    return
+                chunks.append(chunk)
+            chunks.append(decompressor.flush())
+        except zlib.error:
+            response = PlainTextResponse("Invalid gzip request body", 400)
+            await response(scope, receive, send)
+            return
+        body = b"".join(chunks)
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+        sent = False
+
+        async def receive_decompressed() -> Message:
+            nonlocal sent
+            if sent:
+                return await receive()
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app({**scope, "headers": headers}, receive_decompressed, send)
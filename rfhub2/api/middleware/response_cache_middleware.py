@@ -0,0 +1,166 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from rfhub2.db.data_version import data_version
+
+CacheKey = Tuple[str, str]
+
+CACHED_PATHS = ("/api/v1/collections/", "/api/v1/keywords/", "/api/v1/statistics/")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    headers: Dict[str, str]
+    etag: str
+
+
+def compute_etag(body: bytes) -> str:
+    return f'"{sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Compares ETag with If-None-Match header using weak comparison, as RFC 7232 requires.
+    """
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in (
+        candidate[2:] if candidate.startswith("W/") else candidate
+        for candidate in candidates
+    )
+
+
+class ResponseCache:
+    """
+    Least recently used cache of response bodies, thread-safe.
+    Cache is bounded by number of entries and total size of bodies.
+    Entries are valid only for data version they were computed for,
+    so the whole cache is cleared when newer version is seen.
+    """
+
+    def __init__(self, max_size: int, max_bytes: int) -> None:
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.version: Optional[int] = None
+        self._items: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: CacheKey, version: int) -> Optional[CachedResponse]:
+        with self._lock:
+            if not self._is_current(version):
+                return None
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+            return item
+
+    def put(self, key: CacheKey, item: CachedResponse, version: int) -> None:
+        with self._lock:
+            if not self._is_current(version) or len(item.body) > self.max_bytes:
+                return
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= len(previous.body)
+            self._items[key] = item
+            self.size_bytes += len(item.body)
+            while len(self._items) > self.max_size or self.size_bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size_bytes -= len(evicted.body)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def _is_current(self, version: int) -> bool:
+        """
+        Clears cache when newer data version is seen.
+        Returns False for older version, so responses computed
+        before data change are not stored.
+        """
+        if self.version is None or version > self.version:
+            self._clear()
+            self.version = version
+        return version == self.version
+
+    def _clear(self) -> None:
+        self._items.clear()
+        self.size_bytes = 0
+
+
+class ResponseCacheMiddleware:
+    """
+    Serves repeated GET requests of read endpoints from memory until data changes,
+    and answers with 304 Not Modified when client already has current response.
+    Responses are cached by path and query string for current data version,
+    which is bumped by every committed change, so stale entries are dropped
+    as soon as data changes.
+    Implemented as plain ASGI middleware, so other requests pass through untouched.
+    It has to be added inside CORS middleware, which sets headers depending on request origin.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_size: int,
+        max_bytes: int,
+        paths: Sequence[str] = CACHED_PATHS,
+    ) -> None:
+        self.app = app
+        self.cache = ResponseCache(max_size, max_bytes)
+        self.paths = tuple(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+        key = (scope["path"], scope["query_string"].decode())
+        version = data_version.value
+        cached = self.cache.get(key, version)
+        if cached is None:
+            start: Message = {}
+            chunks: List[bytes] = []
+
+            async def capture(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    start.update(message)
+                elif message["type"] == "http.response.body":
+                    chunks.append(message.get("body", b""))
+
+            await self.app(scope, receive, capture)
+            body = b"".join(chunks)
+            if start["status"] != 200:
+                await send(start)
+                await send({"type": "http.response.body", "body": body})
+                return
+            etag = compute_etag(body)
+            headers = {
+                **Headers(raw=start["headers"]),
+                "etag": etag,
+                "cache-control": "no-cache",
+            }
+            cached = CachedResponse(body=body, headers=headers, etag=etag)
+            self.cache.put(key, cached, version)
+        if etag_matches(cached.etag, Headers(scope=scope).get("if-none-match")):
+            response = Response(
+                status_code=304,
+                headers={"etag": cached.etag, "cache-control": "no-cache"},
+            )
+        else:
+            response = Response(content=cached.body, headers=cached.headers)
+        await response(scope, receive, send)
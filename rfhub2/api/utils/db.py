@@ -1,27 +1,112 @@
-from starlette.requests import Request
+from fastapi import Depends
+from sqlalchemy.orm.session import Session as DbSession
+from starlette.concurrency import run_in_threadpool
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Type
 
+from rfhub2 import config
+
+from rfhub2.db.async_session import get_async_session
+from rfhub2.db.repository.async_repository import (
+    AsyncRepository,
+    AsyncSessionRepository,
+)
+from rfhub2.db.repository.base_repository import BaseRepository
 from rfhub2.db.repository.keyword_repository import KeywordRepository
 from rfhub2.db.repository.collection_repository import CollectionRepository
 from rfhub2.db.repository.keyword_statistics_repository import (
     KeywordStatisticsRepository,
 )
+from rfhub2.db.search_index import KeywordSearchIndex, keyword_search_index
+from rfhub2.db.session import Session
+
+
+def get_db() -> Iterator[DbSession]:
+    """
+    Provides database session to endpoints that need one, closing it after response is sent,
+    also when request handling failed.
+    """
+    session = Session()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def get_collection_repository(db: DbSession = Depends(get_db)) -> CollectionRepository:
+    return CollectionRepository(db)
+
+
+def get_keyword_repository(db: DbSession = Depends(get_db)) -> KeywordRepository:
+    return KeywordRepository(db)
 
 
-def get_collection_repository(request: Request) -> CollectionRepository:
-    return CollectionRepository(request.state.db)
+def get_keyword_statistics_repository(
+    db: DbSession = Depends(get_db)
+) -> KeywordStatisticsRepository:
+    return KeywordStatisticsRepository(db)
 
 
-def get_keyword_repository(request: Request) -> KeywordRepository:
-    return KeywordRepository(request.state.db)
+class ThreadpoolRepository(AsyncRepository):
+    """
+    Runs methods of repository using synchronous session in threadpool, like sync endpoints do.
+    """
 
+    def __init__(self, repository: BaseRepository) -> None:
+        self.repository = repository
 
-def get_keyword_statistics_repository(request: Request) -> KeywordStatisticsRepository:
-    return KeywordStatisticsRepository(request.state.db)
+    async def _run(self, name: str, *args, **kwargs) -> Any:
+        return await run_in_threadpool(getattr(self.repository, name), *args, **kwargs)
+
+
+def async_repository(
+    repository_class: Type[BaseRepository]
+) -> Callable[[], AsyncIterator[AsyncRepository]]:
+    """
+    Returns dependency providing repository for async endpoints,
+    using async session when async database access is enabled,
+    and synchronous session run in threadpool otherwise.
+    Only the session of selected mode is opened for request.
+    """
+
+    async def get_repository() -> AsyncIterator[AsyncRepository]:
+        if config.ASYNC_DB:
+            async with get_async_session()() as session:
+                yield AsyncSessionRepository(session, repository_class)
+            return
+        db = Session()
+        try:
+            yield ThreadpoolRepository(repository_class(db))
+        finally:
+            await run_in_threadpool(db.close)
+
+    return get_repository
+
+
+get_async_collection_repository = async_repository(CollectionRepository)
+get_async_keyword_repository = async_repository(KeywordRepository)
+get_async_keyword_statistics_repository = async_repository(KeywordStatisticsRepository)
+
+
+def get_keyword_search_index() -> Optional[KeywordSearchIndex]:
+    """
+    Provides keyword search index when it is enabled.
+    Database session is opened only when index has to be built.
+    """
+    if not config.SEARCH_INDEX:
+        return None
+    index = keyword_search_index.cached
+    if index is not None:
+        return index
+    db = Session()
+    try:
+        return keyword_search_index.get(db)
+    finally:
+        db.close()
 
 
-def db_healthcheck(request: Request) -> bool:
+def db_healthcheck(db: DbSession = Depends(get_db)) -> bool:
     try:
-        result = request.state.db.execute("select 1")
+        result = db.execute("select 1")
         return next(result) == (1,)
     except Exception as e:
         print(e)
@@ -0,0 +1,69 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from fastapi import HTTPException
+import json
+from starlette.responses import Response
+from typing import Any, Awaitable, Optional
+
+from rfhub2.db.repository.pagination import Cursor, InvalidCursorError, Page
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# fixed format parsed with strptime, since datetime.fromisoformat is not available in Python 3.6
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+
+class InvalidCursorException(HTTPException):
+    def __init__(self):
+        super(InvalidCursorException, self).__init__(
+            status_code=400, detail="Invalid cursor"
+        )
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"datetime": value.strftime(f"{DATETIME_FORMAT}%z")}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        try:
+            return datetime.strptime(value["datetime"], DATETIME_FORMAT)
+        except ValueError:
+            return datetime.strptime(value["datetime"], f"{DATETIME_FORMAT}%z")
+    return value
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    raw = json.dumps([_encode_value(value) for value in cursor], separators=(",", ":"))
+    return urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(encoded: str) -> Cursor:
+    padded = encoded + "=" * (-len(encoded) % 4)
+    values = json.loads(urlsafe_b64decode(padded.encode()))
+    if not isinstance(values, list):
+        raise ValueError(encoded)
+    return [_decode_value(value) for value in values]
+
+
+def get_cursor(cursor: Optional[str] = None) -> Optional[Cursor]:
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursorException()
+
+
+async def paginated(response: Response, page_query: Awaitable[Page]) -> Page:
+    """
+    Returns page of items and exposes cursor of the next page in response header.
+    """
+    try:
+        page = await page_query
+    except InvalidCursorError:
+        raise InvalidCursorException()
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(page.next_cursor)
+    return page
@@ -1,20 +1,54 @@
 from fastapi import FastAPI
-from starlette.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
 
 from rfhub2 import config
 from rfhub2.api.router import api_router
-from rfhub2.api.middleware.db_session_middleware import DbSessionMiddleware
+from rfhub2.api.middleware.compression_middleware import CompressionMiddleware
+from rfhub2.api.middleware.gzip_request_middleware import GzipRequestMiddleware
+from rfhub2.api.middleware.response_cache_middleware import ResponseCacheMiddleware
+from rfhub2.api.utils.pagination import NEXT_CURSOR_HEADER
+from rfhub2.db.search_index import keyword_search_index
+from rfhub2.db.session import Session
+from rfhub2.ui.static_files import PrecompressedStaticFiles
 from rfhub2.ui.ui_router import router as ui_router
 from rfhub2.utils import abs_path
 from rfhub2.version import version
 
 
+def build_search_index() -> None:
+    session = Session()
+    try:
+        keyword_search_index.get(session)
+    finally:
+        session.close()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(title=config.APP_TITLE, version=version)
-    app.mount("/static", StaticFiles(directory=abs_path("static")), name="static")
+    app.mount(
+        "/static", PrecompressedStaticFiles(directory=abs_path("static")), name="static"
+    )
     app.include_router(ui_router)
     app.include_router(api_router, prefix="/api/v1")
-    app.add_middleware(CORSMiddleware, allow_origins=["*"])
-    app.add_middleware(DbSessionMiddleware)
+    # added first, so that CORS headers of cached responses depend on request origin
+    if config.RESPONSE_CACHE_SIZE > 0:
+        app.add_middleware(
+            ResponseCacheMiddleware,
+            max_size=config.RESPONSE_CACHE_SIZE,
+            max_bytes=config.RESPONSE_CACHE_MAX_BYTES,
+        )
+    app.add_middleware(
+        CORSMiddleware, allow_origins=["*"], expose_headers=[NEXT_CURSOR_HEADER]
+    )
+    app.add_middleware(GzipRequestMiddleware, max_size=config.GZIP_REQUEST_MAX_SIZE)
+    # added last, so that cached responses are compressed as well
+    if config.RESPONSE_COMPRESSION:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=config.RESPONSE_COMPRESSION_MIN_SIZE,
+            gzip_level=config.RESPONSE_COMPRESSION_LEVEL,
+            brotli_quality=config.RESPONSE_BROTLI_QUALITY,
+        )
+    if config.SEARCH_INDEX:
+        app.add_event_handler("startup", build_search_index)
     return app
@@ -1,10 +1,25 @@
+import gzip
 from requests import session, Response
-from typing import Dict, Tuple, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Tuple, Optional
+from urllib3.util.retry import Retry
 
-from rfhub2.model import CollectionUpdate, KeywordCreate, KeywordStatisticsList
+from rfhub2.model import (
+    CollectionFingerprintList,
+    CollectionSyncList,
+    CollectionUpdate,
+    CollectionUpdateWithKeywordsList,
+    KeywordCreate,
+    KeywordStatisticsList,
+)
 
 
 API_V1 = "api/v1"
+# statuses meaning that request was not processed by application, so it can be sent again
+UNPROCESSED_STATUS_CODES = frozenset({502, 503})
+RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+# smaller request bodies are sent uncompressed
+GZIP_MIN_SIZE = 1024
 TEST_COLLECTION = {
     "name": "healthcheck_collection",
     "type": "a",
@@ -17,12 +32,41 @@ TEST_COLLECTION = {
 }
 
 
+class ApiRetry(Retry):
+    """
+    Retries idempotent requests on server errors, and other requests only on errors
+    meaning that application did not process them, so that data is not sent twice.
+    Connection errors are retried for all requests.
+    """
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if status_code in UNPROCESSED_STATUS_CODES and status_code in (
+            self.status_forcelist or ()
+        ):
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
 class Client(object):
     """
     API client with methods to populate rfhub2 application.
+    Client can be shared by threads uploading data concurrently,
+    at most `max_connections` requests are in flight at once.
     """
 
-    def __init__(self, app_url: str, user: str, password: str):
+    def __init__(
+        self,
+        app_url: str,
+        user: str,
+        password: str,
+        max_connections: int = 10,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: Tuple[float, float] = (10, 300),
+        compress: bool = True,
+    ):
         self.app_url = app_url
         self.session = session()
         self.api_url = f"{self.app_url}/{API_V1}"
@@ -30,7 +74,23 @@ class Client(object):
         self.session.headers = {
             "Content-Type": "application/json",
             "accept": "application/json",
+            "Accept-Encoding": "gzip",
         }
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_connections,
+            pool_block=True,
+            max_retries=ApiRetry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUS_CODES,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.timeout = timeout
+        self.compress = compress
 
     def get_collections(self, skip: int = 0, limit: int = 100) -> Dict:
         """
@@ -46,6 +106,37 @@ class Client(object):
         """
         return self._post_request(endpoint="collections", data=data.json())
 
+    def add_collections_with_keywords(
+        self, data: CollectionUpdateWithKeywordsList
+    ) -> Tuple[int, Dict]:
+        """
+        Adds collections together with their keywords in single request using request post method.
+        """
+        return self._post_request(endpoint="collections/bulk", data=data.json())
+
+    def get_changed_collections(
+        self, data: CollectionFingerprintList
+    ) -> Tuple[int, List[Dict]]:
+        """
+        Gets collections from given list which are not stored in application
+        with the same fingerprint.
+        """
+        return self._post_request(endpoint="collections/changed", data=data.json())
+
+    def sync_collections(
+        self, data: CollectionSyncList, remove_missing: bool = True
+    ) -> Tuple[int, Dict]:
+        """
+        Makes collections stored in application match given ones in single request,
+        optionally removing collections not present in data.
+        Collections given only by fingerprint are left unchanged.
+        """
+        return self._post_request(
+            endpoint="collections/sync",
+            data=data.json(),
+            params={"remove_missing": str(remove_missing).lower()},
+        )
+
     def delete_collection(self, id: int) -> Response:
         """
         Deletes collection with given id.
@@ -74,15 +165,35 @@ class Client(object):
         """
         Sends get request from given endpoint.
         """
-        request = self.session.get(url=f"{self.api_url}/{endpoint}/", params=params)
+        request = self.session.get(
+            url=f"{self.api_url}/{endpoint}/", params=params, timeout=self.timeout
+        )
         return request.json()
 
-    def _post_request(self, endpoint: str, data: str) -> Tuple[int, Dict]:
+    def _post_request(
+        self, endpoint: str, data: str, params: Optional[Dict] = None
+    ) -> Tuple[int, Dict]:
         """
         Sends post request to collections or keywords endpoint.
-        """
-        request = self.session.post(url=f"{self.api_url}/{endpoint}/", data=data)
-        return request.status_code, request.json()
+        Large bodies are compressed with gzip. Response without JSON body,
+        like error page of a proxy, is returned with its text as detail.
+        """
+        body = data.encode()
+        headers = {}
+        if self.compress and len(body) >= GZIP_MIN_SIZE:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        request = self.session.post(
+            url=f"{self.api_url}/{endpoint}/",
+            data=body,
+            params=params,
+            headers=headers,
+            timeout=self.timeout,
+        )
+        try:
+            return request.status_code, request.json()
+        except ValueError:
+            return request.status_code, {"detail": request.text}
 
     def _delete_request(self, endpoint: str, id: Optional[int] = None) -> Response:
         """
@@ -90,6 +201,10 @@ class Client(object):
         If no id provided then deletes all collections.
         """
         if id:
-            return self.session.delete(url=f"{self.api_url}/{endpoint}/{id}/")
+            return self.session.delete(
+                url=f"{self.api_url}/{endpoint}/{id}/", timeout=self.timeout
+            )
         else:
-            return self.session.delete(url=f"{self.api_url}/{endpoint}/")
+            return self.session.delete(
+                url=f"{self.api_url}/{endpoint}/", timeout=self.timeout
+            )
@@ -3,6 +3,8 @@ from pathlib import Path
 from typing import Tuple, Union
 
 from rfhub2.cli.api_client import Client
+from rfhub2.cli.keywords.extraction_cache import default_cache_path
+from rfhub2.cli.keywords.keywords_extractor import DEFAULT_PRUNE_PATTERNS
 from rfhub2.cli.keywords.keywords_importer import KeywordsImporter
 from rfhub2.cli.statistics.statistics_importer import StatisticsImporter
 
@@ -75,6 +77,48 @@ from rfhub2.cli.statistics.statistics_importer import StatisticsImporter
     "This option has the same behavior as the --exclude option of the RobotFramework CLI (with the same format). "
     "By default, no keyword is excluded.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes used to extract keywords documentation "
+    "or execution statistics from files. "
+    "Default value is 1, which runs extraction in the main process.",
+)
+@click.option(
+    "--uploaders",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of threads sending execution statistics to application concurrently, "
+    "when extraction runs in more than one worker process. Default value is 1.",
+)
+@click.option(
+    "--no-compression",
+    type=click.BOOL,
+    default=False,
+    is_flag=True,
+    help="Flag specifying if package should send request bodies uncompressed, "
+    "needed for applications older than the package.",
+)
+@click.option(
+    "--prune",
+    type=click.STRING,
+    multiple=True,
+    default=DEFAULT_PRUNE_PATTERNS,
+    help="Glob pattern matching names of directories skipped when searching for keywords files. "
+    "Can be used multiple times, provided patterns replace the default ones: "
+    f"{', '.join(DEFAULT_PRUNE_PATTERNS)}.",
+)
+@click.option(
+    "--no-cache",
+    type=click.BOOL,
+    default=False,
+    is_flag=True,
+    help="Flag specifying if package should extract keywords documentation from all files, "
+    "instead of loading documentation of unchanged files from cache "
+    f"stored in {default_cache_path()}.",
+)
 @click.argument("paths", nargs=-1)
 def main(
     app_url: str,
@@ -86,20 +130,35 @@ def main(
     no_installed_keywords: bool,
     include: str,
     exclude: str,
+    jobs: int,
+    prune: Tuple[str, ...],
+    no_cache: bool,
+    uploaders: int,
+    no_compression: bool,
 ) -> None:
     """Package to populate rfhub2 with robot framework keywords
        from libraries and resource files."""
-    client = Client(app_url, user, password)
+    client = Client(
+        app_url, user, password, max_connections=uploaders, compress=not no_compression
+    )
     if mode == "keywords":
         rfhub_importer = KeywordsImporter(
-            client, paths, no_installed_keywords, load_mode, include, exclude
+            client,
+            paths,
+            no_installed_keywords,
+            load_mode,
+            include,
+            exclude,
+            jobs,
+            prune,
+            None if no_cache else default_cache_path(),
         )
         loaded_collections, loaded_keywords = rfhub_importer.import_data()
         print(
             f"\nSuccessfully loaded {loaded_collections} collections with {loaded_keywords} keywords."
         )
     elif mode == "statistics":
-        rfhub_importer = StatisticsImporter(client, paths)
+        rfhub_importer = StatisticsImporter(client, paths, jobs, uploaders)
         loaded_files, loaded_statistics = rfhub_importer.import_data()
         print(
             f"\nSuccessfully loaded {loaded_files} files with {loaded_statistics} statistics."
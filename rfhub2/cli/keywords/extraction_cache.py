@@ -0,0 +1,161 @@
+from hashlib import sha256
+import json
+import os
+from pathlib import Path
+from robot.version import get_version
+import sqlite3
+from typing import List, Optional, Tuple
+
+from rfhub2.model import CollectionUpdate, CollectionUpdateWithKeywords, KeywordUpdate
+
+CACHE_FILE_NAME = "extraction.db"
+IGNORED_DIRECTORIES = {"__pycache__"}
+IGNORED_SUFFIXES = {".pyc", ".pyo"}
+
+
+def default_cache_path() -> Path:
+    """
+    Returns path of extraction cache file, placed in user cache directory.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "rfhub2" / CACHE_FILE_NAME
+
+
+def _files(path: Path) -> List[Path]:
+    """
+    Returns files documented by libdoc for given path, which is either single file
+    or directory of library with init, together with all its modules.
+    """
+    if not path.is_dir():
+        return [path]
+    return sorted(
+        Path(root) / name
+        for root, directories, names in os.walk(path)
+        if not IGNORED_DIRECTORIES.intersection(Path(root).relative_to(path).parts)
+        for name in names
+        if Path(name).suffix not in IGNORED_SUFFIXES
+    )
+
+
+def file_stat(path: Path) -> str:
+    """
+    Returns cheap signature of files from their modification times and sizes.
+    """
+    stats = [file.stat() for file in _files(path)]
+    return (
+        f"{max((stat.st_mtime_ns for stat in stats), default=0)}:"
+        f"{sum(stat.st_size for stat in stats)}:{len(stats)}"
+    )
+
+
+def content_hash(path: Path) -> str:
+    """
+    Returns hash of content and relative paths of files.
+    """
+    digest = sha256()
+    for file in _files(path):
+        digest.update(str(file.relative_to(path) if path.is_dir() else "").encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def serialise_collection(collection: CollectionUpdateWithKeywords) -> str:
+    return json.dumps(
+        {
+            "collection": collection.collection.dict(),
+            "keywords": [keyword.dict() for keyword in collection.keywords],
+        }
+    )
+
+
+def deserialise_collection(data: str) -> CollectionUpdateWithKeywords:
+    item = json.loads(data)
+    return CollectionUpdateWithKeywords(
+        CollectionUpdate(**item["collection"]),
+        [KeywordUpdate(**keyword) for keyword in item["keywords"]],
+    )
+
+
+class ExtractionCache:
+    """
+    Stores extracted collections on disk, so that libdoc is not run again
+    for files which did not change since the previous run.
+    Entries are keyed by path and Robot Framework version. Entry is valid
+    when modification time and size of files did not change or, when they did,
+    content hash of files is still the same.
+    Cache failures are reported and disable the cache instead of failing the import.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.robot_version = get_version()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def __getstate__(self) -> dict:
+        # every worker process opens its own connection
+        return {**self.__dict__, "_connection": None}
+
+    def get(self, path: Path) -> Optional[CollectionUpdateWithKeywords]:
+        """
+        Returns collection extracted previously from unchanged path, if any.
+        """
+        key = (str(path.resolve()), self.robot_version)
+        row = self._execute(
+            "SELECT stat, hash, data FROM extraction WHERE path = ? AND robot_version = ?",
+            key,
+        )
+        if not row:
+            return None
+        stat, hash_, data = row[0]
+        try:
+            current_stat = file_stat(path)
+            if current_stat != stat:
+                if content_hash(path) != hash_:
+                    return None
+                self._execute(
+                    "UPDATE extraction SET stat = ? WHERE path = ? AND robot_version = ?",
+                    (current_stat, *key),
+                )
+        except OSError:
+            return None
+        return deserialise_collection(data)
+
+    def put(self, path: Path, collection: CollectionUpdateWithKeywords) -> None:
+        try:
+            stat, hash_ = file_stat(path), content_hash(path)
+        except OSError:
+            return
+        self._execute(
+            "INSERT OR REPLACE INTO extraction (path, robot_version, stat, hash, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                str(path.resolve()),
+                self.robot_version,
+                stat,
+                hash_,
+                serialise_collection(collection),
+            ),
+        )
+
+    def _execute(self, statement: str, parameters: Tuple) -> List[Tuple]:
+        if self._disabled:
+            return []
+        try:
+            with self._connect() as connection:
+                return connection.execute(statement, parameters).fetchall()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Extraction cache {self.path} disabled: {e}")
+            self._disabled = True
+            return []
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.path), timeout=30)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS extraction ("
+                "path TEXT, robot_version TEXT, stat TEXT, hash TEXT, data TEXT, "
+                "PRIMARY KEY (path, robot_version))"
+            )
+        return self._connection
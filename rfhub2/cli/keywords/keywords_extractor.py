@@ -1,5 +1,7 @@
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
 from importlib.util import find_spec
+import os
 from pathlib import Path
 import re
 from robot.errors import DataError
@@ -7,15 +9,18 @@ from robot.libdocpkg import LibraryDocumentation
 from robot.libdocpkg.model import LibraryDoc, KeywordDoc
 import robot.libraries
 from robot.model import Tags, TagPatterns
-from typing import List, Optional, Set, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
-from rfhub2.model import CollectionUpdate, KeywordUpdate
+from rfhub2.cli.keywords.extraction_cache import ExtractionCache, file_stat
+from rfhub2.model import CollectionUpdate, CollectionUpdateWithKeywords, KeywordUpdate
 
 RESOURCE_PATTERNS = {".robot", ".txt", ".tsv", ".resource"}
 ALL_PATTERNS = RESOURCE_PATTERNS | {".xml", ".py"}
 
 INIT_FILES = {"__init__.txt", "__init__.robot", "__init__.html", "__init__.tsv"}
 
+DEFAULT_PRUNE_PATTERNS = (".git", ".hg", ".svn", "__pycache__", "node_modules")
+
 EXCLUDED_LIBRARIES = {
     "remote.py",
     "reserved.py",
@@ -27,12 +32,6 @@ EXCLUDED_LIBRARIES = {
 }
 
 
-@dataclass
-class CollectionUpdateWithKeywords:
-    collection: CollectionUpdate
-    keywords: List[KeywordUpdate]
-
-
 class KeywordsExtractor:
     def __init__(
         self,
@@ -40,11 +39,23 @@ class KeywordsExtractor:
         no_installed_keywords: bool,
         include: str,
         exclude: str,
+        jobs: int = 1,
+        prune_patterns: Tuple[str, ...] = DEFAULT_PRUNE_PATTERNS,
+        cache_path: Optional[Path] = None,
     ) -> None:
         self.paths = paths
         self.no_installed_keywords = no_installed_keywords
         self.include = include
         self.exclude = exclude
+        self.jobs = jobs
+        self.prune_patterns = prune_patterns
+        self.cache = ExtractionCache(cache_path) if cache_path else None
+        self._libdoc_cache: Dict[Tuple[Path, Optional[str]], LibraryDoc] = {}
+
+    def __getstate__(self) -> dict:
+        # extractor is pickled for every task sent to worker processes,
+        # which document only paths not documented yet by main process
+        return {**self.__dict__, "_libdoc_cache": {}}
 
     def get_libraries_paths(self) -> Set[Path]:
         """
@@ -83,57 +94,130 @@ class KeywordsExtractor:
         Traverses through paths and adds libraries to rfhub.
         Helper function for get_library_paths.
         """
-        valid_lib_paths = set()
         if self._is_library_with_init(path):
-            valid_lib_paths.add(path)
-        else:
-            for item in path.iterdir():
-                if item.is_dir():
-                    if self._is_library_with_init(item):
+            return {path}
+        valid_lib_paths = set()
+        self._walk(path, valid_lib_paths, set(), in_library=False)
+        return valid_lib_paths
+
+    def _walk(
+        self,
+        path: Path,
+        valid_lib_paths: Set[Path],
+        visited: Set[Tuple[int, int]],
+        in_library: bool,
+    ) -> None:
+        """
+        Walks directory tree once, classifying every entry as it is found.
+        Inside library with init only libdoc and resource files are collected.
+        Directories matching prune patterns are skipped, as well as directories
+        already visited, which protects the walk against symlink loops.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        directory_id = (stat.st_dev, stat.st_ino)
+        if directory_id in visited:
+            return
+        visited.add(directory_id)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                item = Path(entry.path)
+                if entry.is_dir():
+                    if self._should_prune(entry.name):
+                        continue
+                    if not in_library and self._is_library_with_init(item):
                         valid_lib_paths.add(item)
-                        if self._robot_files_candidates(item):
-                            valid_lib_paths.update(self._get_valid_robot_files(path))
+                        self._walk(item, valid_lib_paths, visited, in_library=True)
                     else:
-                        valid_lib_paths.update(self._traverse_paths(item))
-                elif (
-                    item.is_file()
-                    and self._is_robot_keyword_file(item)
-                    and not self._should_ignore(item)
-                ):
-                    valid_lib_paths.add(item)
-        return valid_lib_paths
+                        self._walk(item, valid_lib_paths, visited, in_library)
+                elif entry.is_file():
+                    if in_library:
+                        if self._is_libdoc_file(item) or self._is_resource_file(item):
+                            valid_lib_paths.add(item)
+                    elif self._is_robot_keyword_file(item) and not self._should_ignore(
+                        item
+                    ):
+                        valid_lib_paths.add(item)
+
+    def _should_prune(self, directory_name: str) -> bool:
+        return any(fnmatch(directory_name, pattern) for pattern in self.prune_patterns)
 
     def create_collections(
         self, paths: Set[Path]
     ) -> List[CollectionUpdateWithKeywords]:
         """
         Creates list of Collection objects from set of provided paths.
+        When more than one job is configured, libdoc extraction is distributed
+        over a pool of worker processes. Libraries already documented
+        while traversing paths are serialised from libdoc cache instead.
         :param paths: set of paths
         :return: list of Collection objects
         """
-        collections = []
-        for path in paths:
-            try:
-                collection_with_keywords = self.create_collection(path)
-                collections.append(collection_with_keywords)
-            except (DataError, SystemExit) as ex:
-                print(
-                    f"Failed to create collection from path {path}\n"
-                    f"{type(ex).__name__}, {ex.args}"
+        ordered_paths = sorted(paths)
+        pending = [path for path in ordered_paths if not self._is_documented(path)]
+        created = {}
+        if self.jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                created = dict(
+                    zip(pending, executor.map(self._try_create_collection, pending))
                 )
+        results = [
+            created[path] if path in created else self._try_create_collection(path)
+            for path in ordered_paths
+        ]
+        collections = [result for result in results if result]
         return sorted(collections, key=lambda i: i.collection.name)
 
+    def _try_create_collection(
+        self, path: Path
+    ) -> Optional[CollectionUpdateWithKeywords]:
+        """
+        Creates CollectionUpdateWithKeywords object from provided path,
+        reporting libdoc errors instead of raising them.
+        """
+        try:
+            return self.create_collection(path)
+        except (DataError, SystemExit) as ex:
+            print(
+                f"Failed to create collection from path {path}\n"
+                f"{type(ex).__name__}, {ex.args}"
+            )
+            return None
+
     def create_collection(self, path: Path) -> CollectionUpdateWithKeywords:
         """
         Creates CollectionUpdateWithKeywords object from provided path.
         :param path: Path
         :return: CollectionUpdateWithKeywords object
         """
-        libdoc = LibraryDocumentation(str(path))
+        collection = self._get_collection(path)
         return CollectionUpdateWithKeywords(
-            self._serialise_libdoc(libdoc, str(path)), self._serialise_keywords(libdoc)
+            collection.collection,
+            self._filter_keywords(
+                collection.keywords, include=self.include, exclude=self.exclude
+            ),
         )
 
+    def _get_collection(self, path: Path) -> CollectionUpdateWithKeywords:
+        """
+        Returns collection with all keywords documented in provided path,
+        loaded from extraction cache when files did not change since it was stored.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(path)
+            if cached is not None:
+                return cached
+        libdoc = self._get_libdoc(path)
+        collection = CollectionUpdateWithKeywords(
+            self._serialise_libdoc(libdoc, str(path)),
+            self._serialise_all_keywords(libdoc),
+        )
+        if self.cache is not None:
+            self.cache.put(path, collection)
+        return collection
+
     def _serialise_libdoc(self, libdoc: LibraryDoc, path: str) -> CollectionUpdate:
         """
         Serialises LibraryDoc object to CollectionUpdate object.
@@ -158,6 +242,13 @@ class KeywordsExtractor:
         :param :LibraryDoc input object
         :return: KeywordUpdate object
         """
+        return self._filter_keywords(
+            self._serialise_all_keywords(libdoc),
+            include=self.include,
+            exclude=self.exclude,
+        )
+
+    def _serialise_all_keywords(self, libdoc: LibraryDoc) -> List[KeywordUpdate]:
         return [
             KeywordUpdate(
                 name=keyword.name,
@@ -165,9 +256,7 @@ class KeywordsExtractor:
                 tags=self._serialise_tags(keyword.tags),
                 doc=keyword.doc,
             )
-            for keyword in self._filter_keywords(
-                libdoc.keywords, include=self.include, exclude=self.exclude
-            )
+            for keyword in libdoc.keywords
         ]
 
     def _serialise_args(self, args: List[str]) -> str:
@@ -184,14 +273,14 @@ class KeywordsExtractor:
 
     @staticmethod
     def _filter_keywords(
-        keywords: List[KeywordDoc], include: str, exclude: str
-    ) -> List[KeywordDoc]:
+        keywords: List[Union[KeywordDoc, KeywordUpdate]], include: str, exclude: str
+    ) -> List[Union[KeywordDoc, KeywordUpdate]]:
         """
         Filters out keywords based on their tags.
-        :param keywords: list of KeywordDoc objects
+        :param keywords: list of KeywordDoc or KeywordUpdate objects
         :param include: include pattern
         :param exclude: exclude pattern
-        :return: list of filtered KeywordDoc objects
+        :return: list of filtered keywords
         """
         included_keywords = (
             [kw for kw in keywords if TagPatterns(include).match(kw.tags)]
@@ -208,25 +297,30 @@ class KeywordsExtractor:
     def _extract_doc_from_libdoc_inits(self, inits: List) -> str:
         return "\n" + "\n" + "\n".join([d.doc for d in inits]) if len(inits) > 0 else ""
 
-    def _robot_files_candidates(self, path: Path) -> bool:
-        return (
-            len(
-                [file for file in path.glob("**/*") if file.suffix in RESOURCE_PATTERNS]
-            )
-            > 0
-        )
+    def _get_libdoc(self, path: Path) -> LibraryDoc:
+        """
+        Returns LibraryDoc for provided path, so that each library
+        is documented only once per extractor run.
+        Cache key includes modification times and sizes of library files,
+        so library changed during the run is documented again,
+        also when only module inside library directory was changed.
+        """
+        key = self._libdoc_key(path)
+        if key not in self._libdoc_cache:
+            self._libdoc_cache[key] = LibraryDocumentation(str(path))
+        return self._libdoc_cache[key]
 
-    def _get_valid_robot_files(self, path: Path) -> Set[Path]:
-        return {
-            file
-            for file in path.glob("**/*")
-            if (self._is_libdoc_file(file) or self._is_resource_file(file))
-        }
+    def _libdoc_key(self, path: Path) -> Tuple[Path, Optional[str]]:
+        resolved_path = path.resolve()
+        stat = file_stat(resolved_path) if resolved_path.exists() else None
+        return resolved_path, stat
 
-    @staticmethod
-    def _is_library_with_init(path: Path) -> bool:
+    def _is_documented(self, path: Path) -> bool:
+        return self._libdoc_key(path) in self._libdoc_cache
+
+    def _is_library_with_init(self, path: Path) -> bool:
         return (path / "__init__.py").is_file() and len(
-            LibraryDocumentation(str(path)).keywords
+            self._get_collection(path).keywords
         ) > 0
 
     def _is_robot_keyword_file(self, file: Path) -> bool:
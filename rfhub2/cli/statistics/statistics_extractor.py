@@ -1,11 +1,9 @@
-from collections import Counter
 from pathlib import Path
 
 from dataclasses import dataclass
 from datetime import datetime
-from itertools import groupby
-from typing import Callable, Dict, Iterable, List, Tuple
-from xml.etree.ElementTree import Element, parse
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.etree.ElementTree import Element, iterparse
 
 from rfhub2.model import KeywordStatistics
 
@@ -19,14 +17,93 @@ class XmlKeyword:
 
 @dataclass
 class ElapsedStats:
+    times_used: int
     total_elapsed: int
     min_elapsed: int
     max_elapsed: int
 
+    def add(self, elapsed: int) -> None:
+        self.times_used += 1
+        self.total_elapsed += elapsed
+        self.min_elapsed = min(self.min_elapsed, elapsed)
+        self.max_elapsed = max(self.max_elapsed, elapsed)
+
+    @staticmethod
+    def of(elapsed: int) -> "ElapsedStats":
+        return ElapsedStats(
+            times_used=1,
+            total_elapsed=elapsed,
+            min_elapsed=elapsed,
+            max_elapsed=elapsed,
+        )
+
 
 StatsKey = Tuple[str, str]
 
 
+def parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parses robot output.xml timestamp in ``%Y%m%d %H:%M:%S.%f`` format,
+    without the overhead of datetime.strptime.
+    """
+    return datetime(
+        int(timestamp[0:4]),
+        int(timestamp[4:6]),
+        int(timestamp[6:8]),
+        int(timestamp[9:11]),
+        int(timestamp[12:14]),
+        int(timestamp[15:17]),
+        int(timestamp[18:].ljust(6, "0")),
+    )
+
+
+def is_timestamp(value: Optional[str]) -> bool:
+    return value is not None and value[:1].isdigit()
+
+
+@dataclass
+class KeywordFrame:
+    """
+    Execution data of keyword element that is currently open while parsing.
+    Timestamps share fixed format, so they are compared as strings
+    and parsed only once per keyword.
+    """
+
+    library: Optional[str]
+    name: Optional[str]
+    index: int
+    start: Optional[str] = None
+    end: Optional[str] = None
+    passed: bool = False
+
+    def update(self, attrib: Dict[str, str]) -> None:
+        self.merge_times(attrib.get("starttime"), attrib.get("endtime"))
+
+    def merge(self, child: "KeywordFrame") -> None:
+        self.merge_times(child.start, child.end)
+
+    def merge_times(self, start: Optional[str], end: Optional[str]) -> None:
+        if is_timestamp(start) and (self.start is None or start < self.start):
+            self.start = start
+        if is_timestamp(end) and (self.end is None or end > self.end):
+            self.end = end
+
+    @property
+    def elapsed(self) -> int:
+        return int(
+            1000
+            * (parse_timestamp(self.end) - parse_timestamp(self.start)).total_seconds()
+        )
+
+    @staticmethod
+    def of(element: Element, index: int) -> "KeywordFrame":
+        return KeywordFrame(
+            library=element.attrib.get("library"),
+            name=element.attrib.get("sourcename", element.attrib.get("name")),
+            index=index,
+        )
+
+
 def stats_key(keyword: XmlKeyword) -> StatsKey:
     return keyword.library, keyword.name
 
@@ -34,107 +111,109 @@ def stats_key(keyword: XmlKeyword) -> StatsKey:
 class StatisticsExtractor:
     def __init__(self, path: Path):
         self.path: Path = path
-        self.source_time_format: str = "%Y%m%d %H:%M:%S.%f"
         self.destination_time_format: str = "%Y-%m-%d %H:%M:%S.%f"
 
     def compute_statistics(self) -> List[KeywordStatistics]:
         """
         Returns list of KeywordStatistics extracted from single output.xml file
         """
-        keywords = self.parse_xml_keywords()
+        keywords = self.iter_xml_keywords()
         return self.aggregate_statistics(keywords)
 
     def aggregate_statistics(
-        self, keywords: List[XmlKeyword]
+        self, keywords: Iterable[XmlKeyword]
     ) -> List[KeywordStatistics]:
         """
         Returns list of KeywordStatistics grouped by library/keyword pair.
+        Statistics are computed incrementally, so keywords can be consumed as a stream.
         """
         execution_time = self.get_execution_time()
         elapsed_stats = self.get_elapsed_stats(keywords)
-        statistics = []
-        for key, count in Counter(stats_key(keyword) for keyword in keywords).items():
-            stats = elapsed_stats[key]
-            statistics.append(
-                KeywordStatistics(
-                    collection=key[0],
-                    keyword=key[1],
-                    execution_time=execution_time,
-                    times_used=count,
-                    total_elapsed=stats.total_elapsed,
-                    min_elapsed=stats.min_elapsed,
-                    max_elapsed=stats.max_elapsed,
-                )
+        return [
+            KeywordStatistics(
+                collection=key[0],
+                keyword=key[1],
+                execution_time=execution_time,
+                times_used=stats.times_used,
+                total_elapsed=stats.total_elapsed,
+                min_elapsed=stats.min_elapsed,
+                max_elapsed=stats.max_elapsed,
             )
-        return statistics
+            for key, stats in elapsed_stats.items()
+        ]
 
     @staticmethod
-    def get_elapsed_stats(keywords: List[XmlKeyword]) -> Dict[StatsKey, ElapsedStats]:
+    def get_elapsed_stats(
+        keywords: Iterable[XmlKeyword]
+    ) -> Dict[StatsKey, ElapsedStats]:
         """
-        Returns dict of keyword execution stats such as min, max and total elapsed time
-        grouped by library/keyword pair.
+        Returns dict of keyword execution stats such as number of usages, min, max
+        and total elapsed time grouped by library/keyword pair,
+        in order of first keyword occurrence.
         """
         result = {}
-        for key, group in groupby(sorted(keywords, key=stats_key), stats_key):
-            elapsed_times = [kw.elapsed for kw in group]
-            result[key] = ElapsedStats(
-                total_elapsed=sum(elapsed_times),
-                min_elapsed=min(elapsed_times),
-                max_elapsed=max(elapsed_times),
-            )
+        for keyword in keywords:
+            key = stats_key(keyword)
+            if key in result:
+                result[key].add(keyword.elapsed)
+            else:
+                result[key] = ElapsedStats.of(keyword.elapsed)
         return result
 
     def parse_xml_keywords(self) -> List[XmlKeyword]:
         """
         Returns list of XmlKeyword objects containing keywords execution data.
         """
-        xml_keywords = parse(self.path).findall(".//kw")
-        return [
-            XmlKeyword(
-                xml_keyword.attrib.get("library"),
-                xml_keyword.attrib.get("sourcename", xml_keyword.attrib.get("name")),
-                self.calc_elapsed(xml_keyword),
-            )
-            for xml_keyword in xml_keywords
-            if xml_keyword.attrib.get("library") is not None
-            and self.has_keyword_passed(xml_keyword)
-        ]
+        return list(self.iter_xml_keywords())
 
-    @staticmethod
-    def has_keyword_passed(xml_keyword: XmlKeyword) -> bool:
+    def iter_xml_keywords(self) -> Iterator[XmlKeyword]:
         """
-        Checks if keyword has a ``PASS`` status in output.xml file
-        Added to skip failed keywords, so statistics will not be biased.
+        Yields XmlKeyword objects containing keywords execution data,
+        parsing output.xml file incrementally.
+        Elapsed time of each keyword is computed bottom-up in a single pass:
+        earliest start and latest end time found in keyword subtree
+        are propagated to its parent when keyword element is closed.
+        Elements are released as soon as they are processed, and keywords
+        are yielded in document order once their top level keyword is closed.
         """
-        return xml_keyword.find("status").attrib["status"].upper() == "PASS"
-
-    def datetime_from_attribute_agg(
-        self, element: Element, attr: str, agg_func: Callable[[Iterable[str]], str]
-    ) -> datetime:
-        return datetime.strptime(
-            agg_func(
-                tag.attrib.get(attr) for tag in element.iter() if tag.tag == "status"
-            ),
-            self.source_time_format,
-        )
-
-    def calc_elapsed(self, element: Element) -> int:
-        return int(
-            1000
-            * (
-                self.datetime_from_attribute_agg(element, "endtime", max)
-                - self.datetime_from_attribute_agg(element, "starttime", min)
-            ).total_seconds()
-        )
+        open_elements: List[Element] = []
+        frames: List[KeywordFrame] = []
+        pending: List[Optional[XmlKeyword]] = []
+        for event, element in iterparse(str(self.path), events=("start", "end")):
+            if event == "start":
+                open_elements.append(element)
+                if element.tag == "kw":
+                    frames.append(KeywordFrame.of(element, len(pending)))
+                    pending.append(None)
+                continue
+            open_elements.pop()
+            if element.tag == "status" and frames:
+                frame = frames[-1]
+                frame.update(element.attrib)
+                if open_elements[-1].tag == "kw":
+                    frame.passed = element.attrib.get("status", "").upper() == "PASS"
+            elif element.tag == "kw":
+                frame = frames.pop()
+                if frame.library is not None and frame.passed:
+                    pending[frame.index] = XmlKeyword(
+                        frame.library, frame.name, frame.elapsed
+                    )
+                if frames:
+                    frames[-1].merge(frame)
+                else:
+                    yield from filter(None, pending)
+                    pending = []
+            element.clear()
+            if open_elements:
+                open_elements[-1].remove(element)
 
     def get_execution_time(self) -> str:
         """
         Returns execution time extracted form robot output.xml file.
+        Only the root element start is parsed, instead of the whole file.
         """
-        return datetime.strftime(
-            datetime.strptime(
-                parse(self.path).getroot().attrib.get("generated"),
-                self.source_time_format,
-            ),
-            self.destination_time_format,
-        )
+        for _, root in iterparse(str(self.path), events=("start",)):
+            return datetime.strftime(
+                parse_timestamp(root.attrib.get("generated")),
+                self.destination_time_format,
+            )
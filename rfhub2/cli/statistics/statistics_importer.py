@@ -1,16 +1,30 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from pathlib import Path
 from progress.bar import IncrementalBar
-from typing import List, Set, Tuple
+from queue import Queue
+from threading import Lock, Thread
+from typing import Dict, List, Set, Tuple
 
 from rfhub2.cli.api_client import Client
 from .statistics_extractor import StatisticsExtractor
 from rfhub2.model import KeywordStatistics, KeywordStatisticsList
 
 
+def compute_statistics(execution_file: Path) -> List[KeywordStatistics]:
+    """
+    Module level function, so it can be pickled and run in worker processes.
+    """
+    return StatisticsExtractor(execution_file).compute_statistics()
+
+
 class StatisticsImporter:
-    def __init__(self, client: Client, paths: Tuple[Path, ...]) -> None:
+    def __init__(
+        self, client: Client, paths: Tuple[Path, ...], jobs: int = 1, uploaders: int = 1
+    ) -> None:
         self.client = client
         self.paths = paths
+        self.jobs = jobs
+        self.uploaders = uploaders
 
     def import_data(self) -> Tuple[int, int]:
         """
@@ -25,22 +39,89 @@ class StatisticsImporter:
         number of times used and execution timestamp.
         :return: Number of libraries and keyword loaded
         """
-        execution_files = self.get_execution_files_paths()
-        loaded_statistics = []
+        execution_files = sorted(self.get_execution_files_paths())
         progress_bar = IncrementalBar(
             "Sending statistics",
             max=len(execution_files),
             suffix="%(percent).1f%% - %(eta)ds, elapsed: %(elapsed)ds",
         )
-        for execution_file in execution_files:
-            statistics = StatisticsExtractor(execution_file).compute_statistics()
-            loaded_statistics.append(self.add_statistics(statistics, execution_file))
-            progress_bar.next()
+        if self.jobs > 1 and len(execution_files) > 1:
+            loaded_statistics = self._import_in_parallel(execution_files, progress_bar)
+        else:
+            loaded_statistics = []
+            for execution_file in execution_files:
+                statistics = compute_statistics(execution_file)
+                loaded_statistics.append(
+                    self.add_statistics(statistics, execution_file)
+                )
+                progress_bar.next()
         return (
             len([stat for stat in loaded_statistics if stat > 0]),
             sum(loaded_statistics),
         )
 
+    def _import_in_parallel(
+        self, execution_files: List[Path], progress_bar: IncrementalBar
+    ) -> List[int]:
+        """
+        Parses execution files in process pool and passes extracted statistics
+        through bounded queue to uploader threads sending them to app.
+        Number of files parsed ahead of uploaders is limited, so memory usage
+        does not depend on number of files.
+        :return: List with number of statistics loaded from each file
+        """
+        queue: Queue = Queue(maxsize=self.jobs)
+        loaded_statistics: List[int] = []
+        errors: List[Exception] = []
+        lock = Lock()
+
+        def upload() -> None:
+            while True:
+                item = queue.get()
+                if item is None:
+                    return
+                if errors:
+                    continue
+                statistics, execution_file = item
+                try:
+                    loaded = self.add_statistics(statistics, execution_file)
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                with lock:
+                    loaded_statistics.append(loaded)
+                    progress_bar.next()
+
+        threads = [Thread(target=upload, daemon=True) for _ in range(self.uploaders)]
+        for thread in threads:
+            thread.start()
+        try:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                files = iter(execution_files)
+                pending: Dict[Future, Path] = {}
+                while True:
+                    while len(pending) < 2 * self.jobs:
+                        execution_file = next(files, None)
+                        if execution_file is None:
+                            break
+                        future = executor.submit(compute_statistics, execution_file)
+                        pending[future] = execution_file
+                    if not pending or errors:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        queue.put((future.result(), pending.pop(future)))
+                for future in pending:
+                    future.cancel()
+        finally:
+            for _ in threads:
+                queue.put(None)
+            for thread in threads:
+                thread.join()
+        if errors:
+            raise errors[0]
+        return loaded_statistics
+
     def get_execution_files_paths(self) -> Set[Path]:
         """
         Traverses all given paths and returns set with paths
@@ -7,3 +7,32 @@ APP_LOG_LEVEL = os.getenv("RFHUB_APP_LOG_LEVEL", "info")
 BASIC_AUTH_USER = os.getenv("RFHUB_BASIC_AUTH_USER", "rfhub")
 BASIC_AUTH_PASSWORD = os.getenv("RFHUB_BASIC_AUTH_PASSWORD", "rfhub")
 SQLALCHEMY_DB_URI = os.getenv("RFHUB_DB_URI", "sqlite:///test.db")
+SEARCH_INDEX = os.getenv("RFHUB_SEARCH_INDEX", "false").lower() in ("true", "1", "yes")
+RESPONSE_CACHE_SIZE = int(os.getenv("RFHUB_RESPONSE_CACHE_SIZE", 256))
+RESPONSE_CACHE_MAX_BYTES = int(
+    os.getenv("RFHUB_RESPONSE_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+)
+RESPONSE_COMPRESSION = os.getenv("RFHUB_RESPONSE_COMPRESSION", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+RESPONSE_COMPRESSION_MIN_SIZE = int(
+    os.getenv("RFHUB_RESPONSE_COMPRESSION_MIN_SIZE", 1024)
+)
+RESPONSE_COMPRESSION_LEVEL = int(os.getenv("RFHUB_RESPONSE_COMPRESSION_LEVEL", 6))
+RESPONSE_BROTLI_QUALITY = int(os.getenv("RFHUB_RESPONSE_BROTLI_QUALITY", 4))
+GZIP_REQUEST_MAX_SIZE = int(os.getenv("RFHUB_GZIP_REQUEST_MAX_SIZE", 8 * 1024 * 1024))
+ASYNC_DB = os.getenv("RFHUB_ASYNC_DB", "false").lower() in ("true", "1", "yes")
+DB_POOL_SIZE = int(os.getenv("RFHUB_DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("RFHUB_DB_MAX_OVERFLOW", 10))
+DB_POOL_RECYCLE = int(os.getenv("RFHUB_DB_POOL_RECYCLE", -1))
+DB_POOL_PRE_PING = os.getenv("RFHUB_DB_POOL_PRE_PING", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+DB_SQLITE_JOURNAL_MODE = os.getenv("RFHUB_DB_SQLITE_JOURNAL_MODE", "WAL")
+DB_SQLITE_SYNCHRONOUS = os.getenv("RFHUB_DB_SQLITE_SYNCHRONOUS", "NORMAL")
+DB_SQLITE_MMAP_SIZE = int(os.getenv("RFHUB_DB_SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
+DB_SQLITE_CACHE_SIZE = int(os.getenv("RFHUB_DB_SQLITE_CACHE_SIZE", -64 * 1024))
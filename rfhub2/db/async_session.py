@@ -0,0 +1,48 @@
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from typing import Optional
+
+from rfhub2 import config
+from rfhub2.db.session import pool_options, tune_sqlite_connections
+
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_db_url(db_uri: str) -> URL:
+    """
+    Returns database url with async driver of the same database,
+    aiosqlite for SQLite and asyncpg for PostgreSQL.
+    """
+    url = make_url(db_uri)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"Async database access is not supported for {backend}")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+def create_async_sqlalchemy_engine(db_uri: str) -> AsyncEngine:
+    engine = create_async_engine(
+        async_db_url(db_uri), echo=False, **pool_options(db_uri)
+    )
+    tune_sqlite_connections(engine.sync_engine)
+    return engine
+
+
+_async_session: Optional[sessionmaker] = None
+
+
+def get_async_session() -> sessionmaker:
+    """
+    Returns factory of async sessions, creating async engine on first use,
+    so that async drivers are required only when async database access is enabled.
+    """
+    global _async_session
+    if _async_session is None:
+        _async_session = sessionmaker(
+            bind=create_async_sqlalchemy_engine(config.SQLALCHEMY_DB_URI),
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session
@@ -0,0 +1,45 @@
+from sqlalchemy.orm.session import Session
+
+from rfhub2.db.base import Collection, Keyword
+from rfhub2.db.migrate import migrate_db
+from rfhub2.db.session import Session as SessionFactory, engine
+
+
+def backfill_rendered_docs(session: Session, batch_size: int = 500) -> int:
+    """
+    Renders and stores synopsis and html_doc for collections and keywords
+    written before these values were persisted at write time.
+    :return: number of backfilled rows
+    """
+    backfilled = 0
+    for entity in (Collection, Keyword):
+        while True:
+            items = (
+                session.query(entity)
+                .filter(entity.stored_html_doc.is_(None))
+                .limit(batch_size)
+                .all()
+            )
+            if not items:
+                break
+            for item in items:
+                item.render_doc("doc", item.doc)
+            session.commit()
+            backfilled += len(items)
+    return backfilled
+
+
+def main() -> None:
+    migrate_db(engine)
+    session = SessionFactory()
+    try:
+        backfilled = backfill_rendered_docs(session)
+    finally:
+        session.close()
+    print(
+        f"Backfilled rendered documentation for {backfilled} collections and keywords."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 from rfhub2.db.model.base_class import Base
 from rfhub2.db.model.keyword import Keyword
 from rfhub2.db.model.collection import Collection
+from rfhub2.db.model.compacted_execution import CompactedExecution
 from rfhub2.db.model.keyword_statistics import KeywordStatistics
+from rfhub2.db.model.keyword_statistics_rollup import KeywordStatisticsRollup
 from rfhub2.db.model.suite import Suite
 from rfhub2.db.model.suite_rel import SuiteRel
 from rfhub2.db.model.test_case import TestCase
@@ -0,0 +1,32 @@
+from sqlalchemy import event
+from sqlalchemy.orm.session import Session
+from threading import Lock
+
+
+class DataVersion:
+    """
+    Counter of data changes made in this process, used to key cached responses.
+    Every mutating repository call ends with commit, so version is bumped
+    after each committed transaction of any session.
+    """
+
+    def __init__(self) -> None:
+        self._value = 0
+        self._lock = Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def bump(self) -> int:
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+data_version = DataVersion()
+
+
+@event.listens_for(Session, "after_commit")
+def bump_data_version(_: Session) -> None:
+    data_version.bump()
@@ -1,7 +1,7 @@
 from collections import OrderedDict
 from sqlalchemy import Column
 from sqlalchemy.ext.declarative import declarative_base, declared_attr
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from rfhub2.db.repository.ordering import OrderingItem
 
@@ -25,20 +25,42 @@ class CustomBase(object):
         return []
 
     @classmethod
-    def ordering_criteria(
+    def ordering_columns(
         cls, items: List[OrderingItem], custom_columns: Dict[str, Column] = dict()
-    ):
-        def criterion(col: Column, ordering_item: OrderingItem) -> Column:
-            return col if ordering_item.asc else col.desc()
-
+    ) -> List[Tuple[Column, bool]]:
         if not items:
             items = cls.default_ordering()
         mapping = {**cls.column_mapping(), **custom_columns}
-        return OrderedDict(
-            (item.field, criterion(mapping[item.field], item))
-            for item in items
-            if item.field in mapping
-        ).values()
+        return list(
+            OrderedDict(
+                (item.field, (mapping[item.field], item.asc))
+                for item in items
+                if item.field in mapping
+            ).values()
+        )
+
+    @classmethod
+    def ordering_criteria(
+        cls, items: List[OrderingItem], custom_columns: Dict[str, Column] = dict()
+    ):
+        return [
+            col if asc else col.desc()
+            for col, asc in cls.ordering_columns(items, custom_columns)
+        ]
+
+    @classmethod
+    def keyset_columns(
+        cls, items: List[OrderingItem], custom_columns: Dict[str, Column] = dict()
+    ) -> List[Tuple[Column, bool]]:
+        """
+        Returns ordering columns followed by primary key columns not used in ordering,
+        so that ordering is unique and can be used for keyset pagination.
+        """
+        columns = cls.ordering_columns(items, custom_columns)
+        ordered = {col.name for col, _ in columns if isinstance(col, Column)}
+        return columns + [
+            (col, True) for col in cls.__table__.primary_key if col.name not in ordered
+        ]
 
 
 Base = declarative_base(cls=CustomBase)
@@ -3,12 +3,12 @@ from sqlalchemy.orm import relationship
 from typing import List
 
 from rfhub2.db.model.base_class import Base
-from rfhub2.db.model.mixins import DocMixin
+from rfhub2.db.model.mixins import StoredDocMixin
 from rfhub2.db.repository.ordering import OrderingItem
 from rfhub2 import model
 
 
-class Collection(Base, DocMixin):
+class Collection(Base, StoredDocMixin):
     id = Column(Integer, Sequence("collection_id_seq"), primary_key=True)
     name = Column(Text, index=True)
     type = Column(Text)
@@ -18,6 +18,8 @@ class Collection(Base, DocMixin):
     path = Column(Text)
     doc = Column(Text)
     doc_format = Column(Text)
+    # hash of documentation and keywords, None for collections not added with keywords
+    fingerprint = Column(Text)
     keywords = relationship(
         "Keyword",
         backref="collection",
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, PrimaryKeyConstraint, Text
+
+from rfhub2.db.model.base_class import Base
+
+
+class CompactedExecution(Base):
+    """
+    Original execution time of statistics of given collection merged by compaction,
+    kept so that statistics of the same execution are not imported again.
+    """
+
+    collection = Column(Text)
+    execution_time = Column(DateTime(timezone=True))
+
+    __table_args__ = (PrimaryKeyConstraint(collection, execution_time),)
+
+    def __str__(self):  # pragma: no cover
+        return f"CompactedExecution({self.collection},{self.execution_time})"
+
+    def __repr__(self):  # pragma: no cover
+        return str(self)
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, PrimaryKeyConstraint, Text
+
+from rfhub2.db.model.base_class import Base
+
+
+class KeywordStatisticsRollup(Base):
+    """
+    Totals of all execution statistics stored for given collection and keyword,
+    maintained by KeywordStatisticsRepository whenever statistics are added or deleted.
+    """
+
+    collection = Column(Text)
+    keyword = Column(Text)
+    times_used = Column(Integer)
+    total_elapsed = Column(Integer)
+    min_elapsed = Column(Integer)
+    max_elapsed = Column(Integer)
+
+    __table_args__ = (PrimaryKeyConstraint(collection, keyword),)
+
+    def __str__(self):  # pragma: no cover
+        return (
+            f"KeywordStatisticsRollup({self.collection},{self.keyword},"
+            + f"{self.times_used},{self.total_elapsed},{self.min_elapsed},{self.max_elapsed})"
+        )
+
+    def __repr__(self):  # pragma: no cover
+        return str(self)
@@ -1,4 +1,7 @@
 import json
+from sqlalchemy import Column, Text
+from sqlalchemy.orm import validates
+from typing import Optional
 
 try:
     from robot.libdocpkg.htmlutils import DocToHtml
@@ -6,17 +9,55 @@ except ImportError:
     from robot.libdocpkg.htmlwriter import DocToHtml
 
 
+def render_synopsis(doc: Optional[str]) -> str:
+    return doc.splitlines()[0] if doc else ""
+
+
+def render_html_doc(doc: Optional[str]) -> str:
+    return DocToHtml("ROBOT")(doc) if doc else ""
+
+
 class DocMixin:
     @property
     def synopsis(self) -> str:
-        return self.doc.splitlines()[0] if self.doc else ""
+        return render_synopsis(self.doc)
+
+    @property
+    def html_doc(self) -> str:
+        return render_html_doc(self.doc)
+
+
+class StoredDocMixin(DocMixin):
+    """
+    Renders synopsis and html_doc once, whenever doc is written, and persists them,
+    so that serializing an entity does not require rendering its documentation again.
+    Rows written before these columns existed fall back to rendering on read
+    until they are backfilled.
+    """
+
+    stored_synopsis = Column("synopsis", Text)
+    stored_html_doc = Column("html_doc", Text)
+
+    @validates("doc")
+    def render_doc(self, _: str, doc: Optional[str]) -> Optional[str]:
+        self.stored_synopsis = render_synopsis(doc)
+        self.stored_html_doc = render_html_doc(doc)
+        return doc
+
+    @property
+    def synopsis(self) -> str:
+        if self.stored_synopsis is None:
+            return super().synopsis
+        return self.stored_synopsis
 
     @property
     def html_doc(self) -> str:
-        return DocToHtml("ROBOT")(self.doc) if self.doc else ""
+        if self.stored_html_doc is None:
+            return super().html_doc
+        return self.stored_html_doc
 
 
-class KeywordMixin(DocMixin):
+class KeywordMixin(StoredDocMixin):
     @property
     def arg_string(self) -> str:
         """
@@ -0,0 +1,42 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Awaitable, Callable, Type
+
+from rfhub2.db.repository.base_repository import BaseRepository
+
+
+class AsyncRepository:
+    """
+    Exposes methods of repository as coroutines, so they can be awaited in async endpoints.
+    Methods should return models rather than database entities,
+    which cannot load their attributes once method returned.
+    """
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        async def call(*args, **kwargs) -> Any:
+            return await self._run(name, *args, **kwargs)
+
+        return call
+
+    async def _run(self, name: str, *args, **kwargs) -> Any:  # pragma: no cover
+        raise NotImplementedError
+
+
+class AsyncSessionRepository(AsyncRepository):
+    """
+    Runs methods of synchronous repository on async session.
+    Repository code is executed in greenlet using async database driver,
+    so awaiting database does not occupy any thread.
+    """
+
+    def __init__(
+        self, session: AsyncSession, repository_class: Type[BaseRepository]
+    ) -> None:
+        self.session = session
+        self.repository_class = repository_class
+
+    async def _run(self, name: str, *args, **kwargs) -> Any:
+        return await self.session.run_sync(
+            lambda session: getattr(self.repository_class(session), name)(
+                *args, **kwargs
+            )
+        )
@@ -1,16 +1,30 @@
 from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import func, Column
+from sqlalchemy import case, func, Column
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.query import Query
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.elements import BinaryExpression
 
-from rfhub2.db.base import Collection, Keyword, KeywordStatistics
-from rfhub2.model import CollectionWithStats, Collection as ModelCollection
+from rfhub2.db.base import Collection, Keyword, KeywordStatisticsRollup
+from rfhub2.db.model.mixins import render_synopsis
+from rfhub2.model import (
+    CollectionFingerprint,
+    CollectionsSynced,
+    CollectionSyncItem,
+    CollectionUpdate,
+    CollectionUpdateWithKeywords,
+    CollectionSummary,
+    CollectionWithStats,
+    Collection as ModelCollection,
+    KeywordCreate,
+    KeywordUpdate,
+)
 from rfhub2.db.repository.base_repository import IdEntityRepository
 from rfhub2.db.repository.ordering import OrderingItem
+from rfhub2.db.repository.pagination import Cursor, Page, paginate
 from rfhub2.db.repository.query_utils import glob_to_sql
+from rfhub2.utils.fingerprint import collection_fingerprint
 
 
 class CollectionRepository(IdEntityRepository):
@@ -25,10 +39,10 @@ class CollectionRepository(IdEntityRepository):
         )
         self.collection_statistics = (
             self.session.query(
-                (func.sum(KeywordStatistics.times_used)).label("times_used"),
-                KeywordStatistics.collection,
+                (func.sum(KeywordStatisticsRollup.times_used)).label("times_used"),
+                KeywordStatisticsRollup.collection,
             )
-            .group_by(KeywordStatistics.collection)
+            .group_by(KeywordStatisticsRollup.collection)
             .subquery()
         )
 
@@ -67,6 +81,28 @@ class CollectionRepository(IdEntityRepository):
             .options(selectinload(Collection.keywords))
         )
 
+    @property
+    def _summaries(self) -> Query:
+        return (
+            self.session.query(
+                Collection.id,
+                Collection.name,
+                Collection.type,
+                Collection.version,
+                Collection.stored_synopsis,
+                self.times_used_column,
+                self.keyword_count_column,
+                case([(Collection.stored_synopsis.is_(None), Collection.doc)]),
+            )
+            .outerjoin(
+                self.collection_statistics,
+                Collection.name == self.collection_statistics.c.collection,
+            )
+            .outerjoin(
+                self.keyword_count, Collection.id == self.keyword_count.c.collection_id
+            )
+        )
+
     def _id_filter(self, item_id: int) -> BinaryExpression:
         return Collection.id == item_id
 
@@ -100,6 +136,199 @@ class CollectionRepository(IdEntityRepository):
             keyword_count=row[2],
         )
 
+    @staticmethod
+    def from_summary_row(
+        row: Tuple[int, str, str, str, Optional[str], int, int, Optional[str]]
+    ) -> CollectionSummary:
+        """
+        Documentation is selected only for collections stored without rendered synopsis.
+        """
+        return CollectionSummary(
+            id=row[0],
+            name=row[1],
+            type=row[2],
+            version=row[3],
+            synopsis=row[4] if row[4] is not None else render_synopsis(row[7]),
+            times_used=row[5],
+            keyword_count=row[6],
+        )
+
+    def add_many_with_keywords(
+        self, items: List[CollectionUpdateWithKeywords]
+    ) -> Tuple[int, int]:
+        """
+        Inserts collections together with their keywords in single transaction.
+        Keywords of all collections are inserted with one bulk statement.
+        :return: number of inserted collections and keywords
+        """
+        try:
+            inserted = self._insert_with_keywords(items)
+            self.session.commit()
+            return inserted
+        except Exception as e:
+            self.session.rollback()
+            raise e
+
+    def sync(
+        self, items: List[CollectionSyncItem], remove_missing: bool = True
+    ) -> CollectionsSynced:
+        """
+        Makes stored collections match given ones in single transaction,
+        so readers never see partially imported data.
+        Collections are matched by name and path. Matched collections are replaced
+        when their fingerprint changed, not matched ones are inserted and,
+        with remove_missing, stored collections not matching any of given ones are deleted.
+        Collections given only by fingerprint are left untouched.
+        When several collections with the same name and path are stored,
+        all but one of them are deleted.
+        Fingerprints of collections stored without one are computed and stored,
+        so every collection is compared by single hash.
+        """
+        try:
+            existing: Dict[Tuple[str, Optional[str]], List[Collection]] = {}
+            missing_fingerprints = self._missing_fingerprints()
+            for collection in self.session.query(Collection).order_by(Collection.id):
+                if collection.fingerprint is None:
+                    collection.fingerprint = missing_fingerprints[collection.id]
+                existing.setdefault((collection.name, collection.path), []).append(
+                    collection
+                )
+            to_insert = []
+            to_delete = []
+            updated = 0
+            for item in items:
+                if isinstance(item, CollectionFingerprint):
+                    stored = existing.pop((item.name, item.path), [])
+                    # keep the collection stored with given fingerprint, if any
+                    stored.sort(key=lambda c: c.fingerprint != item.fingerprint)
+                    to_delete.extend(stored[1:])
+                    continue
+                stored = existing.pop((item.collection.name, item.collection.path), [])
+                to_delete.extend(stored[1:])
+                current = stored[0] if stored else None
+                if current is None:
+                    to_insert.append(item)
+                elif current.fingerprint != collection_fingerprint(
+                    item.collection, item.keywords
+                ):
+                    to_delete.append(current)
+                    to_insert.append(item)
+                    updated += 1
+            if remove_missing:
+                to_delete.extend(
+                    collection
+                    for collections in existing.values()
+                    for collection in collections
+                )
+            if to_delete:
+                self.session.query(Collection).filter(
+                    Collection.id.in_([collection.id for collection in to_delete])
+                ).delete(synchronize_session=False)
+                # deleted ids may be reused by inserted collections
+                for collection in to_delete:
+                    self.session.expunge(collection)
+            inserted, keywords = self._insert_with_keywords(to_insert)
+            self.session.commit()
+            return CollectionsSynced(
+                inserted=inserted - updated,
+                updated=updated,
+                deleted=len(to_delete) - updated,
+                keywords=keywords,
+            )
+        except Exception as e:
+            self.session.rollback()
+            raise e
+
+    def get_changed(
+        self, fingerprints: List[CollectionFingerprint]
+    ) -> List[CollectionFingerprint]:
+        """
+        Returns given collections which are not stored with the same fingerprint,
+        so only they need to be sent with keywords to be synchronized.
+        """
+        missing_fingerprints = self._missing_fingerprints()
+        stored = {
+            (name, path, fingerprint or missing_fingerprints[collection_id])
+            for collection_id, name, path, fingerprint in self.session.query(
+                Collection.id, Collection.name, Collection.path, Collection.fingerprint
+            )
+        }
+        return [
+            item
+            for item in fingerprints
+            if (item.name, item.path, item.fingerprint) not in stored
+        ]
+
+    def _insert_with_keywords(
+        self, items: List[CollectionUpdateWithKeywords]
+    ) -> Tuple[int, int]:
+        collections = [Collection.create(item.collection) for item in items]
+        for collection, item in zip(collections, items):
+            collection.fingerprint = collection_fingerprint(
+                item.collection, item.keywords
+            )
+        self.session.add_all(collections)
+        self.session.flush()
+        keywords = [
+            Keyword.create(KeywordCreate(**keyword.dict(), collection_id=collection.id))
+            for collection, item in zip(collections, items)
+            for keyword in item.keywords
+        ]
+        self.session.bulk_save_objects(keywords)
+        return len(collections), len(keywords)
+
+    def _missing_fingerprints(self) -> Dict[int, str]:
+        """
+        Returns fingerprints of collections stored before fingerprints were introduced,
+        computed from their stored documentation and keywords, by collection id.
+        Keywords of all such collections are loaded with single query.
+        """
+        collections = (
+            self.session.query(Collection)
+            .filter(Collection.fingerprint.is_(None))
+            .all()
+        )
+        if not collections:
+            return {}
+        keywords: Dict[int, List[KeywordUpdate]] = {
+            collection.id: [] for collection in collections
+        }
+        for keyword in (
+            self.session.query(
+                Keyword.collection_id,
+                Keyword.name,
+                Keyword.doc,
+                Keyword.args,
+                Keyword.tags,
+            )
+            .join(Keyword.collection)
+            .filter(Collection.fingerprint.is_(None))
+        ):
+            keywords[keyword.collection_id].append(
+                KeywordUpdate(
+                    name=keyword.name,
+                    doc=keyword.doc,
+                    args=keyword.args,
+                    tags=Keyword.from_json_list(keyword.tags),
+                )
+            )
+        return {
+            collection.id: collection_fingerprint(
+                CollectionUpdate(
+                    name=collection.name,
+                    type=collection.type,
+                    version=collection.version,
+                    scope=collection.scope,
+                    named_args=collection.named_args,
+                    path=collection.path,
+                    doc=collection.doc,
+                    doc_format=collection.doc_format,
+                ),
+                keywords[collection.id],
+            )
+            for collection in collections
+        }
+
     def get_all(
         self,
         *,
@@ -108,17 +337,16 @@ class CollectionRepository(IdEntityRepository):
         skip: int = 0,
         limit: int = 100,
         ordering: List[OrderingItem] = None,
-    ) -> List[ModelCollection]:
-        return [
-            collection.to_model()
-            for collection in (
-                self._items.filter(*self.filter_criteria(pattern, libtype))
-                .order_by(*Collection.ordering_criteria(ordering))
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
-        ]
+        cursor: Optional[Cursor] = None,
+    ) -> Page:
+        collections, next_cursor = paginate(
+            self._items.filter(*self.filter_criteria(pattern, libtype)),
+            Collection.keyset_columns(ordering),
+            cursor,
+            skip,
+            limit,
+        )
+        return Page((collection.to_model() for collection in collections), next_cursor)
 
     def get_all_with_stats(
         self,
@@ -128,19 +356,39 @@ class CollectionRepository(IdEntityRepository):
         skip: int = 0,
         limit: int = 100,
         ordering: List[OrderingItem] = None,
-    ) -> List[CollectionWithStats]:
-        return [
-            self.from_stats_row(row)
-            for row in (
-                self._items_with_stats.filter(*self.filter_criteria(pattern, libtype))
-                .order_by(
-                    *Collection.ordering_criteria(ordering, self.custom_column_mapping)
-                )
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
-        ]
+        cursor: Optional[Cursor] = None,
+    ) -> Page:
+        rows, next_cursor = paginate(
+            self._items_with_stats.filter(*self.filter_criteria(pattern, libtype)),
+            Collection.keyset_columns(ordering, self.custom_column_mapping),
+            cursor,
+            skip,
+            limit,
+        )
+        return Page((self.from_stats_row(row) for row in rows), next_cursor)
+
+    def get_all_summaries(
+        self,
+        *,
+        pattern: Optional[str] = None,
+        libtype: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        ordering: List[OrderingItem] = None,
+        cursor: Optional[Cursor] = None,
+    ) -> Page:
+        """
+        Returns collections with statistics, but without documentation and keywords,
+        which are neither loaded from database nor serialized.
+        """
+        rows, next_cursor = paginate(
+            self._summaries.filter(*self.filter_criteria(pattern, libtype)),
+            Collection.keyset_columns(ordering, self.custom_column_mapping),
+            cursor,
+            skip,
+            limit,
+        )
+        return Page((self.from_summary_row(row) for row in rows), next_cursor)
 
     def get_with_stats(self, item_id: int) -> Optional[CollectionWithStats]:
         result = self._items_with_stats.filter(self._id_filter(item_id)).first()
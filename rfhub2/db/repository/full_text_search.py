@@ -0,0 +1,117 @@
+from abc import ABC, abstractmethod
+import re
+from sqlalchemy import Float, Integer, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.selectable import Subquery
+from typing import Dict, List, Optional, Union
+
+GLOB_CHARACTERS = re.compile(r"[*?^$\\]")
+SEARCH_TERM = re.compile(r"[^\W_]+")
+
+SQLITE_FTS_TABLE = "keyword_fts"
+POSTGRES_FTS_COLUMN = "search_vector"
+
+
+def search_terms(pattern: Optional[str]) -> List[str]:
+    """
+    Returns words of search pattern that can be matched with full-text index.
+    Patterns containing glob metacharacters are not supported by full-text search,
+    so no terms are returned for them.
+    """
+    if not pattern or GLOB_CHARACTERS.search(pattern):
+        return []
+    return SEARCH_TERM.findall(pattern.lower())
+
+
+class FullTextSearch(ABC):
+    """
+    Matches keywords against full-text index of their name and documentation.
+    Every search term is matched as a word prefix, keywords have to match all terms.
+    """
+
+    @abstractmethod
+    def matches(self, terms: List[str], use_doc: bool) -> Subquery:
+        """
+        Returns subquery with ids of matching keywords in ``keyword_id`` column
+        and their relevance in ``rank`` column, where lower rank means better match.
+        """
+
+
+class SqliteFullTextSearch(FullTextSearch):
+    """
+    Uses FTS5 virtual table kept in sync with keyword table by triggers.
+    Matches in keyword name are weighted higher than matches in documentation.
+    """
+
+    def matches(self, terms: List[str], use_doc: bool) -> Subquery:
+        query = " ".join(f'"{term}"*' for term in terms)
+        if not use_doc:
+            query = f"name : ({query})"
+        return (
+            text(
+                f"SELECT rowid AS keyword_id, bm25({SQLITE_FTS_TABLE}, 10.0, 1.0) AS rank "
+                f"FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :fts_query"
+            )
+            .bindparams(fts_query=query)
+            .columns(keyword_id=Integer, rank=Float)
+            .subquery("keyword_fts_matches")
+        )
+
+
+class PostgresFullTextSearch(FullTextSearch):
+    """
+    Uses tsvector column of keyword table, maintained by trigger and indexed with GIN.
+    Keyword name is indexed with weight A and documentation with weight B.
+    """
+
+    def matches(self, terms: List[str], use_doc: bool) -> Subquery:
+        weights = "" if use_doc else "A"
+        query = " & ".join(f"{term}:*{weights}" for term in terms)
+        return (
+            text(
+                f"SELECT id AS keyword_id, -ts_rank({POSTGRES_FTS_COLUMN}, query) AS rank "
+                f"FROM keyword, to_tsquery('simple', :fts_query) query "
+                f"WHERE {POSTGRES_FTS_COLUMN} @@ query"
+            )
+            .bindparams(fts_query=query)
+            .columns(keyword_id=Integer, rank=Float)
+            .subquery("keyword_fts_matches")
+        )
+
+
+_backends: Dict[str, Optional[FullTextSearch]] = {}
+
+
+def has_full_text_index(connection: Union[Connection, Engine]) -> bool:
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        query = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"
+        params = {"name": SQLITE_FTS_TABLE}
+    elif dialect == "postgresql":
+        query = (
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'keyword' AND column_name = :name"
+        )
+        params = {"name": POSTGRES_FTS_COLUMN}
+    else:
+        return False
+    return connection.execute(text(query), params).first() is not None
+
+
+def get_full_text_search(session: Session) -> Optional[FullTextSearch]:
+    """
+    Returns full-text search backend for database dialect,
+    or None when database does not provide full-text index of keywords.
+    Index availability is checked once per database.
+    """
+    bind = session.get_bind()
+    key = str(bind.url)
+    if key not in _backends:
+        if not has_full_text_index(session.connection()):
+            _backends[key] = None
+        elif bind.dialect.name == "sqlite":
+            _backends[key] = SqliteFullTextSearch()
+        else:
+            _backends[key] = PostgresFullTextSearch()
+    return _backends[key]
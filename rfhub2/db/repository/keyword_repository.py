@@ -1,14 +1,17 @@
 from typing import List, Optional, Tuple
 
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.query import Query
 from sqlalchemy.sql.elements import BinaryExpression
 
-from rfhub2.db.base import Collection, Keyword, KeywordStatistics
-from rfhub2.model import KeywordWithStats, Keyword as ModelKeyword
+from rfhub2.db.base import Collection, Keyword, KeywordStatisticsRollup
+from rfhub2.model import KeywordWithStats
 from rfhub2.db.repository.base_repository import IdEntityRepository
+from rfhub2.db.repository.full_text_search import get_full_text_search, search_terms
 from rfhub2.db.repository.ordering import OrderingItem
+from rfhub2.db.repository.pagination import Cursor, Page, paginate
+from rfhub2.db.repository.trigram_search import get_trigram_search
 from rfhub2.db.repository.query_utils import glob_to_sql
 
 
@@ -19,32 +22,18 @@ class KeywordRepository(IdEntityRepository):
 
     @property
     def _items_with_stats(self) -> Query:
-        keyword_statistics = (
-            self.session.query(
-                func.sum(KeywordStatistics.times_used).label("times_used"),
-                (
-                    func.sum(KeywordStatistics.total_elapsed)
-                    / func.sum(KeywordStatistics.times_used)
-                ).label("avg_elapsed"),
-                KeywordStatistics.collection,
-                KeywordStatistics.keyword,
-            )
-            .group_by(KeywordStatistics.collection, KeywordStatistics.keyword)
-            .subquery()
-        )
+        avg_elapsed = (
+            KeywordStatisticsRollup.total_elapsed / KeywordStatisticsRollup.times_used
+        ).label("avg_elapsed")
         return (
-            self.session.query(
-                Keyword,
-                keyword_statistics.c.times_used,
-                keyword_statistics.c.avg_elapsed,
-            )
+            self.session.query(Keyword, KeywordStatisticsRollup.times_used, avg_elapsed)
             .options(selectinload(Keyword.collection))
             .join(Keyword.collection)
             .outerjoin(
-                keyword_statistics,
+                KeywordStatisticsRollup,
                 and_(
-                    Collection.name == keyword_statistics.c.collection,
-                    Keyword.name == keyword_statistics.c.keyword,
+                    Collection.name == KeywordStatisticsRollup.collection,
+                    Keyword.name == KeywordStatisticsRollup.keyword,
                 ),
             )
         )
@@ -101,26 +90,83 @@ class KeywordRepository(IdEntityRepository):
         collection_id: Optional[int] = None,
         use_doc: bool = True,
         use_tags: bool = False,
+        full_text: bool = False,
+        fuzzy: bool = False,
         skip: int = 0,
         limit: int = 100,
         ordering: List[OrderingItem] = None,
-    ) -> List[ModelKeyword]:
-        return [
-            keyword.to_model()
-            for keyword in (
-                self.session.query(Keyword)
-                .join(Keyword.collection)
-                .filter(
-                    *self.filter_criteria(
-                        pattern, collection_name, collection_id, use_doc, use_tags
-                    )
+        cursor: Optional[Cursor] = None,
+    ) -> Page:
+        """
+        With full_text enabled, patterns without glob metacharacters are matched
+        using full-text index of keyword name and documentation, if database provides one,
+        and results are ordered by relevance unless custom ordering is given.
+        When full-text index finds no keyword, for example for part of a word,
+        pattern is matched with case insensitive LIKE instead.
+        With fuzzy enabled, pattern is matched with keyword names using trigram index,
+        tolerating typos, and results are ordered by similarity. When database
+        provides no trigram index, pattern is matched with case insensitive LIKE.
+        Otherwise pattern is matched with case insensitive LIKE.
+        Results of fuzzy search are ranked outside of database, so they do not support
+        cursor pagination and returned page has no next cursor.
+        """
+        query = self.session.query(Keyword).join(Keyword.collection)
+        columns = Keyword.keyset_columns(ordering)
+        trigram_search = (
+            get_trigram_search(self.session)
+            if fuzzy and pattern and not use_tags
+            else None
+        )
+        ranked_ids = (
+            trigram_search.ranked_ids(self.session, pattern) if trigram_search else None
+        )
+        if ranked_ids is not None:
+            query = query.filter(
+                Keyword.id.in_(ranked_ids),
+                *self.filter_criteria(
+                    None, collection_name, collection_id, False, False
+                ),
+            )
+            if ordering:
+                keywords, _ = paginate(query, columns, None, skip, limit)
+            else:
+                positions = {keyword_id: i for i, keyword_id in enumerate(ranked_ids)}
+                keywords = sorted(query.all(), key=lambda kw: positions[kw.id])
+                keywords = keywords[skip : skip + limit]
+            return Page(keyword.to_model() for keyword in keywords)
+        # fuzzy search without trigram index falls back to LIKE, not to full-text search
+        terms = (
+            search_terms(pattern) if full_text and not fuzzy and not use_tags else []
+        )
+        full_text_search = get_full_text_search(self.session) if terms else None
+        if full_text_search:
+            matches = full_text_search.matches(terms, use_doc)
+            full_text_query = query.join(
+                matches, Keyword.id == matches.c.keyword_id
+            ).filter(
+                *self.filter_criteria(
+                    None, collection_name, collection_id, use_doc, use_tags
                 )
-                .order_by(*Keyword.ordering_criteria(ordering))
-                .offset(skip)
-                .limit(limit)
-                .all()
             )
-        ]
+            # full-text index matches word prefixes only, so patterns found
+            # only inside words are still matched with LIKE
+            if full_text_query.with_entities(Keyword.id).first() is not None:
+                query = query.join(matches, Keyword.id == matches.c.keyword_id)
+                pattern = None
+                if not ordering:
+                    columns = [(matches.c.rank, True), *columns]
+        keywords, next_cursor = paginate(
+            query.filter(
+                *self.filter_criteria(
+                    pattern, collection_name, collection_id, use_doc, use_tags
+                )
+            ),
+            columns,
+            cursor,
+            skip,
+            limit,
+        )
+        return Page((keyword.to_model() for keyword in keywords), next_cursor)
 
     def get_all_with_stats(
         self,
@@ -133,21 +179,20 @@ class KeywordRepository(IdEntityRepository):
         skip: int = 0,
         limit: int = 100,
         ordering: List[OrderingItem] = None,
-    ) -> List[KeywordWithStats]:
-        return [
-            self.from_stats_row(row)
-            for row in (
-                self._items_with_stats.filter(
-                    *self.filter_criteria(
-                        pattern, collection_name, collection_id, use_doc, use_tags
-                    )
+        cursor: Optional[Cursor] = None,
+    ) -> Page:
+        rows, next_cursor = paginate(
+            self._items_with_stats.filter(
+                *self.filter_criteria(
+                    pattern, collection_name, collection_id, use_doc, use_tags
                 )
-                .order_by(*Keyword.ordering_criteria(ordering))
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
-        ]
+            ),
+            Keyword.keyset_columns(ordering),
+            cursor,
+            skip,
+            limit,
+        )
+        return Page((self.from_stats_row(row) for row in rows), next_cursor)
 
     def get_with_stats(self, item_id: int) -> Optional[KeywordWithStats]:
         result = self._items_with_stats.filter(self._id_filter(item_id)).first()
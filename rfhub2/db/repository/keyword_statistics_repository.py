@@ -1,13 +1,20 @@
 from pydantic import BaseConfig
 from pydantic.dataclasses import dataclass
-from datetime import datetime
-from sqlalchemy import func
+from datetime import datetime, timedelta
+from sqlalchemy import and_, func, or_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm.query import Query
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from rfhub2.db.base import KeywordStatistics
+from rfhub2.db.base import (
+    CompactedExecution,
+    KeywordStatistics,
+    KeywordStatisticsRollup,
+)
 from rfhub2.db.repository.base_repository import BaseRepository
 from rfhub2.db.repository.ordering import OrderingItem
+from rfhub2.db.repository.pagination import Cursor, Page, paginate
+from rfhub2.model import StatisticsBucket, StatisticsCompacted
 
 
 class Config(BaseConfig):
@@ -33,6 +40,32 @@ class KeywordStatisticsFilterParams:
     execution_time_to: Optional[datetime] = None
 
 
+RollupKey = Tuple[str, str]
+BucketKey = Tuple[str, str, datetime]
+
+# insert construct supporting ON CONFLICT, and scalar minimum and maximum functions of database
+UPSERT_DIALECTS = {
+    "postgresql": (postgresql.insert, func.least, func.greatest),
+    "sqlite": (sqlite.insert, func.min, func.max),
+}
+
+
+class CompactedExecutionError(Exception):
+    """
+    Raised when statistics of execution already merged by compaction are added again.
+    """
+
+
+def bucket_start(execution_time: datetime, bucket: StatisticsBucket) -> datetime:
+    """
+    Returns beginning of the day or week (starting on Monday) of given execution time.
+    """
+    start = execution_time.replace(hour=0, minute=0, second=0, microsecond=0)
+    if bucket == StatisticsBucket.WEEK:
+        start -= timedelta(days=start.weekday())
+    return start
+
+
 class KeywordStatisticsRepository(BaseRepository):
     @property
     def _items(self) -> Query:
@@ -95,28 +128,296 @@ class KeywordStatisticsRepository(BaseRepository):
         skip: int = 0,
         limit: int = 100,
         ordering: List[OrderingItem] = None,
-    ) -> List[KeywordStatistics]:
-        return [
-            stat.to_model()
-            for stat in (
-                self._items.filter(*self.filter_criteria(filter_params))
-                .order_by(*KeywordStatistics.ordering_criteria(ordering))
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
-        ]
+        cursor: Optional[Cursor] = None,
+    ) -> Page:
+        stats, next_cursor = paginate(
+            self._items.filter(*self.filter_criteria(filter_params)),
+            KeywordStatistics.keyset_columns(ordering),
+            cursor,
+            skip,
+            limit,
+        )
+        return Page((stat.to_model() for stat in stats), next_cursor)
 
     def add_many(self, items: List[KeywordStatistics]) -> int:
         count: int = len(items)
-        self.session.bulk_save_objects(items)
-        self.session.commit()
+        try:
+            if self._compacted_executions(items):
+                raise CompactedExecutionError()
+            self.session.bulk_save_objects(items)
+            self._add_to_rollup(items)
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise e
         return count
 
     def delete_many(
         self, filter_params: Optional[KeywordStatisticsFilterParams] = None
     ) -> int:
         filter_criteria = self.filter_criteria(filter_params) if filter_params else []
-        row_count = self._items.filter(*filter_criteria).delete()
-        self.session.commit()
+        try:
+            if filter_criteria:
+                keys = {
+                    (row.collection, row.keyword)
+                    for row in self.session.query(
+                        KeywordStatistics.collection, KeywordStatistics.keyword
+                    )
+                    .filter(*filter_criteria)
+                    .distinct()
+                }
+            row_count = self._items.filter(*filter_criteria).delete(
+                synchronize_session=False
+            )
+            if filter_criteria:
+                self.refresh_rollup(keys)
+            else:
+                self.session.query(KeywordStatisticsRollup).delete()
+            # executions of other keywords remain compacted
+            if not filter_params:
+                self.session.query(CompactedExecution).delete()
+            elif not filter_params.keyword:
+                self.session.query(CompactedExecution).filter(
+                    *self.compacted_execution_criteria(filter_params)
+                ).delete(synchronize_session=False)
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise e
         return row_count
+
+    def compact(
+        self, older_than: datetime, bucket: StatisticsBucket = StatisticsBucket.DAY
+    ) -> StatisticsCompacted:
+        """
+        Replaces statistics executed before given time with one row
+        per collection, keyword and day or week, stored with execution_time
+        set to the beginning of the bucket.
+        Times used and elapsed times are summed, minimum and maximum are preserved,
+        so aggregated statistics and rollup stay the same.
+        Already compacted rows are merged again, so compaction can be repeated,
+        also with wider buckets.
+        Compaction is lossy: merged statistics are matched by execution time filters
+        as if all of them were executed at the beginning of their bucket.
+        Original execution times are kept per collection, so that statistics
+        of compacted executions are rejected when they are imported again.
+        """
+        criteria = [KeywordStatistics.execution_time < older_than]
+        buckets: Dict[BucketKey, KeywordStatistics] = {}
+        compacted = 0
+        try:
+            rows = self.session.query(
+                KeywordStatistics.collection,
+                KeywordStatistics.keyword,
+                KeywordStatistics.execution_time,
+                KeywordStatistics.times_used,
+                KeywordStatistics.total_elapsed,
+                KeywordStatistics.min_elapsed,
+                KeywordStatistics.max_elapsed,
+            ).filter(*criteria)
+            executions: Set[Tuple[str, datetime]] = set()
+            for row in rows.yield_per(1000):
+                compacted += 1
+                executions.add((row.collection, row.execution_time))
+                key = (
+                    row.collection,
+                    row.keyword,
+                    bucket_start(row.execution_time, bucket),
+                )
+                item = buckets.get(key)
+                if item is None:
+                    buckets[key] = KeywordStatistics(
+                        collection=row.collection,
+                        keyword=row.keyword,
+                        execution_time=key[2],
+                        times_used=row.times_used,
+                        total_elapsed=row.total_elapsed,
+                        min_elapsed=row.min_elapsed,
+                        max_elapsed=row.max_elapsed,
+                    )
+                else:
+                    item.times_used += row.times_used
+                    item.total_elapsed += row.total_elapsed
+                    item.min_elapsed = min(item.min_elapsed, row.min_elapsed)
+                    item.max_elapsed = max(item.max_elapsed, row.max_elapsed)
+            self._items.filter(*criteria).delete(synchronize_session=False)
+            self.session.bulk_save_objects(list(buckets.values()))
+            self._add_compacted_executions(list(executions))
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise e
+        return StatisticsCompacted(compacted=compacted, created=len(buckets))
+
+    @staticmethod
+    def compacted_execution_criteria(params: KeywordStatisticsFilterParams):
+        filter_criteria = []
+        if params.collection:
+            filter_criteria.append(CompactedExecution.collection == params.collection)
+        if params.execution_time:
+            filter_criteria.append(
+                CompactedExecution.execution_time == params.execution_time
+            )
+        else:
+            if params.execution_time_from:
+                filter_criteria.append(
+                    CompactedExecution.execution_time >= params.execution_time_from
+                )
+            if params.execution_time_to:
+                filter_criteria.append(
+                    CompactedExecution.execution_time <= params.execution_time_to
+                )
+        return filter_criteria
+
+    def _add_compacted_executions(
+        self, executions: List[Tuple[str, datetime]], chunk_size: int = 400
+    ) -> None:
+        insert = UPSERT_DIALECTS[self.session.get_bind().dialect.name][0]
+        for i in range(0, len(executions), chunk_size):
+            self.session.execute(
+                insert(CompactedExecution)
+                .values(
+                    [
+                        {"collection": collection, "execution_time": time}
+                        for collection, time in executions[i : i + chunk_size]
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+
+    def _compacted_executions(self, items: List[KeywordStatistics]) -> bool:
+        """
+        Checks if any of executions of given statistics has already been compacted.
+        """
+        executions = {(item.collection, item.execution_time) for item in items}
+        if not executions:
+            return False
+        return (
+            self.session.query(CompactedExecution)
+            .filter(
+                or_(
+                    *(
+                        and_(
+                            CompactedExecution.collection == collection,
+                            CompactedExecution.execution_time == execution_time,
+                        )
+                        for collection, execution_time in executions
+                    )
+                )
+            )
+            .first()
+            is not None
+        )
+
+    def _rollup_rows(
+        self, keys: Iterable[RollupKey]
+    ) -> Dict[RollupKey, KeywordStatisticsRollup]:
+        collections = {collection for collection, _ in keys}
+        if not collections:
+            return {}
+        return {
+            (row.collection, row.keyword): row
+            for row in self.session.query(KeywordStatisticsRollup).filter(
+                KeywordStatisticsRollup.collection.in_(collections)
+            )
+        }
+
+    def _add_to_rollup(self, items: List[KeywordStatistics]) -> None:
+        """
+        Adds totals of new statistics to rollup rows of their collection and keyword,
+        so the whole statistics table does not have to be aggregated when reading them.
+        Rows are upserted in the database, so that concurrent uploads
+        of statistics of the same keyword do not overwrite each other's totals.
+        """
+        totals: Dict[RollupKey, Dict[str, int]] = {}
+        for item in items:
+            key = (item.collection, item.keyword)
+            total = totals.get(key)
+            if total is None:
+                totals[key] = {
+                    "collection": item.collection,
+                    "keyword": item.keyword,
+                    "times_used": item.times_used,
+                    "total_elapsed": item.total_elapsed,
+                    "min_elapsed": item.min_elapsed,
+                    "max_elapsed": item.max_elapsed,
+                }
+            else:
+                total["times_used"] += item.times_used
+                total["total_elapsed"] += item.total_elapsed
+                total["min_elapsed"] = min(total["min_elapsed"], item.min_elapsed)
+                total["max_elapsed"] = max(total["max_elapsed"], item.max_elapsed)
+        if not totals:
+            return
+        dialect = self.session.get_bind().dialect.name
+        if dialect not in UPSERT_DIALECTS:
+            raise ValueError(f"Statistics rollup is not supported for {dialect}")
+        insert, least, greatest = UPSERT_DIALECTS[dialect]
+        statement = insert(KeywordStatisticsRollup).values(list(totals.values()))
+        excluded = statement.excluded
+        self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    KeywordStatisticsRollup.collection,
+                    KeywordStatisticsRollup.keyword,
+                ],
+                set_={
+                    "times_used": KeywordStatisticsRollup.times_used
+                    + excluded.times_used,
+                    "total_elapsed": KeywordStatisticsRollup.total_elapsed
+                    + excluded.total_elapsed,
+                    "min_elapsed": least(
+                        KeywordStatisticsRollup.min_elapsed, excluded.min_elapsed
+                    ),
+                    "max_elapsed": greatest(
+                        KeywordStatisticsRollup.max_elapsed, excluded.max_elapsed
+                    ),
+                },
+            )
+        )
+
+    def refresh_rollup(self, keys: Optional[Set[RollupKey]] = None) -> None:
+        """
+        Recomputes rollup rows from stored statistics for given collection and keyword pairs,
+        or for all of them when keys are not provided.
+        Used after statistics are deleted, since minimum and maximum
+        cannot be updated incrementally.
+        """
+        self.session.flush()
+        aggregated = self.session.query(
+            KeywordStatistics.collection,
+            KeywordStatistics.keyword,
+            func.sum(KeywordStatistics.times_used),
+            func.sum(KeywordStatistics.total_elapsed),
+            func.min(KeywordStatistics.min_elapsed),
+            func.max(KeywordStatistics.max_elapsed),
+        ).group_by(KeywordStatistics.collection, KeywordStatistics.keyword)
+        if keys is None:
+            self.session.query(KeywordStatisticsRollup).delete()
+            rollups = {}
+        else:
+            collections = {collection for collection, _ in keys}
+            aggregated = aggregated.filter(
+                KeywordStatistics.collection.in_(collections)
+            )
+            rollups = {
+                key: rollup
+                for key, rollup in self._rollup_rows(keys).items()
+                if key in keys
+            }
+        for collection, keyword, *totals in aggregated:
+            key = (collection, keyword)
+            if keys is not None and key not in keys:
+                continue
+            rollup = rollups.pop(key, None)
+            if rollup is None:
+                rollup = KeywordStatisticsRollup(collection=collection, keyword=keyword)
+                self.session.add(rollup)
+            (
+                rollup.times_used,
+                rollup.total_elapsed,
+                rollup.min_elapsed,
+                rollup.max_elapsed,
+            ) = totals
+        for rollup in rollups.values():
+            self.session.delete(rollup)
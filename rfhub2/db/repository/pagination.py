@@ -0,0 +1,87 @@
+from sqlalchemy import and_, or_
+from sqlalchemy.orm.query import Query
+from sqlalchemy.sql.elements import ColumnElement
+from typing import Any, Iterable, List, Optional, Tuple
+
+Cursor = List[Any]
+KeysetColumn = Tuple[ColumnElement, bool]
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class Page(list):
+    """
+    List of items with cursor pointing after the last of them,
+    or None when there are no more items.
+    """
+
+    def __init__(self, items: Iterable = (), next_cursor: Optional[Cursor] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+# databases sorting NULL values as larger than any other value, other ones sort them as lowest
+NULLS_LARGEST_DIALECTS = {"postgresql"}
+
+
+def keyset_ordering(columns: List[KeysetColumn]) -> List[ColumnElement]:
+    """
+    NULL values are ordered by database default, so that listings are ordered
+    the same way with and without cursor.
+    """
+    return [col.asc() if asc else col.desc() for col, asc in columns]
+
+
+def keyset_criteria(
+    columns: List[KeysetColumn], cursor: Cursor, nulls_largest: bool = False
+) -> ColumnElement:
+    """
+    Returns criteria matching rows placed after the row with given cursor values,
+    for ordering of given columns and position of NULL values in database ordering.
+    """
+    (col, asc), value = columns[0], cursor[0]
+    nulls_after = asc == nulls_largest
+    if value is None:
+        after = None if nulls_after else col.isnot(None)
+        equal = col.is_(None)
+    else:
+        greater = col > value if asc else col < value
+        after = or_(greater, col.is_(None)) if nulls_after else greater
+        equal = col == value
+    if len(columns) > 1:
+        equal_and_after = and_(
+            equal, keyset_criteria(columns[1:], cursor[1:], nulls_largest)
+        )
+        return equal_and_after if after is None else or_(after, equal_and_after)
+    return and_(False) if after is None else after
+
+
+def paginate(
+    query: Query,
+    columns: List[KeysetColumn],
+    cursor: Optional[Cursor] = None,
+    skip: int = 0,
+    limit: int = 100,
+) -> Tuple[List[Any], Optional[Cursor]]:
+    """
+    Returns rows of query ordered by given columns, starting after cursor if provided,
+    together with cursor of the last returned row if there may be more rows.
+    Keyset criteria let database seek directly to the requested page,
+    instead of reading and skipping all preceding rows like OFFSET does.
+    """
+    single_entity = len(query.column_descriptions) == 1
+    count = len(columns)
+    query = query.add_columns(*(col for col, _ in columns))
+    if cursor is not None:
+        if len(cursor) != count:
+            raise InvalidCursorError("Cursor does not match requested ordering")
+        nulls_largest = query.session.get_bind().dialect.name in NULLS_LARGEST_DIALECTS
+        query = query.filter(keyset_criteria(columns, cursor, nulls_largest))
+    rows = query.order_by(*keyset_ordering(columns)).offset(skip).limit(limit).all()
+    next_cursor = list(rows[-1][-count:]) if rows and len(rows) == limit else None
+    return (
+        [row[0] if single_entity else tuple(row[:-count]) for row in rows],
+        next_cursor,
+    )
@@ -16,6 +16,7 @@ from rfhub2.model import (
 )
 from rfhub2.db.repository.base_repository import BaseRepository
 from rfhub2.db.repository.ordering import OrderingItem
+from rfhub2.db.repository.pagination import Cursor, Page, paginate
 from rfhub2.db.repository.query_utils import glob_to_sql
 
 
@@ -121,20 +122,18 @@ class SuiteRepository(BaseRepository):
         skip: int = 0,
         limit: int = 100,
         ordering: List[OrderingItem] = None,
-    ) -> List[ModelSuite]:
-        return [
-            self.from_row(row)
-            for row in (
-                self.items(parent_id)
-                .filter(*self.filter_criteria(pattern, root_only, use_doc, use_tags))
-                .order_by(
-                    *Suite.ordering_criteria(ordering, self.custom_column_mapping)
-                )
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
-        ]
+        cursor: Optional[Cursor] = None,
+    ) -> Page:
+        rows, next_cursor = paginate(
+            self.items(parent_id).filter(
+                *self.filter_criteria(pattern, root_only, use_doc, use_tags)
+            ),
+            Suite.keyset_columns(ordering, self.custom_column_mapping),
+            cursor,
+            skip,
+            limit,
+        )
+        return Page((self.from_row(row) for row in rows), next_cursor)
 
     def items(self, parent_id: Optional[int] = None):
         parents = (
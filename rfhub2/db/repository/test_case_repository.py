@@ -8,6 +8,7 @@ from rfhub2.db.base import Suite, TestCase
 from rfhub2.model import KeywordRefList, TagList, TestCase as ModelTestCase
 from rfhub2.db.repository.base_repository import IdEntityRepository
 from rfhub2.db.repository.ordering import OrderingItem
+from rfhub2.db.repository.pagination import Cursor, Page, paginate
 from rfhub2.db.repository.query_utils import glob_to_sql
 
 
@@ -73,19 +74,18 @@ class TestCaseRepository(IdEntityRepository):
         skip: int = 0,
         limit: int = 100,
         ordering: List[OrderingItem] = None,
-    ) -> List[ModelTestCase]:
-        return [
-            self.from_row(row)
-            for row in (
-                self._get_items.filter(
-                    *self.filter_criteria(pattern, suite_id, use_doc, use_tags)
-                )
-                .order_by(*TestCase.ordering_criteria(ordering))
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
-        ]
+        cursor: Optional[Cursor] = None,
+    ) -> Page:
+        rows, next_cursor = paginate(
+            self._get_items.filter(
+                *self.filter_criteria(pattern, suite_id, use_doc, use_tags)
+            ),
+            TestCase.keyset_columns(ordering),
+            cursor,
+            skip,
+            limit,
+        )
+        return Page((self.from_row(row) for row in rows), next_cursor)
 
     def update(self, item: TestCase, update_data: dict) -> TestCase:
         if "keywords" in update_data:
@@ -0,0 +1,146 @@
+from abc import ABC, abstractmethod
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm.session import Session
+from typing import Dict, List, Optional, Set
+
+from rfhub2.db.repository.full_text_search import SEARCH_TERM
+
+SQLITE_TRIGRAM_TABLE = "keyword_trigram"
+POSTGRES_TRIGRAM_INDEX = "ix_keyword_name_trgm"
+MAX_CANDIDATES = 1000
+SIMILARITY_THRESHOLD = 0.5
+
+
+def trigrams(value: str) -> Set[str]:
+    """
+    Returns trigrams of lowercased words of given value.
+    Words are padded with two spaces at the beginning, like in pg_trgm,
+    but not at the end, so word prefixes share all their trigrams with the word.
+    """
+    return {
+        padded[i : i + 3]
+        for word in SEARCH_TERM.findall(value.lower())
+        for padded in (f"  {word}",)
+        for i in range(len(padded) - 2)
+    }
+
+
+def word_trigrams(value: str) -> Set[str]:
+    """
+    Returns trigrams found inside words of given value, without padding.
+    """
+    return {
+        word[i : i + 3]
+        for word in SEARCH_TERM.findall(value.lower())
+        for i in range(len(word) - 2)
+    }
+
+
+def similarity(pattern: str, value: str) -> float:
+    """
+    Returns fraction of pattern trigrams found in value.
+    Substrings and prefixes of value words get 1.0, typos lower the score.
+    """
+    pattern_trigrams = trigrams(pattern)
+    if not pattern_trigrams:
+        return 0.0
+    return len(pattern_trigrams & trigrams(value)) / len(pattern_trigrams)
+
+
+class TrigramSearch(ABC):
+    """
+    Finds keywords with names similar to search pattern,
+    tolerating typos and matching substrings and prefixes of words.
+    """
+
+    @abstractmethod
+    def ranked_ids(self, session: Session, pattern: str) -> Optional[List[int]]:
+        """
+        Returns ids of keywords with name similar to pattern, best matches first,
+        or None if pattern is too short to be matched with trigrams.
+        """
+
+
+class SqliteTrigramSearch(TrigramSearch):
+    """
+    Uses FTS5 table with trigram tokenizer, kept in sync with keyword names by triggers,
+    to find candidates sharing trigrams with pattern, which are then ranked by similarity.
+    """
+
+    def ranked_ids(self, session: Session, pattern: str) -> Optional[List[int]]:
+        pattern_trigrams = word_trigrams(pattern)
+        if not pattern_trigrams:
+            return None
+        query = " OR ".join(f'"{trigram}"' for trigram in sorted(pattern_trigrams))
+        candidates = session.execute(
+            text(
+                f"SELECT rowid, name FROM {SQLITE_TRIGRAM_TABLE} "
+                f"WHERE {SQLITE_TRIGRAM_TABLE} MATCH :query ORDER BY rank LIMIT :limit"
+            ),
+            {"query": query, "limit": MAX_CANDIDATES},
+        )
+        scored = [
+            (similarity(pattern, name), name, keyword_id)
+            for keyword_id, name in candidates
+        ]
+        return [
+            keyword_id
+            for score, name, keyword_id in sorted(
+                scored, key=lambda item: (-item[0], len(item[1]), item[1])
+            )
+            if score >= SIMILARITY_THRESHOLD
+        ]
+
+
+class PostgresTrigramSearch(TrigramSearch):
+    """
+    Uses pg_trgm word similarity, served by trigram GIN index of lowercased keyword names.
+    """
+
+    def ranked_ids(self, session: Session, pattern: str) -> Optional[List[int]]:
+        if not word_trigrams(pattern):
+            return None
+        rows = session.execute(
+            text(
+                "SELECT id FROM keyword WHERE :pattern <% lower(name) "
+                "ORDER BY word_similarity(:pattern, lower(name)) DESC, "
+                "length(name), name LIMIT :limit"
+            ),
+            {"pattern": pattern.lower(), "limit": MAX_CANDIDATES},
+        )
+        return [row[0] for row in rows]
+
+
+_backends: Dict[str, Optional[TrigramSearch]] = {}
+
+
+def has_trigram_index(connection: Connection) -> bool:
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        query = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"
+        params = {"name": SQLITE_TRIGRAM_TABLE}
+    elif dialect == "postgresql":
+        query = "SELECT 1 FROM pg_indexes WHERE indexname = :name"
+        params = {"name": POSTGRES_TRIGRAM_INDEX}
+    else:
+        return False
+    return connection.execute(text(query), params).first() is not None
+
+
+def get_trigram_search(session: Session) -> Optional[TrigramSearch]:
+    """
+    Returns trigram search backend for database dialect,
+    or None when database does not provide trigram index of keyword names.
+    Index availability is checked once per database.
+    """
+    bind = session.get_bind()
+    key = str(bind.url)
+    if key not in _backends:
+        if not has_trigram_index(session.connection()):
+            _backends[key] = None
+        elif bind.dialect.name == "sqlite":
+            _backends[key] = SqliteTrigramSearch()
+        else:
+            _backends[key] = PostgresTrigramSearch()
+    return _backends[key]
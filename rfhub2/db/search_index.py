@@ -0,0 +1,224 @@
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+import re
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, selectinload
+from sqlalchemy.orm.session import Session
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Set
+
+from rfhub2.db.base import Collection, Keyword
+from rfhub2.db.repository.full_text_search import GLOB_CHARACTERS, SEARCH_TERM
+from rfhub2.db.repository.query_utils import glob_to_sql
+from rfhub2.model import Keyword as ModelKeyword
+
+WILDCARD = "*"
+INDEXED_ENTITIES = (Collection, Keyword)
+DIRTY_FLAG = "search_index_dirty"
+
+Postings = Dict[str, array]
+
+
+def tokenize(text: Optional[str]) -> Set[str]:
+    return set(SEARCH_TERM.findall(text.lower())) if text else set()
+
+
+def like_to_regex(pattern: str) -> Pattern:
+    """
+    Converts glob-like pattern to regular expression with the same semantics
+    as case insensitive LIKE with pattern created by glob_to_sql.
+    """
+    like = glob_to_sql(pattern)
+    regex = []
+    i = 0
+    while i < len(like):
+        char = like[i]
+        if char == "\\" and i + 1 < len(like):
+            regex.append(re.escape(like[i + 1]))
+            i += 2
+            continue
+        regex.append({"%": ".*", "_": "."}.get(char) or re.escape(char))
+        i += 1
+    return re.compile("".join(regex), re.IGNORECASE | re.DOTALL)
+
+
+def build_postings(documents: Iterable[Iterable[str]]) -> Postings:
+    postings = defaultdict(lambda: array("I"))
+    for position, tokens in enumerate(documents):
+        for token in tokens:
+            postings[token].append(position)
+    return dict(postings)
+
+
+class KeywordSearchIndex:
+    """
+    Immutable in-memory inverted index of keyword names, documentation and tags.
+    Keywords are stored in name order and posting arrays contain their positions,
+    so merged postings are already sorted the same way as database results.
+    Search terms are matched as token prefixes, like in full-text database search,
+    keywords matching terms in name are returned before those matching only in documentation.
+    """
+
+    def __init__(self, keywords: List[ModelKeyword]) -> None:
+        self.keywords = sorted(keywords, key=lambda keyword: keyword.name)
+        self.collection_names = [keyword.collection.name for keyword in self.keywords]
+        self.name_postings = build_postings(
+            tokenize(keyword.name) for keyword in self.keywords
+        )
+        self.doc_postings = build_postings(
+            tokenize(keyword.doc) for keyword in self.keywords
+        )
+        self.tag_postings = build_postings(
+            {tag.lower() for tag in keyword.tags} for keyword in self.keywords
+        )
+        self.sorted_name_tokens = sorted(self.name_postings)
+        self.sorted_doc_tokens = sorted(self.doc_postings)
+        self.sorted_tags = sorted(self.tag_postings)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    @staticmethod
+    def _prefix_matches(
+        prefix: str, sorted_tokens: List[str], postings: Postings
+    ) -> Set[int]:
+        result = set()
+        for i in range(bisect_left(sorted_tokens, prefix), len(sorted_tokens)):
+            token = sorted_tokens[i]
+            if not token.startswith(prefix):
+                break
+            result.update(postings[token])
+        return result
+
+    def _all_terms_matches(self, terms: List[str], use_doc: bool) -> Set[int]:
+        result = None
+        for term in terms:
+            matches = self._prefix_matches(
+                term, self.sorted_name_tokens, self.name_postings
+            )
+            if use_doc:
+                matches |= self._prefix_matches(
+                    term, self.sorted_doc_tokens, self.doc_postings
+                )
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result
+
+    def search(
+        self,
+        pattern: Optional[str],
+        collection_name: Optional[str] = None,
+        use_doc: bool = True,
+        use_tags: bool = False,
+    ) -> Optional[List[ModelKeyword]]:
+        """
+        Returns keywords matching search parameters,
+        or None if pattern contains glob metacharacters that index does not support.
+        """
+        if not pattern or pattern == WILDCARD:
+            ranked = [range(len(self.keywords))]
+        elif GLOB_CHARACTERS.search(pattern):
+            return None
+        elif use_tags:
+            ranked = [
+                sorted(
+                    self._prefix_matches(
+                        pattern.strip().lower(), self.sorted_tags, self.tag_postings
+                    )
+                )
+            ]
+        else:
+            terms = SEARCH_TERM.findall(pattern.lower())
+            if not terms:
+                return None
+            name_matches = self._all_terms_matches(terms, use_doc=False)
+            ranked = [sorted(name_matches)]
+            if use_doc:
+                doc_matches = self._all_terms_matches(terms, use_doc=True)
+                ranked.append(sorted(doc_matches - name_matches))
+        collection_filter = self._collection_filter(collection_name)
+        return [
+            self.keywords[position]
+            for positions in ranked
+            for position in positions
+            if collection_filter(self.collection_names[position])
+        ]
+
+    @staticmethod
+    def _collection_filter(collection_name: Optional[str]) -> Callable[[str], bool]:
+        if not collection_name:
+            return lambda _: True
+        regex = like_to_regex(collection_name)
+        return lambda name: regex.fullmatch(name) is not None
+
+
+class KeywordSearchIndexCache:
+    """
+    Holds search index built from database, rebuilt lazily after it was invalidated.
+    Index is invalidated whenever collections or keywords are changed
+    in committed transaction of any session in this process.
+    """
+
+    def __init__(self) -> None:
+        self._index: Optional[KeywordSearchIndex] = None
+        self._version = 0
+        self._lock = Lock()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._index = None
+
+    @property
+    def cached(self) -> Optional[KeywordSearchIndex]:
+        return self._index
+
+    def get(self, session: Session) -> KeywordSearchIndex:
+        index = self._index
+        if index is not None:
+            return index
+        with self._lock:
+            version = self._version
+        keywords = [
+            keyword.to_model()
+            for keyword in session.query(Keyword).options(
+                selectinload(Keyword.collection)
+            )
+        ]
+        index = KeywordSearchIndex(keywords)
+        with self._lock:
+            if self._version == version:
+                self._index = index
+        return index
+
+
+keyword_search_index = KeywordSearchIndexCache()
+
+
+@event.listens_for(Session, "after_flush")
+def mark_flushed_changes(session: Session, _) -> None:
+    for item in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(item, INDEXED_ENTITIES):
+            session.info[DIRTY_FLAG] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def mark_bulk_changes(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and issubclass(mapper.class_, INDEXED_ENTITIES):
+            orm_execute_state.session.info[DIRTY_FLAG] = True
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_search_index(session: Session) -> None:
+    if session.info.pop(DIRTY_FLAG, False):
+        keyword_search_index.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_changes(session: Session) -> None:
+    session.info.pop(DIRTY_FLAG, None)
@@ -1,31 +1,78 @@
 from sqlalchemy import create_engine, event
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import scoped_session, sessionmaker
-import sqlite3
+from sqlalchemy.pool import QueuePool
+from typing import Any, Dict
 
 from rfhub2 import config
 
 
-def create_sqlalchemy_engine(db_uri: str) -> Engine:
-    if db_uri.startswith("sqlite://"):
-        engine_kwargs = {"connect_args": {"check_same_thread": False}}
-    else:
-        engine_kwargs = {}
-    return create_engine(
-        config.SQLALCHEMY_DB_URI, pool_pre_ping=True, echo=False, **engine_kwargs
-    )
+def is_sqlite(db_uri: str) -> bool:
+    return make_url(db_uri).get_backend_name() == "sqlite"
+
+
+def is_sqlite_file(db_uri: str) -> bool:
+    return is_sqlite(db_uri) and make_url(db_uri).database not in (None, "", ":memory:")
+
+
+def pool_options(db_uri: str) -> Dict[str, Any]:
+    """
+    Returns connection pool settings from configuration.
+    Size of the pool is not set for SQLite, which uses pool class without size limits by default.
+    """
+    options = {
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+    }
+    if not is_sqlite(db_uri):
+        options.update(
+            pool_size=config.DB_POOL_SIZE, max_overflow=config.DB_MAX_OVERFLOW
+        )
+    return options
 
 
-@event.listens_for(Engine, "connect")
-def set_sqlite_fk_pragma(db_api_connection, _):
+def set_sqlite_pragmas(db_api_connection, _) -> None:
     """
     Setting foreign keys pragma is required to enable on delete cascade behavior
-    for foreign key fields which is by default disabled
+    for foreign key fields which is by default disabled.
+    Write-ahead log lets readers proceed while data is being imported,
+    and with normal synchronous mode commits do not wait for disk sync.
     """
-    if isinstance(db_api_connection, sqlite3.Connection):
-        cursor = db_api_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON;")
-        cursor.close()
+    cursor = db_api_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON;")
+    cursor.execute(f"PRAGMA journal_mode={config.DB_SQLITE_JOURNAL_MODE};")
+    cursor.execute(f"PRAGMA synchronous={config.DB_SQLITE_SYNCHRONOUS};")
+    cursor.execute(f"PRAGMA mmap_size={config.DB_SQLITE_MMAP_SIZE:d};")
+    cursor.execute(f"PRAGMA cache_size={config.DB_SQLITE_CACHE_SIZE:d};")
+    cursor.close()
+
+
+def tune_sqlite_connections(engine: Engine) -> None:
+    """
+    Sets pragmas on every new connection of engine using SQLite database.
+    Async engine is tuned through its synchronous engine, whose connections
+    are adapted by SQLAlchemy to DBAPI.
+    """
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", set_sqlite_pragmas)
+
+
+def create_sqlalchemy_engine(db_uri: str) -> Engine:
+    engine_kwargs = pool_options(db_uri)
+    if is_sqlite(db_uri):
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    if is_sqlite_file(db_uri):
+        # keep connections open, so that page cache and memory map are reused;
+        # pooled connections read concurrently, but SQLite still serialises writers,
+        # which wait for the lock up to sqlite3 timeout (5 seconds by default)
+        engine_kwargs.update(
+            poolclass=QueuePool,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+        )
+    engine = create_engine(db_uri, echo=False, **engine_kwargs)
+    tune_sqlite_connections(engine)
+    return engine
 
 
 engine = create_sqlalchemy_engine(config.SQLALCHEMY_DB_URI)
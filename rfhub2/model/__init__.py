@@ -1,7 +1,8 @@
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, validator
-from typing import List, Optional
+from pydantic.dataclasses import dataclass
+from typing import List, Optional, Union
 
 
 class VersionInfo(BaseModel):
@@ -54,6 +55,60 @@ class CollectionUpdate(BaseModel):
     doc_format: Optional[str]
 
 
+@dataclass
+class CollectionUpdateWithKeywords:
+    collection: CollectionUpdate
+    keywords: List[KeywordUpdate]
+
+
+class CollectionUpdateWithKeywordsList(BaseModel):
+    __root__: List[CollectionUpdateWithKeywords]
+
+    @staticmethod
+    def of(
+        items: List[CollectionUpdateWithKeywords]
+    ) -> "CollectionUpdateWithKeywordsList":
+        return CollectionUpdateWithKeywordsList(__root__=items)
+
+
+class CollectionFingerprint(BaseModel):
+    name: str
+    path: Optional[str]
+    fingerprint: str
+
+
+class CollectionFingerprintList(BaseModel):
+    __root__: List[CollectionFingerprint]
+
+    @staticmethod
+    def of(items: List[CollectionFingerprint]) -> "CollectionFingerprintList":
+        return CollectionFingerprintList(__root__=items)
+
+
+# collections given only by fingerprint are kept unchanged when synchronized
+CollectionSyncItem = Union[CollectionUpdateWithKeywords, CollectionFingerprint]
+
+
+class CollectionSyncList(BaseModel):
+    __root__: List[CollectionSyncItem]
+
+    @staticmethod
+    def of(items: List[CollectionSyncItem]) -> "CollectionSyncList":
+        return CollectionSyncList(__root__=items)
+
+
+class CollectionsInserted(BaseModel):
+    collections: int
+    keywords: int
+
+
+class CollectionsSynced(BaseModel):
+    inserted: int
+    updated: int
+    deleted: int
+    keywords: int
+
+
 class NestedKeyword(KeywordUpdate):
     id: int
     synopsis: Optional[str]
@@ -73,6 +128,14 @@ class CollectionWithStats(Collection):
     keyword_count: int
 
 
+class CollectionSummary(NestedCollection):
+    type: Optional[str]
+    version: Optional[str]
+    synopsis: Optional[str]
+    times_used: int
+    keyword_count: int
+
+
 class Keyword(NestedKeyword):
     collection: NestedCollection
 
@@ -111,6 +174,16 @@ class StatisticsInserted(BaseModel):
     inserted: int
 
 
+class StatisticsBucket(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+
+
+class StatisticsCompacted(BaseModel):
+    compacted: int
+    created: int
+
+
 class KeywordType(str, Enum):
     SETUP = "SETUP"
     NORMAL = "NORMAL"
@@ -0,0 +1,70 @@
+from mimetypes import guess_type
+import os
+import stat
+from os import PathLike
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+from typing import List, Optional, Tuple
+
+from rfhub2.api.middleware.compression_middleware import accepted_encodings
+
+# encodings of precompressed files with their extensions, the best compressing one first
+EXTENSIONS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def precompressed_extensions(accept_encoding: Optional[str]) -> List[Tuple[str, str]]:
+    """
+    Returns encodings of precompressed files accepted by client, with their extensions.
+    Unlike for compressed responses, no package is needed to serve them.
+    """
+    accepted = accepted_encodings(accept_encoding)
+    return [
+        (encoding, extension)
+        for encoding, extension in EXTENSIONS
+        if accepted.get(encoding, accepted.get("*", 0)) > 0
+    ]
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    Serves precompressed `.br` or `.gz` sibling of requested file,
+    when client accepts its encoding, so that frontend bundle is not compressed on each request.
+    """
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        for encoding, extension in precompressed_extensions(
+            request_headers.get("accept-encoding")
+        ):
+            compressed_path = f"{full_path}{extension}"
+            compressed_stat = self._regular_file_stat(compressed_path)
+            if compressed_stat is None:
+                continue
+            response = FileResponse(
+                compressed_path,
+                status_code=status_code,
+                stat_result=compressed_stat,
+                method=scope["method"],
+                headers={"content-encoding": encoding, "vary": "Accept-Encoding"},
+                media_type=guess_type(str(full_path))[0] or "text/plain",
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        return super().file_response(full_path, stat_result, scope, status_code)
+
+    @staticmethod
+    def _regular_file_stat(path: str) -> Optional[os.stat_result]:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        return stat_result if stat.S_ISREG(stat_result.st_mode) else None
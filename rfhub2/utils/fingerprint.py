@@ -0,0 +1,51 @@
+import json
+from hashlib import sha256
+from typing import Any, Iterable
+
+from rfhub2.model import CollectionUpdate, KeywordUpdate
+
+
+def _digest(*values: Any) -> str:
+    return sha256(json.dumps(values).encode()).hexdigest()
+
+
+def keywords_fingerprint(keywords: Iterable[KeywordUpdate]) -> str:
+    """
+    Returns hash of keywords content. Order and duplicates of keywords
+    do not change the hash, so keyword lists are compared like sets.
+    """
+    return _digest(
+        *sorted(
+            {
+                _digest(keyword.name, keyword.doc, keyword.args, keyword.tags or [])
+                for keyword in keywords
+            }
+        )
+    )
+
+
+def collection_doc_fingerprint(collection: CollectionUpdate) -> str:
+    """
+    Returns hash of collection documentation, without its keywords.
+    """
+    return _digest(
+        collection.name,
+        collection.type,
+        collection.version,
+        collection.scope,
+        collection.named_args,
+        collection.path,
+        collection.doc,
+        collection.doc_format,
+    )
+
+
+def collection_fingerprint(
+    collection: CollectionUpdate, keywords: Iterable[KeywordUpdate]
+) -> str:
+    """
+    Returns hash of collection documentation together with its keywords.
+    """
+    return _digest(
+        collection_doc_fingerprint(collection), keywords_fingerprint(keywords)
+    )
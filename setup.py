@@ -23,13 +23,16 @@ setup(
         'fastapi>=0.46.0',
         'pydantic>=1.0,<2.0',
         'robotframework>=3.0.0',
-        'SQLAlchemy>=1.2.0',
+        'SQLAlchemy>=1.4.0',
         'requests>=2.10.0',
         'uvicorn>=0.7.1',
         'progress>=1.4'
     ],
     extras_require={
-        "postgresql": ["psycopg2-binary>=2.7.4"]
+        "postgresql": ["psycopg2-binary>=2.7.4"],
+        "async-sqlite": ["aiosqlite>=0.17.0"],
+        "async-postgresql": ["asyncpg>=0.24.0"],
+        "brotli": ["brotli>=1.0.0"],
     },
     classifiers=[
         "Development Status :: 4 - Beta",
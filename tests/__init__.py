@@ -1,19 +1,37 @@
 from tests.unit.api.endpoints.collections_tests import CollectionsApiTest
+from tests.unit.api.endpoints.compression_tests import (
+    CompressionApiTest,
+    CompressionTest,
+)
+from tests.unit.api.endpoints.gzip_request_tests import (
+    GzipRequestApiTest,
+    GzipRequestMiddlewareTest,
+)
 from tests.unit.api.endpoints.healthcheck_tests import HealthcheckApiTest
 from tests.unit.api.endpoints.keywords_tests import KeywordsApiTest
+from tests.unit.api.endpoints.response_cache_tests import ResponseCacheApiTest
 from tests.unit.api.endpoints.statistics_tests import StatisticsApiTest
 from tests.unit.api.endpoints.version_tests import VersionApiTest
 from tests.unit.cli.api_client import ApiClientTests
+from tests.unit.cli.keywords.extraction_cache import ExtractionCacheTests
 from tests.unit.cli.keywords.keywords_extractor import KeywordsExtractorTests
 from tests.unit.cli.keywords.keywords_importer import KeywordsImporterTests
 from tests.unit.cli.statistics.statistics_extractor import StatisticsExtractorTests
 from tests.unit.cli.statistics.statistics_importer import StatisticsImporterTests
+from tests.unit.db.async_session_tests import AsyncSessionTest
+from tests.unit.db.backfill_tests import BackfillTest
 from tests.unit.db.collection_repo_tests import CollectionRepositoryTest
 from tests.unit.db.collection_tests import CollectionTest
 from tests.unit.db.keyword_repo_tests import KeywordRepositoryTest
+from tests.unit.db.keyword_statistics_repo_tests import KeywordStatisticsRepositoryTest
 from tests.unit.db.keyword_tests import KeywordTest
+from tests.unit.db.pagination_tests import PaginationTest
+from tests.unit.db.search_index_tests import KeywordSearchIndexTest
+from tests.unit.db.session_tests import SessionTest
 from tests.unit.db.suite_repo_tests import SuiteRepositoryTest
 from tests.unit.db.test_case_repo_tests import TestCaseRepositoryTest
+from tests.unit.db.trigram_search_tests import TrigramSearchTest
 from tests.unit.ui.search_params_tests import SearchParamsTest
 from tests.unit.ui.ui_router_tests import UIRouterTest
+from tests.unit.utils.fingerprint_tests import FingerprintTest
 from tests.unit.utils.path_ops_tests import PathOpsTest
@@ -117,6 +117,19 @@ class BaseApiEndpointTest(unittest.TestCase):
         "tags": [],
         "collection": {"id": COLLECTION_2["id"], "name": COLLECTION_2["name"]},
     }
+    KEYWORD_TO_BULK_CREATE = {
+        "name": "New Keyword",
+        "doc": "New doc",
+        "args": None,
+        "tags": ["tag"],
+    }
+    NESTED_KEYWORD_BULK_CREATED = {
+        **KEYWORD_TO_BULK_CREATE,
+        "id": 5,
+        "synopsis": "New doc",
+        "html_doc": "<p>New doc</p>",
+        "arg_string": "",
+    }
     KEYWORD_TO_UPDATE = {
         "name": "Updated Teardown",
         "doc": "Updated Clean up environment",
@@ -1,3 +1,5 @@
+from rfhub2.model import CollectionUpdate
+from rfhub2.utils.fingerprint import collection_fingerprint
 from tests.unit.api.endpoints.base_endpoint_tests import BaseApiEndpointTest
 
 
@@ -46,6 +48,34 @@ class CollectionsApiTest(BaseApiEndpointTest):
         self.assertEqual(len(body), 1)
         self.assertEqual(body[0], self.COLLECTION_2)
 
+    def test_get_all_collections_with_cursor(self):
+        response = self.client.get("api/v1/collections?limit=2")
+        self.assertEqual(response.json(), [self.COLLECTION_1, self.COLLECTION_2])
+        cursor = response.headers["X-Next-Cursor"]
+        response = self.client.get(f"api/v1/collections?limit=2&cursor={cursor}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [self.COLLECTION_3])
+        self.assertNotIn("X-Next-Cursor", response.headers)
+
+    def test_get_all_collections_with_statistics_with_cursor(self):
+        response = self.client.get("api/v1/collections/stats/?limit=1&order=-name")
+        cursor = response.headers["X-Next-Cursor"]
+        response = self.client.get(
+            f"api/v1/collections/stats/?limit=1&order=-name&cursor={cursor}"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [collection["name"] for collection in response.json()],
+            [self.COLLECTION_2["name"]],
+        )
+
+    def test_get_400_for_invalid_cursor(self):
+        for cursor in ("not-a-cursor", "WzFd"):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(f"api/v1/collections?cursor={cursor}")
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {"detail": "Invalid cursor"})
+
     def test_get_all_collections_with_filter_pattern(self):
         response = self.client.get("api/v1/collections?pattern=collection")
         self.assertEqual(response.status_code, 200)
@@ -93,6 +123,43 @@ class CollectionsApiTest(BaseApiEndpointTest):
             ],
         )
 
+    def test_get_collection_summaries(self):
+        response = self.client.get("api/v1/collections/summary/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            [
+                self.summary(self.COLLECTION_1_WITH_STATS),
+                self.summary(self.COLLECTION_2_WITH_STATS),
+                self.summary(self.COLLECTION_3_WITH_STATS),
+            ],
+        )
+
+    def test_get_collection_summaries_filtered_and_ordered(self):
+        response = self.client.get(
+            "api/v1/collections/summary/?pattern=collection&order=-keyword_count&limit=1"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [self.summary(self.COLLECTION_1_WITH_STATS)])
+        cursor = response.headers["X-Next-Cursor"]
+        response = self.client.get(
+            f"api/v1/collections/summary/?pattern=collection&order=-keyword_count&cursor={cursor}"
+        )
+        self.assertEqual(response.json(), [self.summary(self.COLLECTION_2_WITH_STATS)])
+
+    @staticmethod
+    def summary(collection: dict) -> dict:
+        fields = (
+            "id",
+            "name",
+            "type",
+            "version",
+            "synopsis",
+            "times_used",
+            "keyword_count",
+        )
+        return {field: collection[field] for field in fields}
+
     def test_get_all_collections_with_statistics_ordered_by_calculated_fields(self):
         for order in ["keyword_count", "times_used"]:
             with self.subTest(order=order):
@@ -129,6 +196,98 @@ class CollectionsApiTest(BaseApiEndpointTest):
         )
         self.assertEqual(response.status_code, 401)
 
+    def test_create_new_collections_with_keywords(self):
+        response = self.auth_client.post(
+            "api/v1/collections/bulk/",
+            json=[
+                {
+                    "collection": self.COLLECTION_TO_CREATE,
+                    "keywords": [self.KEYWORD_TO_BULK_CREATE],
+                },
+                {"collection": {"name": "Empty collection"}, "keywords": []},
+            ],
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {"collections": 2, "keywords": 1})
+        response = self.client.get("api/v1/collections/4/")
+        self.assertEqual(
+            response.json(),
+            {**self.COLLECTION_CREATED, "keywords": [self.NESTED_KEYWORD_BULK_CREATED]},
+        )
+
+    def test_should_not_create_new_collections_with_keywords_without_auth(self):
+        response = self.client.post(
+            "api/v1/collections/bulk/",
+            json=[{"collection": self.COLLECTION_TO_CREATE, "keywords": []}],
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_sync_collections(self):
+        response = self.auth_client.post(
+            "api/v1/collections/sync/",
+            json=[
+                {
+                    "collection": self.COLLECTION_TO_CREATE,
+                    "keywords": [self.KEYWORD_TO_BULK_CREATE],
+                }
+            ],
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(), {"inserted": 1, "updated": 0, "deleted": 3, "keywords": 1}
+        )
+        response = self.client.get("api/v1/collections/")
+        self.assertEqual(
+            [collection["name"] for collection in response.json()],
+            [self.COLLECTION_TO_CREATE["name"]],
+        )
+
+    def test_sync_collections_without_removing_missing_ones(self):
+        response = self.auth_client.post(
+            "api/v1/collections/sync/?remove_missing=false",
+            json=[{"collection": self.COLLECTION_TO_CREATE, "keywords": []}],
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(), {"inserted": 1, "updated": 0, "deleted": 0, "keywords": 0}
+        )
+        response = self.client.get("api/v1/collections/")
+        self.assertEqual(len(response.json()), 4)
+
+    def test_sync_collections_given_by_fingerprint(self):
+        response = self.auth_client.post(
+            "api/v1/collections/sync/",
+            json=[{"name": "Third", "path": None, "fingerprint": "abc"}],
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(), {"inserted": 0, "updated": 0, "deleted": 2, "keywords": 0}
+        )
+
+    def test_get_changed_collections(self):
+        self.auth_client.post(
+            "api/v1/collections/sync/",
+            json=[{"collection": self.COLLECTION_TO_CREATE, "keywords": []}],
+        )
+        stored = {
+            "name": self.COLLECTION_TO_CREATE["name"],
+            "path": self.COLLECTION_TO_CREATE["path"],
+            "fingerprint": collection_fingerprint(
+                CollectionUpdate(**self.COLLECTION_TO_CREATE), []
+            ),
+        }
+        new = {"name": "New", "path": None, "fingerprint": "abc"}
+        response = self.client.post("api/v1/collections/changed/", json=[stored, new])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [new])
+
+    def test_should_not_sync_collections_without_auth(self):
+        response = self.client.post(
+            "api/v1/collections/sync/",
+            json=[{"collection": self.COLLECTION_TO_CREATE, "keywords": []}],
+        )
+        self.assertEqual(response.status_code, 401)
+
     def test_update_existing_collection(self):
         response = self.auth_client.put(
             f"api/v1/collections/{self.COLLECTION_3['id']}/",
@@ -0,0 +1,124 @@
+from importlib.util import find_spec
+from pathlib import Path
+import gzip
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+from tempfile import TemporaryDirectory
+import unittest
+from unittest.mock import patch
+
+from rfhub2.api.middleware.compression_middleware import (
+    accepted_encodings,
+    preferred_encodings,
+)
+from rfhub2.ui.static_files import PrecompressedStaticFiles
+from tests.unit.api.endpoints.base_endpoint_tests import BaseApiEndpointTest
+
+
+class CompressionApiTest(BaseApiEndpointTest):
+    def test_should_compress_large_json_response(self):
+        plain = self.client.get(
+            "api/v1/keywords/stats/", headers={"Accept-Encoding": "identity"}
+        )
+        response = self.client.get(
+            "api/v1/keywords/stats/", headers={"Accept-Encoding": "gzip"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(response.headers["Vary"], "Accept-Encoding")
+        self.assertEqual(response.headers["ETag"], f"W/{plain.headers['ETag']}")
+        self.assertLess(int(response.headers["Content-Length"]), len(plain.content))
+        self.assertEqual(response.json(), plain.json())
+
+    def test_should_not_compress_small_response(self):
+        response = self.client.get(
+            "api/v1/version/", headers={"Accept-Encoding": "gzip"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_should_not_compress_response_when_client_does_not_accept_it(self):
+        for accept_encoding in ("identity", "gzip;q=0", "deflate"):
+            with self.subTest(accept_encoding=accept_encoding):
+                response = self.client.get(
+                    "api/v1/keywords/stats/",
+                    headers={"Accept-Encoding": accept_encoding},
+                )
+                self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_should_return_not_modified_for_etag_of_compressed_response(self):
+        headers = {"Accept-Encoding": "gzip"}
+        etag = self.client.get("api/v1/keywords/stats/", headers=headers).headers[
+            "ETag"
+        ]
+        response = self.client.get(
+            "api/v1/keywords/stats/", headers={**headers, "If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+
+    def test_should_return_not_modified_for_etag_of_small_response(self):
+        headers = {"Accept-Encoding": "gzip"}
+        etag = self.client.get("api/v1/keywords/1/", headers=headers).headers["ETag"]
+        self.assertFalse(etag.startswith("W/"))
+        response = self.client.get(
+            "api/v1/keywords/1/", headers={**headers, "If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+
+
+class CompressionTest(unittest.TestCase):
+    def test_accepted_encodings_should_return_quality_values(self):
+        self.assertEqual(
+            accepted_encodings("gzip;q=0.5, br , identity;q=0, *;q=x"),
+            {"gzip": 0.5, "br": 1.0, "identity": 0.0, "*": 0.0},
+        )
+
+    def test_preferred_encodings_should_skip_not_accepted_encodings(self):
+        self.assertEqual(preferred_encodings("gzip;q=0, deflate"), [])
+        self.assertEqual(preferred_encodings("*")[-1], "gzip")
+        self.assertEqual(preferred_encodings(None), [])
+
+    @unittest.skipUnless(find_spec("brotli"), "brotli is not installed")
+    def test_preferred_encodings_should_prefer_brotli(self):
+        self.assertEqual(preferred_encodings("gzip, br"), ["br", "gzip"])
+
+    def test_should_serve_precompressed_static_file(self):
+        with TemporaryDirectory() as directory:
+            source = b"console.log('rfhub2');" * 100
+            (Path(directory) / "main.js").write_bytes(source)
+            (Path(directory) / "main.js.gz").write_bytes(gzip.compress(source))
+            app = Starlette()
+            app.mount("/static", PrecompressedStaticFiles(directory=directory))
+            client = TestClient(app)
+            compressed = client.get(
+                "/static/main.js", headers={"Accept-Encoding": "gzip"}
+            )
+            plain = client.get(
+                "/static/main.js", headers={"Accept-Encoding": "identity"}
+            )
+        self.assertEqual(compressed.headers["Content-Encoding"], "gzip")
+        self.assertEqual(compressed.headers["Vary"], "Accept-Encoding")
+        self.assertIn("javascript", compressed.headers["Content-Type"])
+        self.assertEqual(compressed.content, source)
+        self.assertNotIn("Content-Encoding", plain.headers)
+        self.assertEqual(plain.content, source)
+
+    def test_should_serve_precompressed_brotli_file_without_brotli_package(self):
+        with TemporaryDirectory() as directory:
+            (Path(directory) / "main.js").write_bytes(b"console.log('rfhub2');")
+            (Path(directory) / "main.js.br").write_bytes(b"brotli")
+            (Path(directory) / "main.js.gz").write_bytes(b"gzip")
+            app = Starlette()
+            app.mount("/static", PrecompressedStaticFiles(directory=directory))
+            client = TestClient(app)
+            with patch("rfhub2.api.middleware.compression_middleware.brotli", None):
+                response = client.get(
+                    "/static/main.js",
+                    headers={"Accept-Encoding": "gzip, br"},
+                    stream=True,
+                )
+                body = response.raw.read(decode_content=False)
+        self.assertEqual(response.headers["Content-Encoding"], "br")
+        self.assertEqual(body, b"brotli")
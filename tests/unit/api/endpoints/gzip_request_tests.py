@@ -0,0 +1,84 @@
+import asyncio
+import gzip
+import json
+from starlette.types import Message, Receive, Scope, Send
+from typing import List, Tuple
+import unittest
+
+from rfhub2.api.middleware.gzip_request_middleware import GzipRequestMiddleware
+
+from tests.unit.api.endpoints.base_endpoint_tests import BaseApiEndpointTest
+
+
+class GzipRequestApiTest(BaseApiEndpointTest):
+    def test_should_accept_gzip_compressed_request_body(self):
+        response = self.auth_client.post(
+            "api/v1/collections/",
+            data=gzip.compress(json.dumps(self.COLLECTION_TO_CREATE).encode()),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["name"], self.COLLECTION_TO_CREATE["name"])
+
+    def test_should_accept_uncompressed_request_body(self):
+        response = self.auth_client.post(
+            "api/v1/collections/", json=self.COLLECTION_TO_CREATE
+        )
+        self.assertEqual(response.status_code, 201)
+
+    def test_should_reject_invalid_gzip_request_body(self):
+        response = self.auth_client.post(
+            "api/v1/collections/",
+            data=b"not gzip",
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_should_not_decompress_request_body_of_read_endpoint(self):
+        response = self.client.get(
+            "api/v1/collections/",
+            data=b"not gzip",
+            headers={"Content-Encoding": "gzip"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+class GzipRequestMiddlewareTest(unittest.TestCase):
+    @staticmethod
+    def call(middleware: GzipRequestMiddleware, chunks: List[bytes]) -> Tuple:
+        received = []
+        sent = []
+
+        async def receive() -> Message:
+            chunk = chunks[len(received)]
+            received.append(chunk)
+            return {
+                "type": "http.request",
+                "body": chunk,
+                "more_body": len(received) < len(chunks),
+            }
+
+        async def send(message: Message) -> None:
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/v1/collections/",
+            "headers": [(b"content-encoding", b"gzip")],
+        }
+        asyncio.run(middleware(scope, receive, send))
+        return received, sent
+
+    def test_should_reject_oversized_body_before_it_is_fully_received(self):
+        app_called = []
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            app_called.append(scope)
+
+        compressed = gzip.compress(b"\0" * 1024 * 1024)
+        chunks = [compressed[i : i + 64] for i in range(0, len(compressed), 64)]
+        received, sent = self.call(GzipRequestMiddleware(app, max_size=4096), chunks)
+        self.assertEqual(sent[0]["status"], 413)
+        self.assertLess(len(received), len(chunks))
+        self.assertEqual(app_called, [])
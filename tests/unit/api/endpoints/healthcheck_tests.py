@@ -1,7 +1,6 @@
-from starlette.requests import Request
-from unittest.mock import Mock
+from unittest.mock import patch
 
-from rfhub2.api.utils.db import db_healthcheck
+from rfhub2.api.utils.db import db_healthcheck, get_db
 from rfhub2.db.session import Session
 from tests.unit.api.endpoints.base_endpoint_tests import BaseApiEndpointTest
 
@@ -13,7 +12,7 @@ class HealthcheckApiTest(BaseApiEndpointTest):
         self.assertEqual(response.json(), {"db": "ok"})
 
     def test_get_failed_healthcheck_response(self):
-        def mock_db_healthcheck(_: Request) -> bool:
+        def mock_db_healthcheck() -> bool:
             return False
 
         self.app.dependency_overrides[db_healthcheck] = mock_db_healthcheck
@@ -22,11 +21,17 @@ class HealthcheckApiTest(BaseApiEndpointTest):
         self.assertEqual(response.json(), {"db": "failure"})
 
     def test_successful_db_healthcheck(self):
-        request = Mock()
-        request.state.db = Session()
-        self.assertTrue(db_healthcheck(request))
+        session = Session()
+        self.assertTrue(db_healthcheck(session))
+        session.close()
 
     def test_failed_db_healthcheck(self):
-        request = Mock()
-        request.state.db = None
-        self.assertFalse(db_healthcheck(request))
+        self.assertFalse(db_healthcheck(None))
+
+    def test_should_close_db_session_when_request_handling_fails(self):
+        dependency = get_db()
+        session = next(dependency)
+        with patch.object(session, "close") as close:
+            with self.assertRaises(ValueError):
+                dependency.throw(ValueError())
+        close.assert_called_once()
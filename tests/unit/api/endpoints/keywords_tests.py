@@ -1,3 +1,7 @@
+from unittest.mock import patch
+
+from rfhub2 import config
+from rfhub2.db.session import Session
 from tests.unit.api.endpoints.base_endpoint_tests import BaseApiEndpointTest
 
 
@@ -12,6 +16,32 @@ class KeywordsApiTest(BaseApiEndpointTest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), self.KEYWORD_1_WITH_STATS)
 
+    def test_get_single_keyword_with_statistics_after_statistics_change(self):
+        self.auth_client.post(
+            "api/v1/statistics/keywords/",
+            json=[
+                {
+                    **self.STATISTICS_3,
+                    "execution_time": "2019-12-22T03:30:00",
+                    "times_used": 10,
+                    "total_elapsed": 3000,
+                }
+            ],
+        )
+        response = self.client.get("api/v1/keywords/stats/1/")
+        self.assertEqual(
+            response.json(),
+            {**self.KEYWORD_1_WITH_STATS, "times_used": 20, "avg_elapsed": 200.0},
+        )
+        self.auth_client.delete(
+            "api/v1/statistics/keywords/?collection=First collection&keyword=Test setup"
+        )
+        response = self.client.get("api/v1/keywords/stats/1/")
+        self.assertEqual(
+            response.json(),
+            {**self.KEYWORD_1_WITH_STATS, "times_used": None, "avg_elapsed": None},
+        )
+
     def test_get_404_for_nonexistent_keyword_id(self):
         response = self.client.get("api/v1/keywords/999/")
         self.assertEqual(response.status_code, 404)
@@ -48,6 +78,23 @@ class KeywordsApiTest(BaseApiEndpointTest):
         self.assertEqual(len(body), 3)
         self.assertEqual(body, [self.KEYWORD_3, self.KEYWORD_1, self.KEYWORD_4])
 
+    def test_get_all_keywords_with_cursor(self):
+        response = self.client.get("api/v1/keywords?limit=2")
+        cursor = response.headers["X-Next-Cursor"]
+        response = self.client.get(f"api/v1/keywords?limit=2&cursor={cursor}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [self.KEYWORD_1, self.KEYWORD_4])
+
+    def test_get_all_keywords_with_statistics_with_cursor(self):
+        response = self.client.get("api/v1/keywords/stats/?limit=3")
+        cursor = response.headers["X-Next-Cursor"]
+        response = self.client.get(f"api/v1/keywords/stats/?limit=3&cursor={cursor}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [keyword["name"] for keyword in response.json()], [self.KEYWORD_4["name"]]
+        )
+        self.assertNotIn("X-Next-Cursor", response.headers)
+
     def test_get_all_keywords_with_skip_and_limit(self):
         response = self.client.get("api/v1/keywords?skip=1&limit=1")
         self.assertEqual(response.status_code, 200)
@@ -117,6 +164,11 @@ class KeywordsApiTest(BaseApiEndpointTest):
         self.assertEqual(len(body), 1)
         self.assertEqual(body, [self.KEYWORD_3])
 
+    def test_search_keywords_with_part_of_word(self):
+        response = self.client.get("api/v1/keywords/search?pattern=name:%20ardow")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [self.KEYWORD_3])
+
     def test_search_keywords_without_results(self):
         response = self.client.get(
             "api/v1/keywords/search?pattern=name:%20teardown%20in:%20second"
@@ -149,6 +201,59 @@ class KeywordsApiTest(BaseApiEndpointTest):
                 self.assertEqual(response.status_code, 200)
                 self.assertEqual(response.json(), results)
 
+    def test_search_keywords_with_search_index(self):
+        cases = [
+            ("teardown%20in:%20first", [self.KEYWORD_3, self.KEYWORD_1]),
+            ("name:%20teardown", [self.KEYWORD_3]),
+            ("teardown%20in:%20first&skip=1", [self.KEYWORD_1]),
+            ("tear*", [self.KEYWORD_3, self.KEYWORD_1]),
+        ]
+        with patch.object(config, "SEARCH_INDEX", True):
+            for query, results in cases:
+                with self.subTest(query=query, results=results):
+                    response = self.client.get(
+                        f"api/v1/keywords/search?pattern={query}"
+                    )
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(response.json(), results)
+
+    def test_search_keywords_with_search_index_after_keyword_update(self):
+        with patch.object(config, "SEARCH_INDEX", True):
+            self.client.get("api/v1/keywords/search?pattern=teardown")
+            self.auth_client.put("api/v1/keywords/3/", json=self.KEYWORD_TO_UPDATE)
+            response = self.client.get("api/v1/keywords/search?pattern=name:%20updated")
+            self.assertEqual(response.json(), [self.KEYWORD_UPDATED])
+
+    def test_search_keywords_should_open_one_session_per_request(self):
+        for search_index in (False, True):
+            with self.subTest(search_index=search_index), patch.object(
+                config, "SEARCH_INDEX", search_index
+            ):
+                # index is built once and reused by following requests
+                self.client.get(
+                    f"api/v1/keywords/search?pattern=teardown&skip={int(search_index)}"
+                )
+                with patch("rfhub2.api.utils.db.Session", wraps=Session) as session:
+                    response = self.client.get(
+                        f"api/v1/keywords/search?pattern=name:%20teardown&limit={int(search_index) + 1}"
+                    )
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(session.call_count, 1)
+
+    def test_search_keywords_with_fuzzy_matching(self):
+        cases = [
+            ("tiardown", [self.KEYWORD_3]),
+            ("some kyword%20in:%20first", [self.KEYWORD_2]),
+            ("some kyword%20in:%20second", []),
+        ]
+        for query, results in cases:
+            with self.subTest(query=query, results=results):
+                response = self.client.get(
+                    f"api/v1/keywords/search?pattern={query}&fuzzy=true"
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), results)
+
     def test_get_empty_list_with_nonexistent_filter_pattern(self):
         response = self.client.get("api/v1/keywords?pattern=nonexistent")
         self.assertEqual(response.status_code, 200)
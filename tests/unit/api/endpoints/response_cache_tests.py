@@ -0,0 +1,119 @@
+from rfhub2.api.middleware.response_cache_middleware import (
+    CachedResponse,
+    ResponseCache,
+    etag_matches,
+)
+from tests.unit.api.endpoints.base_endpoint_tests import BaseApiEndpointTest
+
+
+class ResponseCacheApiTest(BaseApiEndpointTest):
+    def test_should_return_etag_for_read_endpoint(self):
+        response = self.client.get(
+            "api/v1/collections/", headers={"Accept-Encoding": "identity"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response.headers["ETag"], r'^"[0-9a-f]{32}"$')
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+
+    def test_should_return_the_same_response_from_cache(self):
+        first = self.client.get("api/v1/collections/stats/")
+        second = self.client.get("api/v1/collections/stats/")
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second.headers["ETag"], first.headers["ETag"])
+
+    def test_should_return_not_modified_for_matching_etag(self):
+        identity = {"Accept-Encoding": "identity"}
+        etag = self.client.get("api/v1/keywords/stats/", headers=identity).headers[
+            "ETag"
+        ]
+        for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            with self.subTest(if_none_match=if_none_match):
+                response = self.client.get(
+                    "api/v1/keywords/stats/",
+                    headers={**identity, "If-None-Match": if_none_match},
+                )
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b"")
+                self.assertEqual(response.headers["ETag"], etag)
+
+    def test_should_return_new_response_after_data_change(self):
+        response = self.client.get("api/v1/collections/")
+        etag = response.headers["ETag"]
+        self.auth_client.put(
+            f"api/v1/collections/{self.COLLECTION_3['id']}/",
+            json=self.COLLECTION_TO_UPDATE,
+        )
+        response = self.client.get(
+            "api/v1/collections/", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertIn(self.COLLECTION_UPDATED, response.json())
+
+    def test_should_cache_responses_per_query_string(self):
+        limited = self.client.get("api/v1/collections/?limit=1")
+        self.assertEqual(limited.json(), [self.COLLECTION_1])
+        self.assertIn("X-Next-Cursor", limited.headers)
+        response = self.client.get("api/v1/collections/?limit=1")
+        self.assertEqual(
+            response.headers["X-Next-Cursor"], limited.headers["X-Next-Cursor"]
+        )
+        all_collections = self.client.get("api/v1/collections/")
+        self.assertEqual(len(all_collections.json()), 3)
+
+    def test_should_set_cors_headers_of_cached_response_for_request_origin(self):
+        for origin in ("http://first.example.com", "http://second.example.com"):
+            with self.subTest(origin=origin):
+                response = self.client.get(
+                    "api/v1/collections/",
+                    headers={"Origin": origin, "Cookie": "session=1"},
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    response.headers["Access-Control-Allow-Origin"], origin
+                )
+
+    def test_should_not_cache_error_responses(self):
+        response = self.client.get("api/v1/collections/999/")
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("ETag", response.headers)
+
+    def test_should_evict_least_recently_used_responses(self):
+        cache = ResponseCache(max_size=2, max_bytes=1024)
+        items = [CachedResponse(body=b"", headers={}, etag=f'"{i}"') for i in range(3)]
+        cache.put(("a", ""), items[0], 1)
+        cache.put(("b", ""), items[1], 1)
+        cache.get(("a", ""), 1)
+        cache.put(("c", ""), items[2], 1)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(("a", ""), 1), items[0])
+        self.assertIsNone(cache.get(("b", ""), 1))
+
+    def test_should_limit_total_size_of_cached_responses(self):
+        cache = ResponseCache(max_size=10, max_bytes=10)
+        items = [
+            CachedResponse(body=body, headers={}, etag=f'"{i}"')
+            for i, body in enumerate((b"1234", b"12345", b"123", b"12345678901"))
+        ]
+        for key, item in zip("abcd", items):
+            cache.put((key, ""), item, 1)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size_bytes, 8)
+        self.assertIsNone(cache.get(("a", ""), 1))
+        self.assertIsNone(cache.get(("d", ""), 1))
+        self.assertEqual(cache.get(("c", ""), 1), items[2])
+
+    def test_should_clear_cache_when_data_version_changes(self):
+        cache = ResponseCache(max_size=10, max_bytes=1024)
+        item = CachedResponse(body=b"123", headers={}, etag='"1"')
+        cache.put(("a", ""), item, 1)
+        self.assertIsNone(cache.get(("b", ""), 2))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size_bytes, 0)
+        cache.put(("a", ""), item, 1)
+        self.assertIsNone(cache.get(("a", ""), 2))
+
+    def test_should_not_match_missing_or_different_etag(self):
+        self.assertFalse(etag_matches('"abc"', None))
+        self.assertFalse(etag_matches('"abc"', '"abd", W/"ab"'))
@@ -21,6 +21,18 @@ class StatisticsApiTest(BaseApiEndpointTest):
             response.json(), [self.STATISTICS_3, self.STATISTICS_2, self.STATISTICS_1]
         )
 
+    def test_get_all_collection_statistics_with_cursor(self):
+        response = self.client.get(
+            f"{self.base_url}?collection=First collection&limit=2"
+        )
+        cursor = response.headers["X-Next-Cursor"]
+        response = self.client.get(
+            f"{self.base_url}?collection=First collection&limit=2&cursor={cursor}"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [self.STATISTICS_3])
+        self.assertNotIn("X-Next-Cursor", response.headers)
+
     def test_get_all_keyword_statistics(self):
         response = self.client.get(
             f"{self.base_url}?collection=First collection&keyword=Some keyword"
@@ -120,6 +132,56 @@ class StatisticsApiTest(BaseApiEndpointTest):
         response = self.client.post(self.base_url, json=[self.STATISTICS_TO_CREATE])
         self.assertEqual(response.status_code, 401)
 
+    def test_compact_statistics_into_daily_buckets(self):
+        response = self.auth_client.post(f"{self.base_url}compact/?older_than_days=0")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"compacted": 6, "created": 4})
+        response = self.client.get(f"{self.base_url}?collection=Second collection")
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    **self.STATISTICS_4,
+                    "execution_time": "2019-12-21T00:00:00",
+                    "times_used": 15,
+                    "total_elapsed": 7500,
+                    "min_elapsed": 100,
+                    "max_elapsed": 1100,
+                }
+            ],
+        )
+        response = self.client.get(
+            f"{self.base_url}aggregated/?collection=First collection"
+        )
+        self.assertEqual(response.json(), self.AGGREGATED_STATS_COLLECTION_1)
+
+    def test_compact_statistics_into_weekly_buckets(self):
+        response = self.auth_client.post(
+            f"{self.base_url}compact/?older_than_days=0&bucket=week"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"compacted": 6, "created": 3})
+        response = self.client.get(
+            f"{self.base_url}?collection=First collection&keyword=Some keyword"
+        )
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    **self.STATISTICS_1,
+                    "execution_time": "2019-12-16T00:00:00",
+                    "times_used": 10,
+                    "total_elapsed": 5000,
+                    "min_elapsed": 200,
+                    "max_elapsed": 1500,
+                }
+            ],
+        )
+
+    def test_should_not_compact_statistics_without_auth(self):
+        response = self.client.post(f"{self.base_url}compact/?older_than_days=0")
+        self.assertEqual(response.status_code, 401)
+
     def test_delete_all_statistics(self):
         response = self.auth_client.delete(f"{self.base_url}all/")
         self.assertEqual(response.status_code, 204)
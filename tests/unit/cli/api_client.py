@@ -1,8 +1,17 @@
+import gzip
 import responses
 import unittest
 
-from rfhub2.cli.api_client import Client
-from rfhub2.model import CollectionUpdate, KeywordUpdate
+from rfhub2.cli.api_client import ApiRetry, Client
+from rfhub2.model import (
+    CollectionFingerprint,
+    CollectionFingerprintList,
+    CollectionSyncList,
+    CollectionUpdate,
+    CollectionUpdateWithKeywords,
+    CollectionUpdateWithKeywordsList,
+    KeywordUpdate,
+)
 
 COLLECTION = CollectionUpdate(
     name="Third",
@@ -54,6 +63,64 @@ class ApiClientTests(unittest.TestCase):
             response = self.client.add_collection(data=COLLECTION)
             self.assertEqual(response, (201, COLLECTION.json()))
 
+    def test_add_collections_with_keywords(self):
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                f"{self.collection_endpoint}bulk/",
+                json={"collections": 1, "keywords": 1},
+                status=201,
+                adding_headers={
+                    "Content-Type": "application/json",
+                    "accept": "application/json",
+                },
+            )
+            response = self.client.add_collections_with_keywords(
+                CollectionUpdateWithKeywordsList.of(
+                    [CollectionUpdateWithKeywords(COLLECTION, [KEYWORD])]
+                )
+            )
+            self.assertEqual(response, (201, {"collections": 1, "keywords": 1}))
+
+    def test_get_changed_collections(self):
+        fingerprint = {"name": "a", "path": "b", "fingerprint": "c"}
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                f"{self.collection_endpoint}changed/",
+                json=[fingerprint],
+                status=200,
+                adding_headers={
+                    "Content-Type": "application/json",
+                    "accept": "application/json",
+                },
+            )
+            response = self.client.get_changed_collections(
+                CollectionFingerprintList.of([CollectionFingerprint(**fingerprint)])
+            )
+            self.assertEqual(response, (200, [fingerprint]))
+
+    def test_sync_collections(self):
+        body = {"inserted": 1, "updated": 0, "deleted": 2, "keywords": 1}
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                f"{self.collection_endpoint}sync/?remove_missing=false",
+                json=body,
+                status=200,
+                adding_headers={
+                    "Content-Type": "application/json",
+                    "accept": "application/json",
+                },
+            )
+            response = self.client.sync_collections(
+                CollectionSyncList.of(
+                    [CollectionUpdateWithKeywords(COLLECTION, [KEYWORD])]
+                ),
+                remove_missing=False,
+            )
+            self.assertEqual(response, (200, body))
+
     def test_delete_collection(self):
         with responses.RequestsMock() as rsps:
             rsps.add(
@@ -90,3 +157,60 @@ class ApiClientTests(unittest.TestCase):
             )
             response = self.client.delete_all_collections()
             self.assertEqual(response.status_code, 204)
+
+    def test_should_compress_large_request_body(self):
+        keywords = [KEYWORD.copy(update={"name": f"kw{i}"}) for i in range(50)]
+        data = CollectionSyncList.of(
+            [CollectionUpdateWithKeywords(COLLECTION, keywords)]
+        )
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST, f"{self.collection_endpoint}sync/", json={}, status=200
+            )
+            self.client.sync_collections(data)
+            request = rsps.calls[0].request
+            self.assertEqual(request.headers["Content-Encoding"], "gzip")
+            self.assertEqual(gzip.decompress(request.body).decode(), data.json())
+
+    def test_should_not_compress_small_or_disabled_request_body(self):
+        client = Client(self.app_url, "rfhub", "rfhub", compress=False)
+        data = CollectionSyncList.of(
+            [CollectionUpdateWithKeywords(COLLECTION, [KEYWORD] * 50)]
+        )
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.POST, self.collection_endpoint, json={}, status=201)
+            rsps.add(
+                responses.POST, f"{self.collection_endpoint}sync/", json={}, status=200
+            )
+            self.client.add_collection(COLLECTION)
+            client.sync_collections(data)
+            for call in rsps.calls:
+                self.assertNotIn("Content-Encoding", call.request.headers)
+
+    def test_should_return_text_of_response_without_json_body(self):
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                self.collection_endpoint,
+                body="Bad Gateway",
+                status=502,
+                content_type="text/plain",
+            )
+            response = self.client.add_collection(COLLECTION)
+            self.assertEqual(response, (502, {"detail": "Bad Gateway"}))
+
+    def test_should_retry_only_requests_safe_to_send_again(self):
+        retry = self.client.session.get_adapter(self.app_url).max_retries
+        self.assertIsInstance(retry, ApiRetry)
+        self.assertEqual(retry.total, 3)
+        for method, status, expected in (
+            ("GET", 500, True),
+            ("DELETE", 504, True),
+            ("POST", 502, True),
+            ("POST", 503, True),
+            ("POST", 500, False),
+            ("POST", 504, False),
+            ("GET", 404, False),
+        ):
+            with self.subTest(method=method, status=status):
+                self.assertEqual(retry.is_retry(method, status), expected)
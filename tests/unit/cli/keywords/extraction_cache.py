@@ -0,0 +1,91 @@
+import os
+import shutil
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest.mock import patch
+
+from rfhub2.cli.keywords.extraction_cache import ExtractionCache, default_cache_path
+from rfhub2.cli.keywords.keywords_extractor import KeywordsExtractor
+from .test_data import *
+
+
+class ExtractionCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.cache = ExtractionCache(self.root / "cache" / "extraction.db")
+        self.resource = self.root / "test_resource.resource"
+        shutil.copy(FIXTURE_PATH / "test_resource.resource", self.resource)
+        self.library = self.root / "LibWithInit"
+        shutil.copytree(FIXTURE_PATH / "LibWithInit", self.library)
+        self.collection = CollectionUpdateWithKeywords(
+            EXPECTED_COLLECTION_2, EXPECTED_KEYWORDS
+        )
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_default_cache_path_should_respect_xdg_cache_home(self):
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": self.tmp_dir.name}):
+            self.assertEqual(
+                default_cache_path(), self.root / "rfhub2" / "extraction.db"
+            )
+
+    def test_get_should_return_none_for_path_not_stored(self):
+        self.assertIsNone(self.cache.get(self.resource))
+
+    def test_get_should_return_stored_collection(self):
+        self.cache.put(self.resource, self.collection)
+        self.assertEqual(self.cache.get(self.resource), self.collection)
+
+    def test_get_should_return_stored_collection_when_only_mtime_changed(self):
+        self.cache.put(self.resource, self.collection)
+        stat = self.resource.stat()
+        os.utime(self.resource, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(self.cache.get(self.resource), self.collection)
+
+    def test_get_should_return_none_when_file_changed(self):
+        self.cache.put(self.resource, self.collection)
+        with open(self.resource, "a") as f:
+            f.write("\n# changed\n")
+        self.assertIsNone(self.cache.get(self.resource))
+
+    def test_get_should_return_none_when_library_module_changed(self):
+        self.cache.put(self.library, self.collection)
+        with open(self.library / "__init__.py", "a") as f:
+            f.write("\n# changed\n")
+        self.assertIsNone(self.cache.get(self.library))
+
+    def test_get_should_return_none_for_other_robot_version(self):
+        self.cache.put(self.resource, self.collection)
+        self.cache.robot_version = "0.0"
+        self.assertIsNone(self.cache.get(self.resource))
+
+    def test_cache_should_be_disabled_when_file_cannot_be_opened(self):
+        (self.root / "file").touch()
+        cache = ExtractionCache(self.root / "file" / "extraction.db")
+        cache.put(self.resource, self.collection)
+        self.assertIsNone(cache.get(self.resource))
+
+    def test_extractor_should_not_run_libdoc_for_cached_files(self):
+        cache_path = self.root / "cache" / "extraction.db"
+        extractor = KeywordsExtractor((self.root,), True, "", "", cache_path=cache_path)
+        collections = extractor.create_collections(extractor.get_libraries_paths())
+        extractor = KeywordsExtractor((self.root,), True, "", "", cache_path=cache_path)
+        with patch(
+            "rfhub2.cli.keywords.keywords_extractor.LibraryDocumentation"
+        ) as libdoc:
+            paths = extractor.get_libraries_paths()
+            self.assertEqual(extractor.create_collections(paths), collections)
+            libdoc.assert_not_called()
+
+    def test_extractor_should_filter_keywords_of_cached_collection(self):
+        self.cache.put(self.resource, self.collection)
+        extractor = KeywordsExtractor(
+            (self.root,), True, "", "second_tag", cache_path=self.cache.path
+        )
+        self.assertEqual(
+            extractor.create_collection(self.resource).keywords,
+            [kw for kw in EXPECTED_KEYWORDS if "second_tag" not in kw.tags],
+        )
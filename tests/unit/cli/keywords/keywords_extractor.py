@@ -1,11 +1,27 @@
+from concurrent.futures import ThreadPoolExecutor
 from importlib.util import find_spec
+import os
+import pickle
+import shutil
+from tempfile import TemporaryDirectory
 from robot.libdocpkg import LibraryDocumentation
 import unittest
+from unittest.mock import patch
 
 from rfhub2.cli.keywords.keywords_extractor import KeywordsExtractor
 from .test_data import *
 
 
+class PicklingExecutor(ThreadPoolExecutor):
+    """
+    Runs tasks in threads, pickling them like process pool does,
+    so that calls made by tasks can be counted in tests.
+    """
+
+    def map(self, fn, *iterables, **kwargs):
+        return super().map(pickle.loads(pickle.dumps(fn)), *iterables, **kwargs)
+
+
 class KeywordsExtractorTests(unittest.TestCase):
     def setUp(self) -> None:
         self.fixture_path = FIXTURE_PATH
@@ -64,6 +80,26 @@ class KeywordsExtractorTests(unittest.TestCase):
             result, [EXPECTED_COLLECTION_WITH_KW_1, EXPECTED_COLLECTION_WITH_KW_2]
         )
 
+    def test_create_collections_should_return_collection_list_with_multiple_jobs(self):
+        extractor = KeywordsExtractor((self.fixture_path,), True, "", "", jobs=2)
+        result = extractor.create_collections(
+            {
+                FIXTURE_PATH / "SingleClassLib" / "SingleClassLib.py",
+                FIXTURE_PATH / "test_libdoc_file.xml",
+                FIXTURE_PATH / "data_error.py",
+            }
+        )
+        self.assertListEqual(
+            result, [EXPECTED_COLLECTION_WITH_KW_1, EXPECTED_COLLECTION_WITH_KW_2]
+        )
+
+    def test_pickled_extractor_should_not_contain_libdoc_cache(self):
+        self.rfhub_extractor.create_collection(FIXTURE_PATH / "test_libdoc_file.xml")
+        self.assertTrue(self.rfhub_extractor._libdoc_cache)
+        copy = pickle.loads(pickle.dumps(self.rfhub_extractor))
+        self.assertEqual(copy._libdoc_cache, {})
+        self.assertEqual(copy.paths, self.rfhub_extractor.paths)
+
     def test_create_collection_should_return_collection(self):
         result = self.rfhub_extractor.create_collection(
             FIXTURE_PATH / "SingleClassLib" / "SingleClassLib.py"
@@ -96,6 +132,71 @@ class KeywordsExtractorTests(unittest.TestCase):
             result, "method should return false if file is python library without init"
         )
 
+    def test_library_should_be_documented_once_per_run(self):
+        path = self.fixture_path / "LibWithInit"
+        with patch(
+            "rfhub2.cli.keywords.keywords_extractor.LibraryDocumentation",
+            wraps=LibraryDocumentation,
+        ) as libdoc:
+            self.rfhub_extractor._traverse_paths(path)
+            self.rfhub_extractor._is_library_with_init(path)
+            self.rfhub_extractor.create_collection(path)
+            libdoc.assert_called_once_with(str(path))
+
+    def test_library_should_be_documented_again_when_modified(self):
+        path = self.fixture_path / "SingleClassLib" / "SingleClassLib.py"
+        with patch(
+            "rfhub2.cli.keywords.keywords_extractor.LibraryDocumentation",
+            wraps=LibraryDocumentation,
+        ) as libdoc:
+            self.rfhub_extractor.create_collection(path)
+            stat = path.stat()
+            try:
+                os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+                self.rfhub_extractor.create_collection(path)
+            finally:
+                os.utime(path, (stat.st_atime, stat.st_mtime))
+            self.assertEqual(libdoc.call_count, 2)
+
+    def test_library_with_init_should_be_documented_again_when_module_modified(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "LibWithInit"
+            shutil.copytree(self.fixture_path / "LibWithInit", path)
+            module = path / "LibWithInit1.py"
+            with patch(
+                "rfhub2.cli.keywords.keywords_extractor.LibraryDocumentation",
+                wraps=LibraryDocumentation,
+            ) as libdoc:
+                self.rfhub_extractor.create_collection(path)
+                directory_stat = path.stat()
+                stat = module.stat()
+                os.utime(module, (stat.st_atime, stat.st_mtime + 1))
+                os.utime(path, (directory_stat.st_atime, directory_stat.st_mtime))
+                self.rfhub_extractor.create_collection(path)
+                self.assertEqual(libdoc.call_count, 2)
+
+    def test_library_with_init_should_be_documented_once_with_multiple_jobs(self):
+        lib_with_init = self.fixture_path / "LibWithInit"
+        other_paths = {
+            self.fixture_path / "SingleClassLib" / "SingleClassLib.py",
+            self.fixture_path / "test_libdoc_file.xml",
+        }
+        extractor = KeywordsExtractor((lib_with_init,), True, "", "", jobs=2)
+        with patch(
+            "rfhub2.cli.keywords.keywords_extractor.ProcessPoolExecutor",
+            PicklingExecutor,
+        ), patch(
+            "rfhub2.cli.keywords.keywords_extractor.LibraryDocumentation",
+            wraps=LibraryDocumentation,
+        ) as libdoc:
+            paths = extractor.get_libraries_paths()
+            result = extractor.create_collections(paths | other_paths)
+        self.assertEqual(len(result), 3)
+        self.assertCountEqual(
+            [args[0] for args, _ in libdoc.call_args_list],
+            [str(path) for path in {lib_with_init} | other_paths],
+        )
+
     def test_is_robot_keyword_file_should_return_true_on_library(self):
         file = self.fixture_path / "SingleClassLib" / "SingleClassLib.py"
         result = self.rfhub_extractor._is_robot_keyword_file(file)
@@ -235,17 +336,39 @@ class KeywordsExtractorTests(unittest.TestCase):
         init_doc = self.rfhub_extractor._extract_doc_from_libdoc_inits(libdoc.inits)
         self.assertEqual(init_doc, "")
 
-    def test_robot_files_candidates_should_return_true_if_robot_files_present(self):
-        self.assertTrue(
-            self.rfhub_extractor._robot_files_candidates(
-                self.fixture_path / "LibWithInit"
+    def test_traverse_paths_should_skip_pruned_directories(self):
+        with TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            shutil.copy(FIXTURE_PATH / "test_resource.resource", root)
+            for directory in ("node_modules", "build"):
+                (root / directory).mkdir()
+                shutil.copy(FIXTURE_PATH / "test_resource.resource", root / directory)
+            result = self.rfhub_extractor._traverse_paths(root)
+            self.assertEqual(
+                result,
+                {
+                    root / "test_resource.resource",
+                    root / "build" / "test_resource.resource",
+                },
             )
-        )
-        self.assertFalse(
-            self.rfhub_extractor._robot_files_candidates(
-                self.fixture_path / "LibWithEmptyInit"
+            extractor = KeywordsExtractor((root,), True, "", "", prune_patterns=("b*",))
+            result = extractor._traverse_paths(root)
+            self.assertEqual(
+                result,
+                {
+                    root / "test_resource.resource",
+                    root / "node_modules" / "test_resource.resource",
+                },
             )
-        )
+
+    def test_traverse_paths_should_not_follow_symlink_loops(self):
+        with TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            (root / "subdir").mkdir()
+            shutil.copy(FIXTURE_PATH / "test_resource.resource", root / "subdir")
+            (root / "subdir" / "loop").symlink_to(root, target_is_directory=True)
+            result = self.rfhub_extractor._traverse_paths(root)
+            self.assertEqual(result, {root / "subdir" / "test_resource.resource"})
 
     def test_filter_keywords_no_include_no_exclude_should_return_all(self):
         filtered_kws_list = KeywordsExtractor._filter_keywords(
@@ -3,7 +3,7 @@ import robot.libraries
 from robot.libdocpkg.model import KeywordDoc
 
 from rfhub2.cli.keywords.keywords_importer import CollectionUpdateWithKeywords
-from rfhub2.model import Collection, CollectionUpdate, KeywordUpdate, NestedKeyword
+from rfhub2.model import CollectionUpdate, KeywordUpdate
 
 FIXTURE_PATH = Path.cwd() / "tests" / "fixtures" / "initial"
 STATISTICS_PATH = FIXTURE_PATH / ".." / "statistics"
@@ -92,18 +92,6 @@ EXPECTED_COLLECTION_KEYWORDS_1 = [
     EXPECTED_COLLECTION_KEYWORDS_1_2,
     EXPECTED_COLLECTION_KEYWORDS_1_3,
 ]
-EXISTING_COLLECTION_KEYWORDS = [
-    NestedKeyword(**{**EXPECTED_COLLECTION_KEYWORDS_1_3.dict(), "id": 1})
-]
-EXISTING_COLLECTION = Collection(
-    **{
-        **EXPECTED_COLLECTION.dict(),
-        "id": 1,
-        "keywords": [
-            NestedKeyword(**{**EXPECTED_COLLECTION_KEYWORDS_1_3.dict(), "id": 1})
-        ],
-    }
-)
 EXPECTED_COLLECTION_2 = CollectionUpdate(
     doc="Documentation for library ``Test Libdoc File``.",
     doc_format="ROBOT",
@@ -117,23 +105,9 @@ EXPECTED_COLLECTION_KEYWORDS_2_1 = KeywordUpdate(
     args='["who"]', doc="", name="Someone Shall Pass", tags=[]
 )
 EXPECTED_COLLECTION_KEYWORDS_2 = [EXPECTED_COLLECTION_KEYWORDS_2_1]
-EXISTING_COLLECTION_2 = Collection(
-    **{
-        **EXPECTED_COLLECTION_2.dict(),
-        "id": 1,
-        "keywords": [
-            NestedKeyword(**{**EXPECTED_COLLECTION_KEYWORDS_2_1.dict(), "id": 1})
-        ],
-    }
-)
+BULK_RESPONSE = {"collections": 1, "keywords": 4}
+SYNC_RESPONSE = {"inserted": 1, "updated": 0, "deleted": 0, "keywords": 4}
 EXPECTED_ADD_COLLECTIONS = [{"name": "Test Libdoc File", "keywords": 1}]
-EXPECTED_UPDATE_COLLECTIONS = [
-    {"name": "a", "keywords": 1},
-    {"name": "b", "keywords": 1},
-    {"name": "c", "keywords": 1},
-    {"name": "d", "keywords": 1},
-    {"name": "e", "keywords": 1},
-]
 KEYWORDS_1 = [
     {
         "args": "",
@@ -1,7 +1,13 @@
 import unittest
+from datetime import datetime
 from pathlib import Path
 
-from rfhub2.cli.statistics.statistics_extractor import StatisticsExtractor, XmlKeyword
+from rfhub2.cli.statistics.statistics_extractor import (
+    KeywordFrame,
+    StatisticsExtractor,
+    XmlKeyword,
+    parse_timestamp,
+)
 from rfhub2.model import KeywordStatistics
 
 FIXTURE_PATH = Path.cwd() / "tests" / "fixtures" / "statistics"
@@ -56,3 +62,37 @@ class StatisticsExtractorTests(unittest.TestCase):
     def test_get_execution_time_should_return_correct_time(self):
         result = self.statistics_extractor.get_execution_time()
         self.assertEqual(result, EXECUTION_TIME)
+
+    def test_iter_xml_keywords_should_yield_keywords_lazily(self):
+        result = self.statistics_extractor.iter_xml_keywords()
+        self.assertEqual(next(result), KEYWORD_1)
+        self.assertListEqual(list(result), KEYWORD[1:])
+
+    def test_aggregate_statistics_should_accept_keywords_stream(self):
+        result = self.statistics_extractor.aggregate_statistics(iter(KEYWORD))
+        self.assertListEqual(result, STATISTICS)
+
+    def test_parse_timestamp_should_return_datetime(self):
+        result = parse_timestamp("20210830 18:51:43.337")
+        self.assertEqual(result, datetime(2021, 8, 30, 18, 51, 43, 337000))
+
+    def test_keyword_frame_should_compute_elapsed_from_nested_frames(self):
+        parent = KeywordFrame("BuiltIn", "Run Keyword", 0)
+        child = KeywordFrame("BuiltIn", "Log", 1)
+        child.update(
+            {"starttime": "20210830 18:51:43.400", "endtime": "20210830 18:51:43.500"}
+        )
+        parent.update(
+            {"starttime": "20210830 18:51:43.350", "endtime": "20210830 18:51:43.450"}
+        )
+        parent.merge(child)
+        self.assertEqual(child.elapsed, 100)
+        self.assertEqual(parent.elapsed, 150)
+
+    def test_keyword_frame_should_skip_missing_times(self):
+        frame = KeywordFrame("BuiltIn", "Log", 0)
+        frame.update(
+            {"starttime": "20210830 18:51:43.400", "endtime": "20210830 18:51:43.500"}
+        )
+        frame.update({"starttime": "N/A", "endtime": "N/A"})
+        self.assertEqual(frame.elapsed, 100)
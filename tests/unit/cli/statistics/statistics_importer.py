@@ -77,6 +77,21 @@ class StatisticsImporterTests(unittest.TestCase):
             result = rfhub_importer.import_statistics()
             self.assertTupleEqual(result, (1, 3), msg=f"{result}")
 
+    def test_import_statistics_with_multiple_jobs_should_import_statistics(self):
+        with RequestsMock() as mock:
+            self.mock_post_request(mock, KeywordStatisticsList.of(STATISTICS))
+            rfhub_importer = StatisticsImporter(self.client, (FIXTURE_PATH,), jobs=2)
+            result = rfhub_importer.import_statistics()
+            self.assertTupleEqual(result, (2, 74), msg=f"{result}")
+            self.assertEqual(len(mock.calls), 2)
+
+    def test_import_statistics_with_multiple_jobs_should_raise_upload_error(self):
+        with RequestsMock() as mock:
+            mock.add(mock.POST, self.stats_url, body=ConnectionError("refused"))
+            rfhub_importer = StatisticsImporter(self.client, (FIXTURE_PATH,), jobs=2)
+            with self.assertRaises(ConnectionError):
+                rfhub_importer.import_statistics()
+
     def test_get_execution_files_paths_without_subdir_provided_should_return_set_of_paths(
         self
     ):
@@ -0,0 +1,31 @@
+from rfhub2.db.backfill import backfill_rendered_docs
+from rfhub2.db.base import Collection, Keyword
+from rfhub2.db.session import db_session
+from tests.unit.db.base_repo_tests import BaseRepositoryTest
+
+
+class BackfillTest(BaseRepositoryTest):
+    def setUp(self) -> None:
+        super().setUp()
+        for entity in (Collection, Keyword):
+            db_session.query(entity).update(
+                {entity.stored_synopsis: None, entity.stored_html_doc: None}
+            )
+        db_session.commit()
+
+    def test_should_backfill_rendered_docs(self) -> None:
+        result: int = backfill_rendered_docs(db_session, batch_size=2)
+        self.assertEqual(result, 7)
+        keyword: Keyword = db_session.query(Keyword).filter_by(name="Teardown").one()
+        self.assertEqual(keyword.stored_synopsis, "Clean up environment")
+        self.assertEqual(keyword.stored_html_doc, "<p>Clean up environment</p>")
+        collection: Collection = db_session.query(Collection).filter_by(
+            name="Third"
+        ).one()
+        self.assertEqual(collection.stored_synopsis, "")
+        self.assertEqual(collection.stored_html_doc, "")
+
+    def test_should_not_backfill_already_rendered_docs(self) -> None:
+        backfill_rendered_docs(db_session)
+        result: int = backfill_rendered_docs(db_session)
+        self.assertEqual(result, 0)
@@ -1,7 +1,18 @@
+from sqlalchemy.exc import SQLAlchemyError
 from typing import List, Optional
+from unittest.mock import patch
 
 from rfhub2.db.base import Collection, Keyword
+from rfhub2.db.repository.ordering import OrderingItem
+from rfhub2.db.repository.pagination import InvalidCursorError
 from rfhub2.db.session import db_session
+from rfhub2.model import (
+    CollectionFingerprint,
+    CollectionUpdate,
+    CollectionUpdateWithKeywords,
+    KeywordUpdate,
+)
+from rfhub2.utils.fingerprint import collection_fingerprint
 from tests.unit.db.base_repo_tests import BaseRepositoryTest
 
 
@@ -33,6 +44,213 @@ class CollectionRepositoryTest(BaseRepositoryTest):
             [k.name for k in results[0].keywords], ["Keyword1", "Keyword2"]
         )
 
+    def test_should_add_many_collections_with_keywords(self) -> None:
+        items = [
+            CollectionUpdateWithKeywords(
+                CollectionUpdate(name="bulk_collection_1", doc="Bulk doc"),
+                [
+                    KeywordUpdate(name="Keyword1", doc="First", tags=["tag"]),
+                    KeywordUpdate(name="Keyword2"),
+                ],
+            ),
+            CollectionUpdateWithKeywords(
+                CollectionUpdate(name="bulk_collection_2"),
+                [KeywordUpdate(name="Keyword3")],
+            ),
+        ]
+        result = self.collection_repo.add_many_with_keywords(items)
+        self.assertEqual(result, (2, 3))
+        results: List[Collection] = (
+            db_session.query(Collection)
+            .filter(Collection.name.like("bulk_collection_%"))
+            .order_by(Collection.name)
+            .all()
+        )
+        self.assertEqual(
+            [[k.name for k in c.keywords] for c in results],
+            [["Keyword1", "Keyword2"], ["Keyword3"]],
+        )
+        self.assertEqual(results[0].html_doc, "<p>Bulk doc</p>")
+        self.assertEqual(results[0].keywords[0].html_doc, "<p>First</p>")
+        self.assertEqual(results[0].keywords[0].tags, '["tag"]')
+
+    def test_should_not_add_any_collection_when_bulk_insert_fails(self) -> None:
+        items = [
+            CollectionUpdateWithKeywords(
+                CollectionUpdate(name="bulk_collection"), [KeywordUpdate(name="kw")]
+            )
+        ]
+        with patch.object(db_session, "bulk_save_objects", side_effect=SQLAlchemyError):
+            with self.assertRaises(SQLAlchemyError):
+                self.collection_repo.add_many_with_keywords(items)
+        self.assertEqual(
+            db_session.query(Collection).filter_by(name="bulk_collection").count(), 0
+        )
+
+    def sync_items(self) -> List[CollectionUpdateWithKeywords]:
+        return [
+            CollectionUpdateWithKeywords(
+                CollectionUpdate(name="First collection", type="robot"),
+                [
+                    KeywordUpdate(name=kw.name, doc=kw.doc, tags=kw.tags)
+                    for kw in self.model_keywords
+                ],
+            ),
+            CollectionUpdateWithKeywords(
+                CollectionUpdate(name="Third", type="Library", version="1.0"),
+                [KeywordUpdate(name="Library keyword")],
+            ),
+            CollectionUpdateWithKeywords(
+                CollectionUpdate(name="New collection", type="robot"),
+                [KeywordUpdate(name="New keyword")],
+            ),
+        ]
+
+    def test_should_sync_collections(self) -> None:
+        result = self.collection_repo.sync(self.sync_items())
+        self.assertEqual(
+            result.dict(), {"inserted": 1, "updated": 1, "deleted": 1, "keywords": 2}
+        )
+        results: List[Collection] = db_session.query(Collection).order_by(
+            Collection.name
+        ).all()
+        self.assertEqual(
+            [(c.name, c.version, len(c.keywords)) for c in results],
+            [
+                ("First collection", None, 3),
+                ("New collection", None, 1),
+                ("Third", "1.0", 1),
+            ],
+        )
+        self.assertEqual(results[0].id, self.collections[0].id)
+        self.assertEqual(
+            db_session.query(Keyword).filter_by(name="Login to Application").count(), 0
+        )
+
+    def test_should_sync_collections_without_removing_missing_ones(self) -> None:
+        result = self.collection_repo.sync(self.sync_items(), remove_missing=False)
+        self.assertEqual(
+            result.dict(), {"inserted": 1, "updated": 1, "deleted": 0, "keywords": 2}
+        )
+        self.assertEqual(
+            db_session.query(Collection).filter_by(name="Second collection").count(), 1
+        )
+
+    def test_should_replace_resource_with_changed_keywords_on_sync(self) -> None:
+        items = self.sync_items()[:1]
+        items[0].keywords[0].doc = "Changed doc"
+        result = self.collection_repo.sync(items, remove_missing=False)
+        self.assertEqual(
+            result.dict(), {"inserted": 0, "updated": 1, "deleted": 0, "keywords": 3}
+        )
+        self.assertEqual(
+            db_session.query(Keyword).filter_by(doc="Changed doc").count(), 1
+        )
+
+    def test_should_store_fingerprint_of_synced_collections(self) -> None:
+        items = self.sync_items()
+        self.collection_repo.sync(items)
+        stored = db_session.query(Collection).filter_by(name="New collection").one()
+        self.assertEqual(
+            stored.fingerprint,
+            collection_fingerprint(items[2].collection, items[2].keywords),
+        )
+        self.assertEqual(
+            self.collection_repo.sync(items).dict(),
+            {"inserted": 0, "updated": 0, "deleted": 0, "keywords": 0},
+        )
+
+    def test_should_keep_collections_given_by_fingerprint_on_sync(self) -> None:
+        result = self.collection_repo.sync(
+            [
+                CollectionFingerprint(
+                    name="Second collection", path=None, fingerprint="any"
+                )
+            ]
+        )
+        self.assertEqual(result.deleted, 2)
+        self.assertEqual(
+            [c.name for c in db_session.query(Collection)], ["Second collection"]
+        )
+
+    def test_should_delete_duplicated_collections_on_sync(self) -> None:
+        duplicates = [
+            Collection(name="First collection", type="robot"),
+            Collection(name="Second collection", type="Robot", fingerprint="current"),
+        ]
+        db_session.add_all(duplicates)
+        db_session.commit()
+        duplicate_ids = [duplicate.id for duplicate in duplicates]
+        result = self.collection_repo.sync(
+            [
+                self.sync_items()[0],
+                CollectionFingerprint(
+                    name="Second collection", path=None, fingerprint="current"
+                ),
+            ],
+            remove_missing=False,
+        )
+        self.assertEqual(result.deleted, 2)
+        self.assertEqual(
+            [
+                (c.id, c.name)
+                for c in db_session.query(Collection).order_by(Collection.name)
+            ],
+            [
+                (self.collections[0].id, "First collection"),
+                (duplicate_ids[1], "Second collection"),
+                (self.collections[2].id, "Third"),
+            ],
+        )
+
+    def test_should_get_changed_collections(self) -> None:
+        items = self.sync_items()
+        self.collection_repo.sync(items[1:], remove_missing=False)
+        fingerprints = [
+            CollectionFingerprint(
+                name=item.collection.name,
+                path=item.collection.path,
+                fingerprint=collection_fingerprint(item.collection, item.keywords),
+            )
+            for item in items
+        ]
+        changed = self.collection_repo.get_changed(
+            fingerprints
+            + [
+                fingerprints[0].copy(update={"fingerprint": "outdated"}),
+                fingerprints[1].copy(update={"fingerprint": "outdated"}),
+            ]
+        )
+        self.assertEqual(
+            changed,
+            [
+                fingerprints[0].copy(update={"fingerprint": "outdated"}),
+                fingerprints[1].copy(update={"fingerprint": "outdated"}),
+            ],
+        )
+
+    def test_should_store_fingerprint_of_collections_stored_without_one_on_sync(
+        self
+    ) -> None:
+        items = self.sync_items()[:1]
+        self.assertIsNone(self.collections[0].fingerprint)
+        result = self.collection_repo.sync(items, remove_missing=False)
+        self.assertEqual(result.updated, 0)
+        stored = db_session.query(Collection).get(self.collections[0].id)
+        self.assertEqual(
+            stored.fingerprint,
+            collection_fingerprint(items[0].collection, items[0].keywords),
+        )
+
+    def test_should_not_change_any_collection_when_sync_fails(self) -> None:
+        with patch.object(db_session, "bulk_save_objects", side_effect=SQLAlchemyError):
+            with self.assertRaises(SQLAlchemyError):
+                self.collection_repo.sync(self.sync_items())
+        self.assertEqual(
+            [c.name for c in db_session.query(Collection).order_by(Collection.id)],
+            ["First collection", "Second collection", "Third"],
+        )
+
     def test_should_get_collection_by_id(self) -> None:
         result: Optional[Collection] = self.collection_repo.get(self.collections[-1].id)
         self.assertEqual(result, self.collections[-1])
@@ -90,6 +308,49 @@ class CollectionRepositoryTest(BaseRepositoryTest):
         result: List[Collection] = self.collection_repo.get_all(skip=2)
         self.assertEqual(result, self.model_collections[2:])
 
+    def test_should_get_collections_pages_with_cursor(self) -> None:
+        first_page = self.collection_repo.get_all(limit=2)
+        self.assertEqual(first_page, self.model_collections[:2])
+        self.assertEqual(
+            first_page.next_cursor, ["Second collection", self.collections[1].id]
+        )
+        last_page = self.collection_repo.get_all(limit=2, cursor=first_page.next_cursor)
+        self.assertEqual(last_page, self.model_collections[2:])
+        self.assertIsNone(last_page.next_cursor)
+
+    def test_should_get_collections_with_stats_pages_with_cursor(self) -> None:
+        ordering = [OrderingItem("keyword_count", False)]
+        first_page = self.collection_repo.get_all_with_stats(limit=1, ordering=ordering)
+        self.assertEqual([c.name for c in first_page], ["First collection"])
+        second_page = self.collection_repo.get_all_with_stats(
+            limit=2, ordering=ordering, cursor=first_page.next_cursor
+        )
+        self.assertEqual([c.name for c in second_page], ["Second collection", "Third"])
+
+    def test_should_get_collection_summaries(self) -> None:
+        result = self.collection_repo.get_all_summaries(pattern="collection")
+        self.assertEqual(
+            [(c.id, c.name, c.keyword_count) for c in result],
+            [
+                (self.collections[0].id, "First collection", 3),
+                (self.collections[1].id, "Second collection", 1),
+            ],
+        )
+
+    def test_should_render_synopsis_of_collection_summary_when_not_stored(self) -> None:
+        collection = Collection(name="Legacy", doc="Legacy library.\n\nMore docs")
+        self.collection_repo.add(collection)
+        db_session.query(Collection).filter(Collection.id == collection.id).update(
+            {Collection.stored_synopsis: None}, synchronize_session=False
+        )
+        db_session.commit()
+        result = self.collection_repo.get_all_summaries(pattern="legacy")
+        self.assertEqual([c.synopsis for c in result], ["Legacy library."])
+
+    def test_should_raise_error_for_cursor_not_matching_ordering(self) -> None:
+        with self.assertRaises(InvalidCursorError):
+            self.collection_repo.get_all(cursor=["Third"])
+
     def test_should_delete_collection_with_keywords(self) -> None:
         result: int = self.collection_repo.delete(self.collections[0].id)
         self.assertEqual(result, 1)
@@ -25,3 +25,23 @@ class CollectionTest(unittest.TestCase):
 
     def test_should_get_empty_html_doc_when_collection_has_no_doc(self):
         self.assertEqual(self.empty_collection.html_doc, "")
+
+    def test_should_store_rendered_doc_when_doc_is_set(self):
+        collection = Collection(name="My collection", doc="First line\n\nSecond line")
+        self.assertEqual(collection.stored_synopsis, "First line")
+        self.assertEqual(
+            collection.stored_html_doc, "<p>First line</p>\n<p>Second line</p>"
+        )
+
+    def test_should_render_stored_doc_again_when_doc_is_updated(self):
+        collection = Collection(name="My collection", doc="Old doc")
+        collection.doc = "New doc"
+        self.assertEqual(collection.synopsis, "New doc")
+        self.assertEqual(collection.html_doc, "<p>New doc</p>")
+
+    def test_should_render_html_doc_when_it_is_not_stored(self):
+        collection = Collection(name="My collection", doc="Collection description")
+        collection.stored_synopsis = None
+        collection.stored_html_doc = None
+        self.assertEqual(collection.synopsis, "Collection description")
+        self.assertEqual(collection.html_doc, "<p>Collection description</p>")
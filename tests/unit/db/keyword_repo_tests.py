@@ -1,7 +1,9 @@
 from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
+from unittest.mock import patch
 
 from rfhub2.db.base import Keyword
+from rfhub2.db.repository.ordering import OrderingItem
 from rfhub2.db.session import db_session
 from tests.unit.db.base_repo_tests import BaseRepositoryTest
 
@@ -73,6 +75,108 @@ class KeywordRepositoryTest(BaseRepositoryTest):
                 )
                 self.assertEqual(result, expected)
 
+    def test_should_search_keywords_with_full_text_index(self) -> None:
+        test_data = [
+            ("teardown", True, [self.model_keywords[2], self.model_keywords[0]]),
+            ("teardown", False, self.model_keywords[2:]),
+            ("tear", True, [self.model_keywords[2], self.model_keywords[0]]),
+            ("login_key", True, self.model_keywords[1:2]),
+            ("some check", True, self.model_keywords[1:2]),
+            ("check some", False, []),
+        ]
+        for pattern, use_doc, expected in test_data:
+            with self.subTest(pattern=pattern, use_doc=use_doc, expected=expected):
+                result: List[Keyword] = self.keyword_repo.get_all(
+                    pattern=pattern, use_doc=use_doc, full_text=True
+                )
+                self.assertEqual(result, expected)
+
+    def test_should_search_part_of_word_with_like_when_full_text_index_finds_nothing(
+        self
+    ) -> None:
+        test_data = [
+            ("down", True, [self.model_keywords[2], self.model_keywords[0]]),
+            ("down", False, self.model_keywords[2:]),
+            ("eckk", True, []),
+        ]
+        for pattern, use_doc, expected in test_data:
+            with self.subTest(pattern=pattern, use_doc=use_doc, expected=expected):
+                result: List[Keyword] = self.keyword_repo.get_all(
+                    pattern=pattern, use_doc=use_doc, full_text=True
+                )
+                self.assertEqual(result, expected)
+
+    def test_should_search_keywords_with_glob_pattern_without_full_text_index(
+        self
+    ) -> None:
+        result: List[Keyword] = self.keyword_repo.get_all(
+            pattern="*down", full_text=True
+        )
+        self.assertEqual(result, [self.model_keywords[2], self.model_keywords[0]])
+
+    def test_should_search_keywords_with_full_text_index_and_custom_ordering(
+        self
+    ) -> None:
+        result: List[Keyword] = self.keyword_repo.get_all(
+            pattern="login", full_text=True, ordering=[OrderingItem("name", False)]
+        )
+        self.assertEqual(result, [self.app_keyword.to_model(), self.model_keywords[1]])
+
+    def test_should_keep_full_text_index_in_sync(self) -> None:
+        keyword = self.keywords[2]
+        keyword.name, keyword.doc = "Cleanup", "Remove data"
+        db_session.commit()
+        self.assertEqual(
+            self.keyword_repo.get_all(pattern="teardown", full_text=True),
+            self.model_keywords[:1],
+        )
+        self.assertEqual(
+            self.keyword_repo.get_all(pattern="cleanup", full_text=True),
+            [keyword.to_model()],
+        )
+        self.collection_repo.delete(self.collections[0].id)
+        self.assertEqual(self.keyword_repo.get_all(pattern="data", full_text=True), [])
+
+    def test_should_search_keywords_with_fuzzy_matching(self) -> None:
+        test_data = [
+            ("Tiardown", self.model_keywords[2:]),
+            ("logn", [self.model_keywords[1], self.app_keyword.to_model()]),
+            ("login to aplication", [self.app_keyword.to_model()]),
+            ("applic", [self.app_keyword.to_model()]),
+            ("environment", []),
+        ]
+        for pattern, expected in test_data:
+            with self.subTest(pattern=pattern, expected=expected):
+                result: List[Keyword] = self.keyword_repo.get_all(
+                    pattern=pattern, fuzzy=True
+                )
+                self.assertEqual(result, expected)
+
+    def test_should_search_keywords_with_fuzzy_matching_in_collection(self) -> None:
+        result: List[Keyword] = self.keyword_repo.get_all(
+            pattern="logn", collection_name="second", fuzzy=True, limit=1
+        )
+        self.assertEqual(result, [self.app_keyword.to_model()])
+
+    def test_should_search_keywords_with_like_when_trigram_index_is_missing(
+        self
+    ) -> None:
+        test_data = [
+            ("ardow", [self.model_keywords[2], self.model_keywords[0]]),
+            ("check some", []),
+            ("Tiardown", []),
+        ]
+        with patch(
+            "rfhub2.db.repository.keyword_repository.get_trigram_search",
+            return_value=None,
+        ):
+            for pattern, expected in test_data:
+                with self.subTest(pattern=pattern, expected=expected):
+                    result: List[Keyword] = self.keyword_repo.get_all(
+                        pattern=pattern, full_text=True, fuzzy=True
+                    )
+                    self.assertEqual(result, expected)
+
     def test_should_get_all_keywords_with_limit(self) -> None:
         result: List[Keyword] = self.keyword_repo.get_all(limit=2)
         self.assertEqual(result, self.sorted_model_keywords[:2])
@@ -81,6 +185,52 @@ class KeywordRepositoryTest(BaseRepositoryTest):
         result: List[Keyword] = self.keyword_repo.get_all(skip=2)
         self.assertEqual(result, self.sorted_model_keywords[2:])
 
+    def test_should_get_all_keywords_pages_with_cursor(self) -> None:
+        pages = []
+        cursor = None
+        while True:
+            page = self.keyword_repo.get_all(limit=3, cursor=cursor)
+            pages.append(list(page))
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(
+            pages, [self.sorted_model_keywords[:3], self.sorted_model_keywords[3:]]
+        )
+
+    def test_should_get_keywords_pages_with_cursor_for_descending_nullable_ordering(
+        self
+    ) -> None:
+        ordering = [OrderingItem("doc", False)]
+        first_page = self.keyword_repo.get_all(limit=2, ordering=ordering)
+        second_page = self.keyword_repo.get_all(
+            limit=2, ordering=ordering, cursor=first_page.next_cursor
+        )
+        self.assertEqual(
+            first_page + second_page,
+            [
+                self.model_keywords[0],
+                self.model_keywords[1],
+                self.model_keywords[2],
+                self.app_keyword.to_model(),
+            ],
+        )
+        self.assertEqual(second_page.next_cursor, [None, self.app_keyword.id])
+        last_page = self.keyword_repo.get_all(
+            limit=2, ordering=ordering, cursor=second_page.next_cursor
+        )
+        self.assertEqual(last_page, [])
+
+    def test_should_get_full_text_search_pages_with_cursor(self) -> None:
+        first_page = self.keyword_repo.get_all(
+            pattern="teardown", full_text=True, limit=1
+        )
+        second_page = self.keyword_repo.get_all(
+            pattern="teardown", full_text=True, limit=1, cursor=first_page.next_cursor
+        )
+        self.assertEqual(first_page, self.model_keywords[2:])
+        self.assertEqual(second_page, self.model_keywords[:1])
+
     def test_should_get_all_keywords_with_collection_name(self) -> None:
         test_data = [
             ("third", []),
@@ -0,0 +1,220 @@
+from datetime import datetime, timezone
+from sqlalchemy.exc import IntegrityError
+from typing import List, Tuple
+
+from rfhub2.db.base import (
+    CompactedExecution,
+    KeywordStatistics,
+    KeywordStatisticsRollup,
+)
+from rfhub2.db.repository.keyword_statistics_repository import (
+    CompactedExecutionError,
+    KeywordStatisticsFilterParams,
+    KeywordStatisticsRepository,
+)
+from rfhub2.db.session import Session, db_session
+from rfhub2.model import StatisticsCompacted
+from tests.unit.db.base_repo_tests import BaseRepositoryTest
+
+
+def statistics(
+    keyword: str, hour: int, times_used: int, total: int, min_: int, max_: int
+) -> KeywordStatistics:
+    return KeywordStatistics(
+        collection="First collection",
+        keyword=keyword,
+        execution_time=datetime(2019, 12, 21, hour, 30, tzinfo=timezone.utc),
+        times_used=times_used,
+        total_elapsed=total,
+        min_elapsed=min_,
+        max_elapsed=max_,
+    )
+
+
+class KeywordStatisticsRepositoryTest(BaseRepositoryTest):
+    def setUp(self) -> None:
+        super().setUp()
+        db_session.query(KeywordStatistics).delete()
+        db_session.query(KeywordStatisticsRollup).delete()
+        db_session.query(CompactedExecution).delete()
+        db_session.commit()
+        self.statistics_repo = KeywordStatisticsRepository(db_session)
+        self.statistics_repo.add_many(
+            [
+                statistics("Test setup", 1, 5, 500, 50, 150),
+                statistics("Test setup", 2, 5, 1000, 100, 300),
+                statistics("Teardown", 1, 2, 20, 10, 10),
+            ]
+        )
+
+    @staticmethod
+    def rollups() -> List[Tuple[str, int, int, int, int]]:
+        return [
+            (
+                rollup.keyword,
+                rollup.times_used,
+                rollup.total_elapsed,
+                rollup.min_elapsed,
+                rollup.max_elapsed,
+            )
+            for rollup in db_session.query(KeywordStatisticsRollup).order_by(
+                KeywordStatisticsRollup.keyword
+            )
+        ]
+
+    def test_should_get_statistics_pages_with_cursor(self) -> None:
+        filter_params = KeywordStatisticsFilterParams(collection="First collection")
+        first_page = self.statistics_repo.get_many(filter_params=filter_params, limit=2)
+        self.assertEqual(
+            [(stat.keyword, stat.execution_time.hour) for stat in first_page],
+            [("Teardown", 1), ("Test setup", 2)],
+        )
+        self.assertEqual(first_page.next_cursor[:2], ["First collection", "Test setup"])
+        last_page = self.statistics_repo.get_many(
+            filter_params=filter_params, limit=2, cursor=first_page.next_cursor
+        )
+        self.assertEqual(
+            [(stat.keyword, stat.execution_time.hour) for stat in last_page],
+            [("Test setup", 1)],
+        )
+        self.assertIsNone(last_page.next_cursor)
+
+    def test_should_maintain_rollup_when_adding_statistics(self) -> None:
+        self.statistics_repo.add_many([statistics("Test setup", 3, 1, 10, 10, 10)])
+        self.assertEqual(
+            self.rollups(),
+            [("Teardown", 2, 20, 10, 10), ("Test setup", 11, 1510, 10, 300)],
+        )
+
+    def test_should_upsert_rollup_of_keywords_repeated_in_batch(self) -> None:
+        other_session = Session()
+        try:
+            KeywordStatisticsRepository(other_session).add_many(
+                [
+                    statistics("Login", 3, 1, 30, 30, 30),
+                    statistics("Login", 4, 2, 20, 5, 15),
+                    statistics("Teardown", 3, 1, 40, 40, 40),
+                ]
+            )
+        finally:
+            other_session.close()
+        self.statistics_repo.add_many([statistics("Login", 5, 1, 100, 100, 100)])
+        self.assertEqual(
+            self.rollups(),
+            [
+                ("Login", 4, 150, 5, 100),
+                ("Teardown", 3, 60, 10, 40),
+                ("Test setup", 10, 1500, 50, 300),
+            ],
+        )
+
+    def test_should_not_change_rollup_when_adding_duplicated_statistics(self) -> None:
+        with self.assertRaises(IntegrityError):
+            self.statistics_repo.add_many([statistics("Teardown", 1, 1, 1, 1, 1)])
+        self.assertEqual(
+            self.rollups(),
+            [("Teardown", 2, 20, 10, 10), ("Test setup", 10, 1500, 50, 300)],
+        )
+
+    def test_should_recompute_rollup_when_deleting_statistics(self) -> None:
+        self.statistics_repo.delete_many(
+            KeywordStatisticsFilterParams(
+                collection="First collection",
+                execution_time=datetime(2019, 12, 21, 2, 30, tzinfo=timezone.utc),
+            )
+        )
+        self.assertEqual(
+            self.rollups(),
+            [("Teardown", 2, 20, 10, 10), ("Test setup", 5, 500, 50, 150)],
+        )
+
+    def test_should_remove_rollup_when_deleting_all_keyword_statistics(self) -> None:
+        self.statistics_repo.delete_many(
+            KeywordStatisticsFilterParams(
+                collection="First collection", keyword="Teardown"
+            )
+        )
+        self.assertEqual(self.rollups(), [("Test setup", 10, 1500, 50, 300)])
+
+    def test_should_clear_rollup_when_deleting_all_statistics(self) -> None:
+        self.statistics_repo.delete_many()
+        self.assertEqual(self.rollups(), [])
+
+    def test_should_compact_only_statistics_older_than_given_time(self) -> None:
+        result = self.statistics_repo.compact(
+            datetime(2019, 12, 21, 2, 0, tzinfo=timezone.utc)
+        )
+        self.assertEqual(result, StatisticsCompacted(compacted=2, created=2))
+        self.assertEqual(
+            [
+                (stat.keyword, stat.execution_time.hour, stat.times_used)
+                for stat in db_session.query(KeywordStatistics).order_by(
+                    KeywordStatistics.keyword, KeywordStatistics.execution_time
+                )
+            ],
+            [("Teardown", 0, 2), ("Test setup", 0, 5), ("Test setup", 2, 5)],
+        )
+        self.assertEqual(
+            self.rollups(),
+            [("Teardown", 2, 20, 10, 10), ("Test setup", 10, 1500, 50, 300)],
+        )
+
+    def test_should_match_compacted_statistics_by_beginning_of_bucket(self) -> None:
+        self.statistics_repo.compact(datetime(2019, 12, 21, 2, 0, tzinfo=timezone.utc))
+        for time_from, time_to, expected in (
+            (1, 3, [("Test setup", 2)]),
+            (0, 1, [("Teardown", 0), ("Test setup", 0)]),
+        ):
+            with self.subTest(time_from=time_from, time_to=time_to):
+                result = self.statistics_repo.get_many(
+                    filter_params=KeywordStatisticsFilterParams(
+                        collection="First collection",
+                        execution_time_from=datetime(
+                            2019, 12, 21, time_from, tzinfo=timezone.utc
+                        ),
+                        execution_time_to=datetime(
+                            2019, 12, 21, time_to, tzinfo=timezone.utc
+                        ),
+                    )
+                )
+                self.assertEqual(
+                    [(stat.keyword, stat.execution_time.hour) for stat in result],
+                    expected,
+                )
+
+    def test_should_reject_statistics_of_compacted_execution(self) -> None:
+        self.statistics_repo.compact(datetime(2019, 12, 21, 2, 0, tzinfo=timezone.utc))
+        with self.assertRaises(CompactedExecutionError):
+            self.statistics_repo.add_many(
+                [
+                    statistics("Test setup", 1, 5, 500, 50, 150),
+                    statistics("Teardown", 1, 2, 20, 10, 10),
+                ]
+            )
+        self.assertEqual(
+            self.rollups(),
+            [("Teardown", 2, 20, 10, 10), ("Test setup", 10, 1500, 50, 300)],
+        )
+        self.assertEqual(
+            self.statistics_repo.add_many([statistics("Teardown", 3, 1, 1, 1, 1)]), 1
+        )
+
+    def test_should_accept_statistics_of_compacted_execution_after_deleting_it(
+        self
+    ) -> None:
+        self.statistics_repo.compact(datetime(2019, 12, 21, 2, 0, tzinfo=timezone.utc))
+        self.statistics_repo.delete_many(
+            KeywordStatisticsFilterParams(collection="First collection")
+        )
+        self.assertEqual(
+            self.statistics_repo.add_many([statistics("Teardown", 1, 2, 20, 10, 10)]), 1
+        )
+
+    def test_should_rebuild_rollup_from_statistics(self) -> None:
+        db_session.query(KeywordStatisticsRollup).delete()
+        self.statistics_repo.refresh_rollup()
+        db_session.commit()
+        self.assertEqual(
+            self.rollups(),
+            [("Teardown", 2, 20, 10, 10), ("Test setup", 10, 1500, 50, 300)],
+        )
@@ -1,6 +1,7 @@
 import unittest
 
 from rfhub2.db.base import Keyword
+from rfhub2.model import KeywordCreate
 
 
 class KeywordTest(unittest.TestCase):
@@ -34,3 +35,10 @@ class KeywordTest(unittest.TestCase):
 
     def test_should_get_empty_html_doc_when_keyword_has_no_doc(self):
         self.assertEqual(self.empty_keyword.html_doc, "")
+
+    def test_should_store_rendered_doc_when_keyword_is_created(self):
+        keyword = Keyword.create(
+            KeywordCreate(name="My keyword", doc="*Bold* doc", collection_id=1)
+        )
+        self.assertEqual(keyword.stored_synopsis, "*Bold* doc")
+        self.assertEqual(keyword.stored_html_doc, "<p><b>Bold</b> doc</p>")
@@ -0,0 +1,47 @@
+from sqlalchemy import Column, Integer, MetaData, Table, Text, select
+from sqlalchemy.dialects import postgresql, sqlite
+import unittest
+
+from rfhub2.db.repository.pagination import keyset_criteria, keyset_ordering
+
+items = Table(
+    "item", MetaData(), Column("id", Integer, primary_key=True), Column("name", Text)
+)
+
+
+def compile_sql(clause, dialect) -> str:
+    return str(clause.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+class PaginationTest(unittest.TestCase):
+    def test_should_keep_default_ordering_of_null_values(self) -> None:
+        query = select(items.c.id).order_by(
+            *keyset_ordering([(items.c.name, True), (items.c.id, False)])
+        )
+        for dialect in (postgresql.dialect(), sqlite.dialect()):
+            with self.subTest(dialect=dialect.name):
+                self.assertTrue(
+                    compile_sql(query, dialect).endswith(
+                        "ORDER BY item.name ASC, item.id DESC"
+                    )
+                )
+
+    def test_should_compare_null_values_by_their_position_in_database_ordering(
+        self
+    ) -> None:
+        test_data = [
+            (True, "a", True, "item.name > 'a' OR item.name IS NULL"),
+            (True, None, True, "false"),
+            (False, "a", True, "item.name < 'a'"),
+            (False, None, True, "item.name IS NOT NULL"),
+            (True, "a", False, "item.name > 'a'"),
+            (True, None, False, "item.name IS NOT NULL"),
+            (False, "a", False, "item.name < 'a' OR item.name IS NULL"),
+            (False, None, False, "false"),
+        ]
+        for asc, value, nulls_largest, expected in test_data:
+            with self.subTest(asc=asc, value=value, nulls_largest=nulls_largest):
+                criteria = keyset_criteria(
+                    [(items.c.name, asc)], [value], nulls_largest
+                )
+                self.assertEqual(compile_sql(criteria, postgresql.dialect()), expected)
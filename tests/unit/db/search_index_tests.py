@@ -0,0 +1,102 @@
+from typing import List
+
+from rfhub2.db.base import Keyword
+from rfhub2.db.search_index import (
+    KeywordSearchIndex,
+    keyword_search_index,
+    like_to_regex,
+)
+from rfhub2.db.session import db_session
+from tests.unit.db.base_repo_tests import BaseRepositoryTest
+
+
+class KeywordSearchIndexTest(BaseRepositoryTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.index = KeywordSearchIndex(
+            [keyword.to_model() for keyword in self.sorted_keywords]
+        )
+
+    def names(self, *args, **kwargs) -> List[str]:
+        return [keyword.name for keyword in self.index.search(*args, **kwargs)]
+
+    def test_should_return_all_keywords_for_wildcard(self) -> None:
+        self.assertEqual(
+            self.index.search("*"), [kw.to_model() for kw in self.sorted_keywords]
+        )
+
+    def test_should_search_keywords_by_name_and_doc(self) -> None:
+        test_data = [
+            ("teardown", ["Teardown", "Test setup"]),
+            ("tear", ["Teardown", "Test setup"]),
+            ("login", ["Login keyword", "Login to Application"]),
+            ("some check", ["Login keyword"]),
+            ("down", []),
+        ]
+        for pattern, expected in test_data:
+            with self.subTest(pattern=pattern, expected=expected):
+                self.assertEqual(self.names(pattern), expected)
+
+    def test_should_search_keywords_by_name_only(self) -> None:
+        self.assertEqual(self.names("teardown", use_doc=False), ["Teardown"])
+        self.assertEqual(self.names("environment", use_doc=False), [])
+
+    def test_should_search_keywords_by_tags(self) -> None:
+        test_data = [
+            ("tag_2", ["Login keyword", "Teardown"]),
+            ("tag_", ["Login keyword", "Teardown", "Test setup"]),
+            ("tag_23", []),
+        ]
+        for pattern, expected in test_data:
+            with self.subTest(pattern=pattern, expected=expected):
+                self.assertEqual(
+                    self.names(pattern, use_doc=False, use_tags=True), expected
+                )
+
+    def test_should_search_keywords_in_collection(self) -> None:
+        test_data = [
+            ("second", ["Login to Application"]),
+            ("collec", ["Login keyword", "Login to Application"]),
+            ("^first*$", ["Login keyword"]),
+            ("third", []),
+        ]
+        for collection, expected in test_data:
+            with self.subTest(collection=collection, expected=expected):
+                self.assertEqual(self.names("login", collection), expected)
+
+    def test_should_not_search_glob_patterns(self) -> None:
+        self.assertIsNone(self.index.search("tear*"))
+
+    def test_like_to_regex_should_follow_glob_to_sql_semantics(self) -> None:
+        test_data = [
+            ("first", "First collection", True),
+            ("^first", "The first", False),
+            ("f?rst", "First", True),
+            ("coll*on$", "First collection", True),
+            ("100%", "100 percent", False),
+        ]
+        for pattern, value, expected in test_data:
+            with self.subTest(pattern=pattern, value=value):
+                self.assertEqual(
+                    like_to_regex(pattern).fullmatch(value) is not None, expected
+                )
+
+    def test_should_rebuild_index_after_committed_keyword_change(self) -> None:
+        index = keyword_search_index.get(db_session)
+        self.assertIs(keyword_search_index.get(db_session), index)
+        self.keywords[2].name = "Cleanup"
+        db_session.commit()
+        index = keyword_search_index.get(db_session)
+        self.assertEqual(
+            [kw.name for kw in index.search("cleanup", use_doc=False)], ["Cleanup"]
+        )
+        db_session.query(Keyword).filter(Keyword.name == "Cleanup").delete()
+        db_session.commit()
+        self.assertEqual(keyword_search_index.get(db_session).search("cleanup"), [])
+
+    def test_should_not_rebuild_index_after_rollback(self) -> None:
+        index = keyword_search_index.get(db_session)
+        self.keywords[2].name = "Cleanup"
+        db_session.flush()
+        db_session.rollback()
+        self.assertIs(keyword_search_index.get(db_session), index)
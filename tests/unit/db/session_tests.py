@@ -0,0 +1,56 @@
+import unittest
+from sqlalchemy.pool import QueuePool
+
+from rfhub2.db.session import create_sqlalchemy_engine, engine, pool_options
+
+
+class SessionTest(unittest.TestCase):
+    def test_should_create_engine_for_given_db_uri(self) -> None:
+        other_engine = create_sqlalchemy_engine("sqlite://")
+        self.assertEqual(str(other_engine.url), "sqlite://")
+        self.assertNotIsInstance(other_engine.pool, QueuePool)
+
+    def test_should_keep_sqlite_file_connections_in_pool(self) -> None:
+        self.assertIsInstance(engine.pool, QueuePool)
+
+    def test_should_tune_connections_of_other_sqlite_engine(self) -> None:
+        other_engine = create_sqlalchemy_engine("sqlite://")
+        with other_engine.connect() as connection:
+            foreign_keys = connection.exec_driver_sql("PRAGMA foreign_keys").scalar()
+        self.assertEqual(foreign_keys, 1)
+
+    def test_should_set_pool_size_only_for_server_databases(self) -> None:
+        self.assertEqual(
+            pool_options("postgresql://localhost/rfhub"),
+            {
+                "pool_pre_ping": True,
+                "pool_recycle": -1,
+                "pool_size": 5,
+                "max_overflow": 10,
+            },
+        )
+        self.assertEqual(
+            pool_options("sqlite:///test.db"),
+            {"pool_pre_ping": True, "pool_recycle": -1},
+        )
+
+    def test_should_tune_sqlite_connection(self) -> None:
+        with engine.connect() as connection:
+            pragmas = {
+                pragma: connection.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+                for pragma in (
+                    "foreign_keys",
+                    "journal_mode",
+                    "synchronous",
+                    "cache_size",
+                )
+            }
+        self.assertEqual(
+            pragmas,
+            {
+                "foreign_keys": 1,
+                "journal_mode": "wal",
+                "synchronous": 1,
+                "cache_size": -65536,
+            },
+        )
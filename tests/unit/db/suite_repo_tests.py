@@ -318,6 +318,16 @@ class SuiteRepositoryTest(BaseRepositoryTest):
             result, [self.model_suite_3, self.model_suite_2, self.model_suite_1]
         )
 
+    def test_should_get_suites_pages_ordered_by_test_count_with_cursor(self) -> None:
+        ordering = [OrderingItem("test_count")]
+        first_page = self.suite_repo.get_all(root_only=True, ordering=ordering, limit=2)
+        last_page = self.suite_repo.get_all(
+            root_only=True, ordering=ordering, limit=2, cursor=first_page.next_cursor
+        )
+        self.assertEqual(first_page, [self.model_suite_3, self.model_suite_2])
+        self.assertEqual(last_page, [self.model_suite_1])
+        self.assertIsNone(last_page.next_cursor)
+
     def test_should_add_nested_suite_hierarchy(self) -> None:
         self.suite_repo.add_hierarchy(self.hierarchy_a)
         suites = self.suite_repo.get_all()
@@ -154,6 +154,19 @@ class TestCaseRepositoryTest(BaseRepositoryTest):
             result, [self.model_tc_1, self.model_tc_3, self.model_tc_5, self.model_tc_4]
         )
 
+    def test_should_get_all_test_cases_pages_with_cursor(self) -> None:
+        ordering = [OrderingItem("line")]
+        first_page = self.tc_repo.get_all(limit=3, ordering=ordering)
+        self.assertEqual(
+            first_page, [self.model_tc_1, self.model_tc_2, self.model_tc_3]
+        )
+        self.assertEqual(first_page.next_cursor, [10, self.tc_3.id])
+        last_page = self.tc_repo.get_all(
+            limit=3, ordering=ordering, cursor=first_page.next_cursor
+        )
+        self.assertEqual(last_page, [self.model_tc_5, self.model_tc_4])
+        self.assertIsNone(last_page.next_cursor)
+
     def test_should_add_test_case(self) -> None:
         result = self.tc_repo.add(self.tc_to_add)
         self.assertEqual(result, self.tc_to_add)
@@ -0,0 +1,25 @@
+import unittest
+
+from rfhub2.db.repository.trigram_search import similarity, trigrams, word_trigrams
+
+
+class TrigramSearchTest(unittest.TestCase):
+    def test_trigrams_should_pad_beginning_of_words(self) -> None:
+        self.assertEqual(trigrams("Log It"), {"  l", " lo", "log", "  i", " it"})
+
+    def test_word_trigrams_should_skip_short_words(self) -> None:
+        self.assertEqual(word_trigrams("Log It"), {"log"})
+
+    def test_similarity_should_be_full_for_prefixes_and_substrings(self) -> None:
+        for pattern in ("should", "shou", "be equal", "Should Be Equal"):
+            with self.subTest(pattern=pattern):
+                self.assertEqual(similarity(pattern, "Should Be Equal"), 1.0)
+
+    def test_similarity_should_tolerate_typos(self) -> None:
+        result = similarity("Shuld Be Equl", "Should Be Equal")
+        self.assertGreater(result, 0.5)
+        self.assertLess(result, 1.0)
+
+    def test_similarity_should_be_low_for_different_values(self) -> None:
+        self.assertLess(similarity("Teardown", "Should Be Equal"), 0.5)
+        self.assertEqual(similarity("", "Should Be Equal"), 0.0)
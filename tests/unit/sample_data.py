@@ -2,6 +2,9 @@ from datetime import datetime, timezone
 from sqlalchemy.orm.session import Session
 
 from rfhub2.db.base import Collection, Keyword, KeywordStatistics
+from rfhub2.db.repository.keyword_statistics_repository import (
+    KeywordStatisticsRepository,
+)
 
 
 def recreate_data(session: Session) -> None:
@@ -80,4 +83,5 @@ def recreate_data(session: Session) -> None:
     ]
     session.add_all(collections)
     session.add_all(statistics)
+    KeywordStatisticsRepository(session).refresh_rollup()
     session.commit()
@@ -0,0 +1,40 @@
+import unittest
+
+from rfhub2.model import CollectionUpdate, KeywordUpdate
+from rfhub2.utils.fingerprint import collection_fingerprint, keywords_fingerprint
+
+
+class FingerprintTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.keywords = [
+            KeywordUpdate(name="Keyword 1", doc="doc", args='["arg"]', tags=["tag"]),
+            KeywordUpdate(name="Keyword 2", tags=None),
+        ]
+        self.resource = CollectionUpdate(name="resource", type="resource", doc="doc")
+
+    def test_keywords_fingerprint_should_not_depend_on_order_or_duplicates(self):
+        self.assertEqual(
+            keywords_fingerprint(self.keywords),
+            keywords_fingerprint(self.keywords[::-1] + self.keywords[:1]),
+        )
+
+    def test_keywords_fingerprint_should_treat_missing_tags_as_empty(self):
+        self.assertEqual(
+            keywords_fingerprint([KeywordUpdate(name="Keyword 2", tags=[])]),
+            keywords_fingerprint([KeywordUpdate(name="Keyword 2", tags=None)]),
+        )
+
+    def test_collection_fingerprint_should_change_with_keyword_content(self):
+        changed = [self.keywords[0].copy(update={"doc": "other"}), self.keywords[1]]
+        self.assertNotEqual(
+            collection_fingerprint(self.resource, self.keywords),
+            collection_fingerprint(self.resource, changed),
+        )
+
+    def test_collection_fingerprint_should_change_with_collection_doc(self):
+        self.assertNotEqual(
+            collection_fingerprint(self.resource, self.keywords),
+            collection_fingerprint(
+                self.resource.copy(update={"doc": "other"}), self.keywords
+            ),
+        )